@@ -582,11 +582,46 @@ def calculate_ny_pm_killzone(
     return None
 
 
+def calculate_daily_reference_levels(
+    hourly_hist: pd.DataFrame,
+    daily_hist: pd.DataFrame,
+    current_time: datetime
+) -> Dict[str, Optional[float]]:
+    """
+    Calculate the reference levels anchored at the start of the day, week or month
+
+    Once available these don't change for the rest of the day, so callers
+    evaluating many times within one day can compute them once and pass them
+    to calculate_all_reference_levels.
+
+    Args:
+        hourly_hist: Hourly OHLC data (for daily/week/month opens)
+        daily_hist: Daily OHLC data (for previous day high/low)
+        current_time: Current time in UTC
+
+    Returns:
+        Dictionary of daily_open, prev_day_high, prev_day_low, prev_week_open,
+        weekly_open and monthly_open
+    """
+    current_time = ensure_utc(current_time)
+    prev_day_high, prev_day_low = calculate_prev_day_high_low(daily_hist)
+
+    return {
+        'daily_open': calculate_daily_open(hourly_hist, current_time),
+        'prev_day_high': prev_day_high,
+        'prev_day_low': prev_day_low,
+        'prev_week_open': calculate_prev_week_open(hourly_hist, current_time),
+        'weekly_open': calculate_weekly_open(hourly_hist, current_time),
+        'monthly_open': calculate_monthly_open(hourly_hist, current_time),
+    }
+
+
 def calculate_all_reference_levels(
     hourly_hist: pd.DataFrame,
     minute_hist: pd.DataFrame,
     daily_hist: pd.DataFrame,
-    current_time: datetime
+    current_time: datetime,
+    daily_levels: Optional[Dict[str, Optional[float]]] = None
 ) -> ReferenceLevels:
     """
     Calculate all reference levels for a ticker
@@ -604,6 +639,8 @@ def calculate_all_reference_levels(
         minute_hist: Minute OHLC data (for precise 30m/15m boundaries)
         daily_hist: Daily OHLC data (for previous day high/low)
         current_time: Current time in UTC
+        daily_levels: Result of calculate_daily_reference_levels for current_time;
+            computed when not given
 
     Returns:
         ReferenceLevels object with all calculated levels
@@ -611,21 +648,24 @@ def calculate_all_reference_levels(
     # Ensure current_time is in UTC
     current_time = ensure_utc(current_time)
 
-    # Calculate previous day high/low
-    prev_day_high, prev_day_low = calculate_prev_day_high_low(daily_hist)
+    # Day, week and month anchored levels (including previous day high/low)
+    if daily_levels is None:
+        daily_levels = calculate_daily_reference_levels(hourly_hist, daily_hist, current_time)
+    prev_day_high = daily_levels['prev_day_high']
+    prev_day_low = daily_levels['prev_day_low']
 
     # Calculate all reference levels (18-level system)
     return ReferenceLevels(
         # Existing 11 reference levels (backward compatible)
-        daily_open=calculate_daily_open(hourly_hist, current_time),
+        daily_open=daily_levels['daily_open'],
         hourly_open=calculate_hourly_open(hourly_hist, current_time),
         four_hourly_open=calculate_4hourly_open(hourly_hist, current_time),
         prev_day_high=prev_day_high,
         prev_day_low=prev_day_low,
-        prev_week_open=calculate_prev_week_open(hourly_hist, current_time),
+        prev_week_open=daily_levels['prev_week_open'],
         thirty_min_open=calculate_30min_open(minute_hist, current_time),
-        weekly_open=calculate_weekly_open(hourly_hist, current_time),
-        monthly_open=calculate_monthly_open(hourly_hist, current_time),
+        weekly_open=daily_levels['weekly_open'],
+        monthly_open=daily_levels['monthly_open'],
         seven_am_open=calculate_7am_open(hourly_hist, current_time),
         eight_thirty_am_open=calculate_830am_open(hourly_hist, minute_hist, current_time),
         # NEW: 7 additional reference levels (including NY PM Kill Zone)
@@ -77,9 +77,23 @@ class SchedulerConfig:
         os.getenv('DATABASE_URL', '')  # Fallback to DATABASE_URL if available
     )
 
+    # Connection pool for the job store; kept small so the scheduler stays well
+    # under the Supabase connection limit
+    JOB_STORE_POOL_SIZE: int = int(os.getenv('SCHEDULER_JOB_STORE_POOL_SIZE', '3'))
+    JOB_STORE_MAX_OVERFLOW: int = int(os.getenv('SCHEDULER_JOB_STORE_MAX_OVERFLOW', '2'))
+    JOB_STORE_POOL_TIMEOUT: int = int(os.getenv('SCHEDULER_JOB_STORE_POOL_TIMEOUT', '30'))
+    # Recycle connections before the pooler closes idle ones (seconds)
+    JOB_STORE_POOL_RECYCLE: int = int(os.getenv('SCHEDULER_JOB_STORE_POOL_RECYCLE', '1800'))
+
     # Job execution tracking settings
     TRACK_JOB_EXECUTION: bool = os.getenv('TRACK_JOB_EXECUTION', 'true').lower() == 'true'
     TRACK_EXECUTION_HISTORY: bool = os.getenv('TRACK_EXECUTION_HISTORY', 'true').lower() == 'true'
+    # Write a RUNNING row when a job starts and update it on completion;
+    # when disabled only the terminal state is written (one insert per run)
+    TRACK_IN_PROGRESS: bool = os.getenv('TRACK_IN_PROGRESS', 'false').lower() == 'true'
+
+    # How often in-memory job metrics are flushed to the database (seconds)
+    METRICS_FLUSH_INTERVAL_SECONDS: int = int(os.getenv('JOB_METRICS_FLUSH_INTERVAL_SECONDS', '30'))
 
     # ========================================================================
     # Retry Settings
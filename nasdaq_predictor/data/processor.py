@@ -3,7 +3,7 @@ Data processing utilities for filtering and transforming market data
 """
 import pandas as pd
 from typing import Dict
-from ..utils.market_status import is_within_trading_session
+from ..utils.market_status import is_within_trading_session_batch
 
 
 def filter_trading_session_data(hist: pd.DataFrame, ticker_symbol: str, trading_sessions: Dict) -> pd.DataFrame:
@@ -22,7 +22,7 @@ def filter_trading_session_data(hist: pd.DataFrame, ticker_symbol: str, trading_
         return hist
 
     # Apply trading session filter
-    mask = hist.index.map(lambda x: is_within_trading_session(x, ticker_symbol, trading_sessions))
+    mask = is_within_trading_session_batch(hist.index, ticker_symbol, trading_sessions)
     filtered_hist = hist[mask]
 
     return filtered_hist
@@ -0,0 +1,45 @@
+-- Migration: Add Prediction Accuracy Stats Function
+-- Description: Aggregates prediction accuracy counts in the database so accuracy
+--              metrics don't require downloading every prediction in the period
+-- Date: 2026-10-17
+-- Author: NQP System
+
+CREATE OR REPLACE FUNCTION get_prediction_accuracy_stats(
+    p_ticker_id UUID,
+    p_since TIMESTAMPTZ
+)
+RETURNS TABLE (
+    total_predictions BIGINT,
+    bullish_predictions BIGINT,
+    bearish_predictions BIGINT,
+    neutral_predictions BIGINT,
+    avg_confidence NUMERIC,
+    verified_predictions BIGINT,
+    correct_predictions BIGINT,
+    bullish_verified BIGINT,
+    bullish_correct BIGINT,
+    bearish_verified BIGINT,
+    bearish_correct BIGINT,
+    neutral_verified BIGINT,
+    neutral_correct BIGINT
+) AS $$
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE prediction = 'BULLISH'),
+        COUNT(*) FILTER (WHERE prediction = 'BEARISH'),
+        COUNT(*) FILTER (WHERE prediction = 'NEUTRAL'),
+        COALESCE(AVG(confidence), 0),
+        COUNT(*) FILTER (WHERE actual_result IS NOT NULL),
+        COUNT(*) FILTER (WHERE actual_result = 'CORRECT'),
+        COUNT(*) FILTER (WHERE prediction = 'BULLISH' AND actual_result IS NOT NULL),
+        COUNT(*) FILTER (WHERE prediction = 'BULLISH' AND actual_result = 'CORRECT'),
+        COUNT(*) FILTER (WHERE prediction = 'BEARISH' AND actual_result IS NOT NULL),
+        COUNT(*) FILTER (WHERE prediction = 'BEARISH' AND actual_result = 'CORRECT'),
+        COUNT(*) FILTER (WHERE prediction = 'NEUTRAL' AND actual_result IS NOT NULL),
+        COUNT(*) FILTER (WHERE prediction = 'NEUTRAL' AND actual_result = 'CORRECT')
+    FROM predictions
+    WHERE ticker_id = p_ticker_id
+      AND timestamp >= p_since;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_prediction_accuracy_stats(UUID, TIMESTAMPTZ) IS 'Prediction, verification and correctness counts per direction for a ticker since a given time (uses idx_predictions_ticker_timestamp)';
@@ -153,19 +153,10 @@ class PredictionRepository:
             from datetime import timedelta
             cutoff_time = datetime.utcnow() - timedelta(days=days)
 
-            # Get predictions from the specified period
-            response = (
-                self.client.table(self.predictions_table)
-                .select('*')
-                .eq('ticker_id', ticker_id)
-                .gte('timestamp', cutoff_time.isoformat())
-                .order('timestamp', desc=False)
-                .execute()
-            )
-
-            predictions = [Prediction.from_dict(row) for row in response.data] if response.data else []
+            stats = self._get_accuracy_stats(ticker_id, cutoff_time)
+            total = stats['total_predictions']
 
-            if not predictions:
+            if not total:
                 return {
                     'total_predictions': 0,
                     'accuracy_rate': 0.0,
@@ -176,55 +167,27 @@ class PredictionRepository:
                     'period_days': days
                 }
 
-            # Calculate statistics
-            total = len(predictions)
-            bullish_count = sum(1 for p in predictions if p.prediction == 'BULLISH')
-            bearish_count = sum(1 for p in predictions if p.prediction == 'BEARISH')
-            neutral_count = sum(1 for p in predictions if p.prediction == 'NEUTRAL')
-            avg_confidence = sum(p.confidence for p in predictions) / total
-
-            # Calculate accuracy from verified predictions
-            verified_predictions = [p for p in predictions if p.actual_result is not None]
+            def rate(correct: int, verified: int) -> float:
+                return correct / verified * 100 if verified else 0.0
 
-            if verified_predictions:
-                correct_count = sum(1 for p in verified_predictions if p.actual_result == 'CORRECT')
-                accuracy_rate = (correct_count / len(verified_predictions)) * 100
-
-                # Calculate accuracy by prediction type
-                bullish_verified = [p for p in verified_predictions if p.prediction == 'BULLISH']
-                bearish_verified = [p for p in verified_predictions if p.prediction == 'BEARISH']
-                neutral_verified = [p for p in verified_predictions if p.prediction == 'NEUTRAL']
-
-                bullish_accuracy = (
-                    sum(1 for p in bullish_verified if p.actual_result == 'CORRECT') / len(bullish_verified) * 100
-                    if bullish_verified else 0.0
-                )
-                bearish_accuracy = (
-                    sum(1 for p in bearish_verified if p.actual_result == 'CORRECT') / len(bearish_verified) * 100
-                    if bearish_verified else 0.0
-                )
-                neutral_accuracy = (
-                    sum(1 for p in neutral_verified if p.actual_result == 'CORRECT') / len(neutral_verified) * 100
-                    if neutral_verified else 0.0
-                )
-            else:
-                accuracy_rate = 0.0
-                bullish_accuracy = 0.0
-                bearish_accuracy = 0.0
-                neutral_accuracy = 0.0
+            verified_count = stats['verified_predictions']
+            accuracy_rate = rate(stats['correct_predictions'], verified_count)
+            bullish_accuracy = rate(stats['bullish_correct'], stats['bullish_verified'])
+            bearish_accuracy = rate(stats['bearish_correct'], stats['bearish_verified'])
+            neutral_accuracy = rate(stats['neutral_correct'], stats['neutral_verified'])
 
             result = {
                 'total_predictions': total,
-                'verified_predictions': len(verified_predictions) if verified_predictions else 0,
-                'pending_verification': total - (len(verified_predictions) if verified_predictions else 0),
+                'verified_predictions': verified_count,
+                'pending_verification': total - verified_count,
                 'accuracy_rate': round(accuracy_rate, 2),
-                'bullish_predictions': bullish_count,
-                'bearish_predictions': bearish_count,
-                'neutral_predictions': neutral_count,
+                'bullish_predictions': stats['bullish_predictions'],
+                'bearish_predictions': stats['bearish_predictions'],
+                'neutral_predictions': stats['neutral_predictions'],
                 'bullish_accuracy': round(bullish_accuracy, 2),
                 'bearish_accuracy': round(bearish_accuracy, 2),
                 'neutral_accuracy': round(neutral_accuracy, 2),
-                'avg_confidence': round(avg_confidence, 2),
+                'avg_confidence': round(float(stats['avg_confidence']), 2),
                 'period_days': days,
                 'start_date': cutoff_time.isoformat(),
                 'end_date': datetime.utcnow().isoformat()
@@ -238,6 +201,56 @@ class PredictionRepository:
             logger.error(f"Error calculating prediction accuracy: {e}")
             raise
 
+    def _get_accuracy_stats(self, ticker_id: str, cutoff_time: datetime) -> dict:
+        """
+        Count predictions since cutoff_time, in total and verified/correct per direction.
+
+        Uses the get_prediction_accuracy_stats database function (migration 008) so
+        only one aggregate row is transferred; falls back to counting the rows
+        client-side where the function isn't deployed.
+        """
+        try:
+            response = self.client.rpc(
+                'get_prediction_accuracy_stats',
+                {'p_ticker_id': ticker_id, 'p_since': cutoff_time.isoformat()}
+            ).execute()
+            if response.data:
+                return response.data[0]
+        except Exception as e:
+            logger.warning(f"Accuracy stats function unavailable, counting client-side: {e}")
+
+        response = (
+            self.client.table(self.predictions_table)
+            .select('prediction,confidence,actual_result')
+            .eq('ticker_id', ticker_id)
+            .gte('timestamp', cutoff_time.isoformat())
+            .execute()
+        )
+        rows = response.data or []
+
+        stats = {
+            'total_predictions': len(rows),
+            'avg_confidence': sum(float(row['confidence']) for row in rows) / len(rows) if rows else 0.0,
+            'verified_predictions': 0,
+            'correct_predictions': 0,
+        }
+        for direction in ('bullish', 'bearish', 'neutral'):
+            stats[f'{direction}_predictions'] = 0
+            stats[f'{direction}_verified'] = 0
+            stats[f'{direction}_correct'] = 0
+
+        for row in rows:
+            direction = row['prediction'].lower()
+            stats[f'{direction}_predictions'] += 1
+            if row['actual_result'] is not None:
+                stats['verified_predictions'] += 1
+                stats[f'{direction}_verified'] += 1
+                if row['actual_result'] == 'CORRECT':
+                    stats['correct_predictions'] += 1
+                    stats[f'{direction}_correct'] += 1
+
+        return stats
+
     def get_signals_by_prediction(
         self,
         prediction_id: str
@@ -74,6 +74,65 @@ class SchedulerJobExecutionRepository:
             logger.error(f"Error storing job execution: {e}")
             return False
 
+    def store_job_executions_bulk(self, executions: List[JobExecution]) -> bool:
+        """
+        Store multiple job execution records in a single insert.
+
+        Args:
+            executions: List of JobExecution objects to store
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not executions:
+            return True
+
+        try:
+            response = self.client.table(self.executions_table).insert(
+                [execution.to_dict() for execution in executions]
+            ).execute()
+
+            if response.data:
+                logger.info(f"Stored {len(executions)} job execution records")
+                return True
+            else:
+                logger.error(f"Failed to store {len(executions)} job execution records")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error storing job executions in bulk: {e}")
+            return False
+
+    def update_job_execution(self, execution_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Update fields of an existing job execution record.
+
+        Args:
+            execution_id: Execution record ID (UUID)
+            updates: Column values to set (already serialized)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            response = (
+                self.client.table(self.executions_table)
+                .update(updates)
+                .eq('id', execution_id)
+                .execute()
+            )
+
+            if response.data:
+                logger.info(f"Updated job execution {execution_id}")
+                return True
+            else:
+                logger.error(f"Failed to update job execution {execution_id}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error updating job execution {execution_id}: {e}")
+            return False
+
     def get_job_execution(self, execution_id: str) -> Optional[JobExecution]:
         """
         Get a specific job execution record.
@@ -139,6 +198,36 @@ class SchedulerJobExecutionRepository:
             logger.error(f"Error retrieving executions for job {job_id}: {e}")
             return []
 
+    def get_last_successful_execution_time(self, job_id: str) -> Optional[datetime]:
+        """
+        Get the start time of the most recent successful execution of a job.
+
+        Args:
+            job_id: APScheduler job ID
+
+        Returns:
+            Start time of the last successful execution, or None if there is none
+        """
+        try:
+            response = (
+                self.client.table(self.executions_table)
+                .select('started_at')
+                .eq('job_id', job_id)
+                .eq('status', 'SUCCESS')
+                .order('started_at', desc=True)
+                .limit(1)
+                .execute()
+            )
+
+            if not response.data or not response.data[0].get('started_at'):
+                return None
+
+            return datetime.fromisoformat(response.data[0]['started_at'])
+
+        except Exception as e:
+            logger.error(f"Error retrieving last successful execution for job {job_id}: {e}")
+            return None
+
     def get_recent_executions(
         self,
         hours: int = 24,
@@ -270,6 +359,36 @@ class SchedulerJobExecutionRepository:
             logger.error(f"Error storing job metrics: {e}")
             return False
 
+    def upsert_job_metrics_bulk(self, metrics_list: List[JobMetrics]) -> bool:
+        """
+        Insert or update metrics for several jobs in a single request.
+
+        Args:
+            metrics_list: JobMetrics objects to store (one per job)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not metrics_list:
+            return True
+
+        try:
+            response = self.client.table(self.metrics_table).upsert(
+                [metrics.to_dict() for metrics in metrics_list],
+                on_conflict='job_id'
+            ).execute()
+
+            if response.data:
+                logger.info(f"Stored job metrics for {len(metrics_list)} jobs")
+                return True
+            else:
+                logger.error(f"Failed to store job metrics for {len(metrics_list)} jobs")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error storing job metrics in bulk: {e}")
+            return False
+
     def get_job_metrics(self, job_id: str) -> Optional[JobMetrics]:
         """
         Get metrics for a specific job.
@@ -454,6 +573,41 @@ class SchedulerJobExecutionRepository:
             logger.error(f"Error retrieving active alerts: {e}")
             return []
 
+    def get_active_alerts_for_jobs(self, job_ids: List[str]) -> Dict[str, List[FailedJobAlert]]:
+        """
+        Get unacknowledged (active) job failure alerts for several jobs.
+
+        Args:
+            job_ids: APScheduler job IDs
+
+        Returns:
+            Dict mapping job_id to its active alerts (jobs without alerts are absent)
+        """
+        if not job_ids:
+            return {}
+
+        try:
+            response = (
+                self.client.table(self.alerts_table)
+                .select('*')
+                .eq('acknowledged', False)
+                .in_('job_id', job_ids)
+                .order('failure_timestamp', desc=True)
+                .execute()
+            )
+
+            alerts: Dict[str, List[FailedJobAlert]] = {}
+            for row in response.data or []:
+                alert = FailedJobAlert.from_dict(row)
+                alerts.setdefault(alert.job_id, []).append(alert)
+
+            logger.debug(f"Retrieved active alerts for {len(alerts)} jobs")
+            return alerts
+
+        except Exception as e:
+            logger.error(f"Error retrieving active alerts: {e}")
+            return {}
+
     def acknowledge_alert(self, alert_id: str) -> bool:
         """
         Mark a job alert as acknowledged.
@@ -566,36 +720,87 @@ class SchedulerJobExecutionRepository:
                 .execute()
             )
 
-            if not response.data:
-                return {
-                    'job_id': job_id,
-                    'total': 0,
-                    'successful': 0,
-                    'failed': 0,
-                    'skipped': 0,
-                    'success_rate': 0.0,
-                    'avg_duration': 0.0
-                }
-
-            total = len(response.data)
-            successful = sum(1 for r in response.data if r['status'] == 'SUCCESS')
-            failed = sum(1 for r in response.data if r['status'] == 'FAILURE')
-            skipped = sum(1 for r in response.data if r['status'] == 'SKIPPED')
-
-            durations = [r['duration_seconds'] for r in response.data if r['duration_seconds']]
-            avg_duration = sum(durations) / len(durations) if durations else 0.0
+            return self._summarize_executions(job_id, response.data or [], hours)
+
+        except Exception as e:
+            logger.error(f"Error calculating execution statistics for {job_id}: {e}")
+            return {}
+
+    def get_execution_statistics_for_jobs(
+        self,
+        job_ids: List[str],
+        hours: int = 24
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get execution statistics for several jobs over a time period.
+
+        Args:
+            job_ids: APScheduler job IDs
+            hours: Time period in hours
+
+        Returns:
+            Dict mapping job_id to the statistics returned by get_execution_statistics
+        """
+        if not job_ids:
+            return {}
+
+        try:
+            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+
+            response = (
+                self.client.table(self.executions_table)
+                .select('job_id,status,duration_seconds')
+                .in_('job_id', job_ids)
+                .gte('created_at', cutoff_time.isoformat())
+                .execute()
+            )
+
+            rows_by_job: Dict[str, List[Dict[str, Any]]] = {job_id: [] for job_id in job_ids}
+            for row in response.data or []:
+                rows_by_job.setdefault(row['job_id'], []).append(row)
 
             return {
-                'job_id': job_id,
-                'time_period_hours': hours,
-                'total': total,
-                'successful': successful,
-                'failed': failed,
-                'skipped': skipped,
-                'success_rate': (successful / total * 100) if total > 0 else 0.0,
-                'avg_duration': avg_duration
+                job_id: self._summarize_executions(job_id, rows, hours)
+                for job_id, rows in rows_by_job.items()
             }
 
         except Exception as e:
-            logger.error(f"Error calculating execution statistics for {job_id}: {e}")
+            logger.error(f"Error calculating execution statistics: {e}")
             return {}
+
+    @staticmethod
+    def _summarize_executions(
+        job_id: str,
+        rows: List[Dict[str, Any]],
+        hours: int
+    ) -> Dict[str, Any]:
+        """Summarize execution rows (status, duration_seconds) into statistics."""
+        if not rows:
+            return {
+                'job_id': job_id,
+                'total': 0,
+                'successful': 0,
+                'failed': 0,
+                'skipped': 0,
+                'success_rate': 0.0,
+                'avg_duration': 0.0
+            }
+
+        total = len(rows)
+        successful = sum(1 for r in rows if r['status'] == 'SUCCESS')
+        failed = sum(1 for r in rows if r['status'] == 'FAILURE')
+        skipped = sum(1 for r in rows if r['status'] == 'SKIPPED')
+
+        durations = [r['duration_seconds'] for r in rows if r['duration_seconds']]
+        avg_duration = sum(durations) / len(durations) if durations else 0.0
+
+        return {
+            'job_id': job_id,
+            'time_period_hours': hours,
+            'total': total,
+            'successful': successful,
+            'failed': failed,
+            'skipped': skipped,
+            'success_rate': (successful / total * 100) if total > 0 else 0.0,
+            'avg_duration': avg_duration
+        }
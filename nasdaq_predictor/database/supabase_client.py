@@ -13,6 +13,7 @@ Usage:
 
 import os
 import logging
+import threading
 from typing import Optional
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -188,6 +189,20 @@ class SupabaseClient:
 
 # Global singleton instance
 _supabase_client_instance: Optional[SupabaseClient] = None
+_supabase_client_lock = threading.Lock()
+
+
+def _get_instance() -> SupabaseClient:
+    """Return the global SupabaseClient, creating it on first use."""
+    global _supabase_client_instance
+
+    if _supabase_client_instance is None:
+        # Threads starting up together must not each build and connect a client
+        with _supabase_client_lock:
+            if _supabase_client_instance is None:
+                _supabase_client_instance = SupabaseClient()
+
+    return _supabase_client_instance
 
 
 def get_supabase_client() -> Client:
@@ -204,12 +219,7 @@ def get_supabase_client() -> Client:
         >>> client = get_supabase_client()
         >>> response = client.table('tickers').select('*').execute()
     """
-    global _supabase_client_instance
-
-    if _supabase_client_instance is None:
-        _supabase_client_instance = SupabaseClient()
-
-    return _supabase_client_instance.get_client()
+    return _get_instance().get_client()
 
 
 def test_connection() -> bool:
@@ -223,12 +233,7 @@ def test_connection() -> bool:
         >>> if test_connection():
         ...     print("Connected to Supabase!")
     """
-    global _supabase_client_instance
-
-    if _supabase_client_instance is None:
-        _supabase_client_instance = SupabaseClient()
-
-    return _supabase_client_instance.test_connection()
+    return _get_instance().test_connection()
 
 
 def close_connection() -> None:
@@ -240,9 +245,10 @@ def close_connection() -> None:
     """
     global _supabase_client_instance
 
-    if _supabase_client_instance is not None:
-        _supabase_client_instance.close_connection()
-        _supabase_client_instance = None
+    with _supabase_client_lock:
+        if _supabase_client_instance is not None:
+            _supabase_client_instance.close_connection()
+            _supabase_client_instance = None
 
 
 def reconnect() -> None:
@@ -254,7 +260,8 @@ def reconnect() -> None:
     """
     global _supabase_client_instance
 
-    if _supabase_client_instance is None:
-        _supabase_client_instance = SupabaseClient()
-    else:
-        _supabase_client_instance.reconnect()
+    with _supabase_client_lock:
+        if _supabase_client_instance is None:
+            _supabase_client_instance = SupabaseClient()
+        else:
+            _supabase_client_instance.reconnect()
@@ -189,7 +189,7 @@ class Volatility:
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketStatus:
     """Market status information"""
     status: str  # 'OPEN', 'CLOSED', 'PRE-MARKET', 'AFTER-HOURS', 'UNKNOWN'
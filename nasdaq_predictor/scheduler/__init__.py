@@ -52,7 +52,13 @@ def create_scheduler() -> BackgroundScheduler:
             jobstores = {
                 'default': SQLAlchemyJobStore(
                     url=SchedulerConfig.SUPABASE_DB_URL,
-                    engine_options={'pool_pre_ping': True}  # Test connection before use
+                    engine_options={
+                        'pool_pre_ping': True,  # Test connection before use
+                        'pool_size': SchedulerConfig.JOB_STORE_POOL_SIZE,
+                        'max_overflow': SchedulerConfig.JOB_STORE_MAX_OVERFLOW,
+                        'pool_timeout': SchedulerConfig.JOB_STORE_POOL_TIMEOUT,
+                        'pool_recycle': SchedulerConfig.JOB_STORE_POOL_RECYCLE
+                    }
                 )
             }
             logger.info(
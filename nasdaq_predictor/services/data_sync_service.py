@@ -8,7 +8,8 @@ calculation of predictions, and storage in Supabase.
 import logging
 import pandas as pd
 import pytz
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any
 from datetime import datetime, timedelta
 
 from ..data.fetcher import YahooFinanceDataFetcher
@@ -35,6 +36,10 @@ class DataSyncService:
     Implements full dependency injection for all repository and data fetcher dependencies.
     """
 
+    # Tickers are processed concurrently, bounded so Yahoo Finance isn't sent
+    # every ticker's requests at once
+    MAX_TICKER_WORKERS = 4
+
     def __init__(
         self,
         fetcher: YahooFinanceDataFetcher,
@@ -58,6 +63,11 @@ class DataSyncService:
         self.prediction_repo = prediction_repo
         self.ref_levels_repo = ref_levels_repo
 
+    def _map_tickers(self, func: Callable[[Any], Dict[str, Any]], tickers: List[Any]) -> List[Dict[str, Any]]:
+        """Apply func to every ticker concurrently, returning results in ticker order."""
+        with ThreadPoolExecutor(max_workers=min(self.MAX_TICKER_WORKERS, len(tickers))) as executor:
+            return list(executor.map(func, tickers))
+
     def sync_all_tickers(self) -> Dict[str, Any]:
         """
         Sync market data for all enabled tickers.
@@ -77,29 +87,9 @@ class DataSyncService:
             'success': True,
             'timestamp': datetime.utcnow().isoformat(),
             'total_tickers': len(tickers),
-            'tickers': []
+            'tickers': self._map_tickers(self._sync_ticker_result, tickers)
         }
 
-        for ticker in tickers:
-            try:
-                # Use ticker.id (UUID) as primary key for market data
-                # and symbol for human-readable reference
-                ticker_result = self.sync_ticker_data(ticker.id, ticker.symbol)
-                results['tickers'].append({
-                    'symbol': ticker.symbol,
-                    'success': True,
-                    'records_stored': ticker_result.get('records_stored', 0)
-                })
-                logger.info(f"Successfully synced {ticker.symbol}")
-
-            except Exception as e:
-                logger.error(f"Error syncing {ticker.symbol}: {e}")
-                results['tickers'].append({
-                    'symbol': ticker.symbol,
-                    'success': False,
-                    'error': str(e)
-                })
-
         successful = sum(1 for t in results['tickers'] if t['success'])
         results['successful'] = successful
         results['failed'] = len(tickers) - successful
@@ -110,6 +100,27 @@ class DataSyncService:
 
         return results
 
+    def _sync_ticker_result(self, ticker) -> Dict[str, Any]:
+        """Sync one ticker, returning its entry for the sync_all_tickers summary."""
+        try:
+            # Use ticker.id (UUID) as primary key for market data
+            # and symbol for human-readable reference
+            ticker_result = self.sync_ticker_data(ticker.id, ticker.symbol)
+            logger.info(f"Successfully synced {ticker.symbol}")
+            return {
+                'symbol': ticker.symbol,
+                'success': True,
+                'records_stored': ticker_result.get('records_stored', 0)
+            }
+
+        except Exception as e:
+            logger.error(f"Error syncing {ticker.symbol}: {e}")
+            return {
+                'symbol': ticker.symbol,
+                'success': False,
+                'error': str(e)
+            }
+
     def sync_ticker_data(self, ticker_id: str, symbol: str) -> Dict[str, Any]:
         """
         Sync market data for a specific ticker with retry logic.
@@ -269,27 +280,9 @@ class DataSyncService:
             'success': True,
             'timestamp': datetime.utcnow().isoformat(),
             'total_tickers': len(tickers),
-            'predictions': []
+            'predictions': self._map_tickers(self._prediction_result, tickers)
         }
 
-        for ticker in tickers:
-            try:
-                prediction = self.calculate_and_store_prediction(ticker.id, ticker.symbol)
-                results['predictions'].append({
-                    'symbol': ticker.symbol,
-                    'success': True,
-                    'prediction': prediction.prediction if prediction else None
-                })
-                logger.info(f"Successfully calculated prediction for {ticker.symbol}")
-
-            except Exception as e:
-                logger.error(f"Error calculating prediction for {ticker.symbol}: {e}")
-                results['predictions'].append({
-                    'symbol': ticker.symbol,
-                    'success': False,
-                    'error': str(e)
-                })
-
         successful = sum(1 for p in results['predictions'] if p['success'])
         results['successful'] = successful
         results['failed'] = len(tickers) - successful
@@ -300,6 +293,25 @@ class DataSyncService:
 
         return results
 
+    def _prediction_result(self, ticker) -> Dict[str, Any]:
+        """Calculate one ticker's prediction, returning its calculate_predictions_for_all entry."""
+        try:
+            prediction = self.calculate_and_store_prediction(ticker.id, ticker.symbol)
+            logger.info(f"Successfully calculated prediction for {ticker.symbol}")
+            return {
+                'symbol': ticker.symbol,
+                'success': True,
+                'prediction': prediction.prediction if prediction else None
+            }
+
+        except Exception as e:
+            logger.error(f"Error calculating prediction for {ticker.symbol}: {e}")
+            return {
+                'symbol': ticker.symbol,
+                'success': False,
+                'error': str(e)
+            }
+
     def calculate_and_store_prediction(
         self, ticker_id: str, symbol: str
     ) -> Prediction:
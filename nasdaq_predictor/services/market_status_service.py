@@ -9,8 +9,9 @@ Handles market open/close detection, next event calculation, and last trading da
 
 import logging
 from datetime import datetime, time, timedelta, date
-from typing import Optional, Tuple, List
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple, List, Dict, Any
+from dataclasses import dataclass, field
 from enum import Enum
 import pytz
 
@@ -89,6 +90,8 @@ class MarketSchedule:
     lunch_break_start: Optional[time] = None  # For markets with lunch breaks
     lunch_break_end: Optional[time] = None
     is_24_7: bool = False  # For crypto markets
+    # Invariant MarketStatusInfo fields for 24/7 markets (built once at init)
+    status_template: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate the market schedule."""
@@ -104,11 +107,19 @@ class MarketStatusService:
     instruments and trading venues worldwide.
     """
 
+    # (ticker, minute) statuses remembered per service instance
+    STATUS_CACHE_SIZE = 1024
+
     def __init__(self):
         """Initialize MarketStatusService with market schedules from config."""
         self.market_config = get_market_config()
         self.schedules = self._convert_config_to_schedules()
         self.timezone_cache = {}
+        # Session boundaries fall on whole minutes, so apart from current_time a
+        # status is the same for every time within a minute
+        self._minute_status_fields = lru_cache(maxsize=self.STATUS_CACHE_SIZE)(
+            self._compute_minute_status_fields
+        )
 
     def _convert_config_to_schedules(self) -> dict:
         """
@@ -157,7 +168,7 @@ class MarketStatusService:
             )
 
             # Create MarketSchedule
-            schedules[ticker] = MarketSchedule(
+            schedule = MarketSchedule(
                 ticker=ticker,
                 instrument_type=instrument_type,
                 timezone=config_schedule.timezone,
@@ -167,9 +178,31 @@ class MarketStatusService:
                 is_24_7=config_schedule.is_24_7
             )
 
+            # 24/7 status only varies by time, so precompute everything else
+            if schedule.is_24_7:
+                schedule.status_template = dict(
+                    status=MarketStatus.OPEN,
+                    is_trading=True,
+                    session_type=SessionType.CONTINUOUS_24_7,
+                    instrument_type=schedule.instrument_type,
+                    next_open=None,
+                    next_close=None,
+                    timezone=schedule.timezone
+                )
+
+            schedules[ticker] = schedule
+
         logger.info(f"Initialized market schedules for {len(schedules)} instruments from config")
         return schedules
 
+    def _get_timezone(self, timezone_name: str):
+        """Return the pytz timezone for a name, cached per service instance."""
+        tz = self.timezone_cache.get(timezone_name)
+        if tz is None:
+            tz = pytz.timezone(timezone_name)
+            self.timezone_cache[timezone_name] = tz
+        return tz
+
     @staticmethod
     def _map_market_type_to_session_type(market_type: MarketType) -> SessionType:
         """Map MarketType to SessionType."""
@@ -222,24 +255,32 @@ class MarketStatusService:
         if at_time.tzinfo is None:
             at_time = pytz.UTC.localize(at_time)
 
-        # Convert to market timezone
-        market_tz = pytz.timezone(schedule.timezone)
-        market_time = at_time.astimezone(market_tz)
-
         # 24/7 markets are always open
         if schedule.is_24_7:
+            market_time = at_time.astimezone(self._get_timezone(schedule.timezone))
             return MarketStatusInfo(
-                status=MarketStatus.OPEN,
-                is_trading=True,
-                session_type=SessionType.CONTINUOUS_24_7,
-                instrument_type=schedule.instrument_type,
+                **schedule.status_template,
                 current_time=at_time,
-                next_open=None,
-                next_close=None,
-                timezone=schedule.timezone,
                 last_trading_date=market_time.date()
             )
 
+        minute = at_time.astimezone(pytz.UTC).replace(second=0, microsecond=0)
+        return MarketStatusInfo(
+            **self._minute_status_fields(ticker, minute),
+            current_time=at_time
+        )
+
+    def _compute_minute_status_fields(self, ticker: str, minute: datetime) -> Dict[str, Any]:
+        """
+        Build the MarketStatusInfo fields other than current_time for a scheduled
+        (not 24/7) ticker during the given UTC minute.
+        """
+        schedule = self.schedules[ticker]
+
+        # Convert to market timezone
+        market_tz = self._get_timezone(schedule.timezone)
+        market_time = minute.astimezone(market_tz)
+
         # Determine if market is currently open
         is_open, current_session = self._is_market_open(market_time, schedule)
 
@@ -254,16 +295,15 @@ class MarketStatusService:
             status = MarketStatus.CLOSED
             is_trading = False
 
-        return MarketStatusInfo(
+        return dict(
             status=status,
             is_trading=is_trading,
             session_type=current_session.session_type if current_session else SessionType.REGULAR,
             instrument_type=schedule.instrument_type,
-            current_time=at_time,
             next_open=next_open,
             next_close=next_close,
             timezone=schedule.timezone,
-            last_trading_date=self.get_last_trading_date(ticker, at_time)
+            last_trading_date=self.get_last_trading_date(ticker, minute)
         )
 
     def _is_market_open(
@@ -301,7 +341,7 @@ class MarketStatusService:
         """
         Calculate next market open and close times.
         """
-        market_tz = pytz.timezone(schedule.timezone)
+        market_tz = self._get_timezone(schedule.timezone)
 
         next_open = None
         next_close = None
@@ -365,7 +405,7 @@ class MarketStatusService:
             at_time = pytz.UTC.localize(at_time)
 
         schedule = self.schedules[ticker]
-        market_tz = pytz.timezone(schedule.timezone)
+        market_tz = self._get_timezone(schedule.timezone)
         market_time = at_time.astimezone(market_tz)
 
         # For 24/7 markets, always return current date
@@ -394,13 +434,28 @@ class MarketStatusService:
         return market_time.date()
 
     def is_market_open(self, ticker: str, at_time: Optional[datetime] = None) -> bool:
-        """Quick check if market is open."""
-        try:
-            status = self.get_market_status(ticker, at_time)
-            return status.is_trading
-        except ValueError:
+        """
+        Quick check if market is open.
+
+        Only evaluates the trading sessions; unlike get_market_status() it does
+        not build a MarketStatusInfo, scan for next open/close events or look up
+        the last trading date.
+        """
+        schedule = self.schedules.get(ticker)
+        if schedule is None:
             return False
 
+        if schedule.is_24_7:
+            return True
+
+        if at_time is None:
+            at_time = datetime.now(pytz.UTC)
+        elif at_time.tzinfo is None:
+            at_time = pytz.UTC.localize(at_time)
+
+        market_time = at_time.astimezone(self._get_timezone(schedule.timezone))
+        return self._is_market_open(market_time, schedule)[0]
+
     def get_next_market_event(
         self,
         ticker: str,
@@ -7,6 +7,7 @@ Implements the core analysis and signal generation logic.
 
 import logging
 import pytz
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from dataclasses import asdict
 
@@ -37,14 +38,20 @@ class PredictionCalculationService:
     5. Formatting response
     """
 
-    def __init__(self, data_fetcher: YahooFinanceDataFetcher):
+    def __init__(self, data_fetcher: YahooFinanceDataFetcher, max_workers: int = 3):
         """
         Initialize PredictionCalculationService.
 
         Args:
             data_fetcher: YahooFinanceDataFetcher for market data
+            max_workers: Number of threads for the independent analysis steps
         """
         self.data_fetcher = data_fetcher
+        # Shared by every calculation so threads are not started per prediction
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='prediction-calc'
+        )
 
     def calculate_fresh_data(self, ticker_symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -86,6 +93,17 @@ class PredictionCalculationService:
         minute_hist = data['minute_hist']
         daily_hist = data['daily_hist']
 
+        # Session ranges (I/O-bound fetch) and market status do not depend
+        # on the reference levels, so start them straight away
+        session_ranges_future = self.executor.submit(
+            get_all_session_ranges,
+            ticker_symbol,
+            current_time,
+            current_price,
+            self.data_fetcher
+        )
+        market_status_future = self.executor.submit(get_market_status, ticker_symbol, current_time)
+
         # Calculate reference levels
         reference_levels = calculate_all_reference_levels(
             hourly_hist,
@@ -94,26 +112,20 @@ class PredictionCalculationService:
             current_time
         )
 
-        # Calculate signals
-        signals = calculate_signals(current_price, reference_levels)
-
-        # Get midnight and NY open
+        # Get midnight open and calculate volatility from the hourly movement
         midnight_open = reference_levels.daily_open
-        ny_open = get_ny_open(hourly_hist, current_time)
-
-        # Get hourly movement for volatility calculation
-        hourly_movement = get_hourly_movement(hourly_hist, current_time, midnight_open)
-
-        # Calculate session ranges
-        session_ranges = get_all_session_ranges(
-            ticker_symbol,
+        volatility_future = self.executor.submit(
+            self._calculate_volatility,
+            hourly_hist,
             current_time,
-            current_price,
-            self.data_fetcher
+            midnight_open
         )
 
-        # Get market status
-        market_status = get_market_status(ticker_symbol, current_time)
+        # Calculate signals
+        signals = calculate_signals(current_price, reference_levels)
+
+        # Get NY open
+        ny_open = get_ny_open(hourly_hist, current_time)
 
         # Calculate intraday predictions
         intraday_predictions = calculate_intraday_predictions(
@@ -127,8 +139,9 @@ class PredictionCalculationService:
             previous_day_predictions=None
         )
 
-        # Calculate volatility
-        volatility = calculate_volatility(hourly_movement)
+        session_ranges = session_ranges_future.result()
+        market_status = market_status_future.result()
+        volatility = volatility_future.result()
 
         # Format timestamps for display
         ny_time = current_time.astimezone(pytz.timezone('US/Eastern'))
@@ -165,6 +178,12 @@ class PredictionCalculationService:
         logger.info(f"Calculated fresh data for {ticker_symbol} from yfinance")
         return result
 
+    @staticmethod
+    def _calculate_volatility(hourly_hist, current_time, midnight_open):
+        """Calculate volatility from today's hourly movement."""
+        hourly_movement = get_hourly_movement(hourly_hist, current_time, midnight_open)
+        return calculate_volatility(hourly_movement)
+
     def _format_reference_levels(self, reference_levels) -> Dict[str, Any]:
         """Format reference levels for response."""
         return {
@@ -5,10 +5,15 @@ This service provides job execution tracking, metrics calculation,
 and failure alert generation for all scheduled jobs.
 """
 
+import atexit
 import logging
 import functools
+import queue
+import re
+import threading
+import time
 import traceback
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from ..database.repositories.scheduler_job_execution_repository import SchedulerJobExecutionRepository
@@ -17,6 +22,271 @@ from ..config.scheduler_config import SchedulerConfig
 
 logger = logging.getLogger(__name__)
 
+# Number of lock stripes guarding per-job in-memory state
+_LOCK_STRIPES = 16
+
+# Tracking flags, resolved once at import (see reload_config)
+_TRACKING_ENABLED = bool(SchedulerConfig.TRACK_JOB_EXECUTION)
+_HISTORY_ENABLED = bool(SchedulerConfig.TRACK_EXECUTION_HISTORY)
+_IN_PROGRESS_ENABLED = bool(SchedulerConfig.TRACK_IN_PROGRESS)
+
+
+def reload_config() -> None:
+    """
+    Re-read the tracking flags from SchedulerConfig.
+
+    Only affects services created afterwards; existing services keep the
+    flags they were created with.
+    """
+    global _TRACKING_ENABLED, _HISTORY_ENABLED, _IN_PROGRESS_ENABLED
+    _TRACKING_ENABLED = bool(SchedulerConfig.TRACK_JOB_EXECUTION)
+    _HISTORY_ENABLED = bool(SchedulerConfig.TRACK_EXECUTION_HISTORY)
+    _IN_PROGRESS_ENABLED = bool(SchedulerConfig.TRACK_IN_PROGRESS)
+
+
+# Error patterns for failure recommendations, in priority order. Each
+# alternative is a lookahead over the whole message, so the first category
+# present anywhere in the message wins regardless of its position.
+_RECOMMENDATION_RE = re.compile(
+    r'(?=.*?(?P<timeout>timeout|timed out))'
+    r'|(?=.*?(?P<connection>connection|network))'
+    r'|(?=.*?(?P<auth>authentication|unauthorized))'
+    r'|(?=.*?(?P<database>database|supabase))'
+    r'|(?=.*?(?P<memory>memory|out of))',
+    re.IGNORECASE | re.DOTALL
+)
+
+_RECOMMENDATIONS = {
+    'timeout': (
+        "Job is timing out. Consider increasing the timeout limit "
+        "in SchedulerConfig or optimizing the job logic."
+    ),
+    'connection': (
+        "Network/connection error detected. Check internet connectivity "
+        "and external service availability (Supabase, YFinance)."
+    ),
+    'auth': (
+        "Authentication/authorization error. Verify API keys and "
+        "credentials in environment variables."
+    ),
+    'database': (
+        "Database error detected. Check Supabase connectivity "
+        "and table schema."
+    ),
+    'memory': (
+        "Memory or resource exhaustion. Consider increasing system "
+        "resources or optimizing job memory usage."
+    ),
+}
+
+
+class _ExecutionWriter:
+    """
+    Background writer for job execution records.
+
+    Records are queued by the tracking wrapper and inserted in batches by a
+    single daemon thread, so database latency stays off the job's thread.
+    """
+
+    def __init__(
+        self,
+        repository: SchedulerJobExecutionRepository,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            repository: Repository used to persist execution records
+            batch_size: Maximum number of records per insert
+            flush_interval: Seconds to wait for more records before flushing
+            max_queue_size: Maximum number of queued records
+        """
+        self.repository = repository
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, execution: JobExecution) -> None:
+        """Queue an execution record for the next batch insert."""
+        self._put(execution, execution.job_name)
+
+    def submit_update(self, execution_id: str, updates: Dict[str, Any]) -> None:
+        """Queue an update of an already queued or stored execution record."""
+        self._put((execution_id, updates), execution_id)
+
+    def _put(self, item: Any, label: str) -> None:
+        """Put an item on the queue, dropping it if the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning("Job execution queue full, dropping record for %s", label)
+
+    def flush(self) -> None:
+        """Write all queued records synchronously."""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _ensure_started(self) -> None:
+        """Start the consumer thread on first use."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='job-execution-writer',
+                    daemon=True
+                )
+                self._thread.start()
+
+    def _drain(self, block: bool) -> List[Any]:
+        """Take up to batch_size records off the queue."""
+        batch = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch: List[Any]) -> None:
+        """
+        Persist a batch of queued items in order.
+
+        Consecutive inserts are combined into one bulk insert; pending inserts
+        are flushed before an update so it always finds its row.
+        """
+        with self._write_lock:
+            inserts: List[JobExecution] = []
+            try:
+                for item in batch:
+                    if isinstance(item, JobExecution):
+                        inserts.append(item)
+                        continue
+                    if inserts:
+                        self.repository.store_job_executions_bulk(inserts)
+                        inserts = []
+                    execution_id, updates = item
+                    self.repository.update_job_execution(execution_id, updates)
+                if inserts:
+                    self.repository.store_job_executions_bulk(inserts)
+            except Exception as e:
+                logger.error("Error writing %s job execution records: %s", len(batch), e)
+
+    def _run(self) -> None:
+        """Consumer loop: batch queued records into bulk inserts."""
+        while True:
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+
+
+class _JobMetricsAgg:
+    """
+    In-memory running aggregate of a job's execution metrics.
+
+    Mutated on every execution and periodically flushed to the metrics
+    table, replacing the per-execution read + write of the metrics row.
+    """
+
+    def __init__(self, job_id: str, job_name: str, metrics: Optional[JobMetrics] = None):
+        """
+        Initialize the aggregate, seeded from stored metrics if available.
+
+        Args:
+            job_id: APScheduler job ID
+            job_name: Human-readable job name
+            metrics: Previously stored JobMetrics for this job (optional)
+        """
+        self.job_id = job_id
+        self.job_name = job_name
+        self.total_executions = metrics.total_executions if metrics else 0
+        self.successful_executions = metrics.successful_executions if metrics else 0
+        self.failed_executions = metrics.failed_executions if metrics else 0
+        self.skipped_executions = metrics.skipped_executions if metrics else 0
+        self.avg_duration_seconds = metrics.avg_duration_seconds if metrics else 0.0
+        self.duration_count = metrics.total_executions if metrics else 0
+        self.min_duration_seconds = metrics.min_duration_seconds if metrics else None
+        self.max_duration_seconds = metrics.max_duration_seconds if metrics else None
+        self.last_execution_status = metrics.last_execution_status if metrics else None
+        self.last_execution_at = metrics.last_execution_at if metrics else None
+        self.last_error_message = metrics.last_error_message if metrics else None
+        # Start time of the last successful run; only known once a success
+        # has been seen (or looked up) by this process
+        self.last_success_at: Optional[datetime] = None
+        self.last_success_known = False
+        self.dirty = False
+
+    def record(
+        self,
+        status: str,
+        duration_seconds: float,
+        executed_at: datetime,
+        error_message: Optional[str] = None,
+        started_at: Optional[datetime] = None
+    ) -> None:
+        """Fold one execution into the aggregate."""
+        self.total_executions += 1
+        self.last_execution_status = status
+        self.last_execution_at = executed_at
+
+        if status == 'SUCCESS':
+            self.successful_executions += 1
+            self.last_success_at = started_at or executed_at
+            self.last_success_known = True
+        elif status == 'FAILURE':
+            self.failed_executions += 1
+            self.last_error_message = error_message
+        elif status == 'SKIPPED':
+            self.skipped_executions += 1
+
+        if duration_seconds > 0:
+            # Incremental mean, no need to keep individual durations
+            self.duration_count += 1
+            self.avg_duration_seconds += (
+                (duration_seconds - self.avg_duration_seconds) / self.duration_count
+            )
+            if self.min_duration_seconds is None or duration_seconds < self.min_duration_seconds:
+                self.min_duration_seconds = duration_seconds
+            if self.max_duration_seconds is None or duration_seconds > self.max_duration_seconds:
+                self.max_duration_seconds = duration_seconds
+
+        self.dirty = True
+
+    def to_metrics(self) -> JobMetrics:
+        """Build a JobMetrics snapshot of the aggregate."""
+        success_rate = 0.0
+        if self.total_executions > 0:
+            success_rate = (self.successful_executions / self.total_executions) * 100
+
+        return JobMetrics(
+            job_id=self.job_id,
+            job_name=self.job_name,
+            total_executions=self.total_executions,
+            successful_executions=self.successful_executions,
+            failed_executions=self.failed_executions,
+            skipped_executions=self.skipped_executions,
+            avg_duration_seconds=self.avg_duration_seconds,
+            min_duration_seconds=self.min_duration_seconds,
+            max_duration_seconds=self.max_duration_seconds,
+            success_rate=success_rate,
+            last_execution_status=self.last_execution_status,
+            last_execution_at=self.last_execution_at,
+            last_error_message=self.last_error_message
+        )
+
 
 class SchedulerJobTrackingService:
     """
@@ -29,8 +299,28 @@ class SchedulerJobTrackingService:
     def __init__(self):
         """Initialize the SchedulerJobTrackingService."""
         self.repository = SchedulerJobExecutionRepository()
-        self.tracking_enabled = SchedulerConfig.TRACK_JOB_EXECUTION
-        self.history_enabled = SchedulerConfig.TRACK_EXECUTION_HISTORY
+        self.tracking_enabled = _TRACKING_ENABLED
+        self.history_enabled = _HISTORY_ENABLED
+        self.in_progress_enabled = _IN_PROGRESS_ENABLED
+        self._writer = _ExecutionWriter(self.repository)
+
+        # Per-job state is guarded by striped locks so that unrelated jobs
+        # never contend; only concurrent runs of the same job serialize
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+        # In-memory metrics, flushed to the database by a background thread
+        self._metrics_cache: Dict[str, _JobMetricsAgg] = {}
+        self._metrics_flush_interval = SchedulerConfig.METRICS_FLUSH_INTERVAL_SECONDS
+        self._metrics_flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+
+        # Consecutive failures per job, seeded from history on first use
+        self._consec_failures: Dict[str, int] = {}
+
+        if self.history_enabled:
+            atexit.register(self._writer.flush)
+        if self.tracking_enabled:
+            atexit.register(self.flush_metrics)
 
     def track_job_execution(self, job_id: str, job_name: str):
         """
@@ -60,29 +350,30 @@ class SchedulerJobTrackingService:
                     # If tracking is disabled, just run the job
                     return func(*args, **kwargs)
 
-                execution_id = None
+                history_enabled = self.history_enabled
                 started_at = datetime.utcnow()
+                start_clock = time.monotonic()
 
-                try:
-                    # Create job execution record
-                    execution = JobExecution(
-                        job_id=job_id,
-                        job_name=job_name,
-                        status='RUNNING',
-                        started_at=started_at
-                    )
+                # Single execution record per run; the RUNNING row is only
+                # written up-front when in-progress tracking is enabled
+                execution = JobExecution(
+                    job_id=job_id,
+                    job_name=job_name,
+                    status='RUNNING',
+                    started_at=started_at
+                )
 
-                    if self.history_enabled:
-                        self.repository.store_job_execution(execution)
-                        execution_id = execution.id
+                if history_enabled and self.in_progress_enabled:
+                    self._writer.submit(execution)
 
+                try:
                     # Execute the job function
-                    logger.info(f"Starting job: {job_name}")
+                    logger.info("Starting job: %s", job_name)
                     result = func(*args, **kwargs)
 
                     # Calculate execution details
                     completed_at = datetime.utcnow()
-                    duration_seconds = (completed_at - started_at).total_seconds()
+                    duration_seconds = time.monotonic() - start_clock
 
                     # Get records processed from result if available
                     records_processed = 0
@@ -92,23 +383,19 @@ class SchedulerJobTrackingService:
                         records_processed = result.get('records_processed', 0)
                         records_failed = result.get('records_failed', 0)
 
-                    # Update execution record with success
-                    if self.history_enabled:
-                        success_execution = JobExecution(
-                            job_id=job_id,
-                            job_name=job_name,
+                    # Record success
+                    if history_enabled:
+                        self._complete_execution(
+                            execution,
                             status='SUCCESS',
-                            started_at=started_at,
                             completed_at=completed_at,
                             duration_seconds=duration_seconds,
                             records_processed=records_processed,
                             records_failed=records_failed,
-                            metadata={
-                                'execution_id': execution_id,
-                                'result': str(result) if result else None
-                            }
+                            metadata={'result': str(result) if result else None}
                         )
-                        self.repository.store_job_execution(success_execution)
+
+                    self._record_outcome(job_id, failed=False)
 
                     # Update metrics
                     self._update_metrics(
@@ -117,12 +404,14 @@ class SchedulerJobTrackingService:
                         'SUCCESS',
                         duration_seconds,
                         records_processed,
-                        records_failed
+                        records_failed,
+                        started_at=started_at,
+                        now=completed_at
                     )
 
                     logger.info(
-                        f"Job {job_name} completed successfully in {duration_seconds:.2f}s "
-                        f"(processed: {records_processed}, failed: {records_failed})"
+                        "Job %s completed successfully in %.2fs (processed: %s, failed: %s)",
+                        job_name, duration_seconds, records_processed, records_failed
                     )
 
                     return result
@@ -130,40 +419,36 @@ class SchedulerJobTrackingService:
                 except Exception as e:
                     # Calculate execution details
                     completed_at = datetime.utcnow()
-                    duration_seconds = (completed_at - started_at).total_seconds()
+                    duration_seconds = time.monotonic() - start_clock
                     error_message = str(e)
-                    error_traceback = traceback.format_exc()
 
-                    # Store failure execution
-                    if self.history_enabled:
-                        failure_execution = JobExecution(
-                            job_id=job_id,
-                            job_name=job_name,
+                    # Record failure (the traceback is only stored with history)
+                    if history_enabled:
+                        error_traceback = traceback.format_exc()
+                        self._complete_execution(
+                            execution,
                             status='FAILURE',
-                            started_at=started_at,
                             completed_at=completed_at,
                             duration_seconds=duration_seconds,
                             error_message=error_message,
-                            error_traceback=error_traceback,
-                            metadata={
-                                'execution_id': execution_id
-                            }
+                            error_traceback=error_traceback
                         )
-                        self.repository.store_job_execution(failure_execution)
 
                     # Update metrics
                     self._update_metrics(
                         job_id,
                         job_name,
                         'FAILURE',
-                        duration_seconds
+                        duration_seconds,
+                        error_message=error_message,
+                        now=completed_at
                     )
 
                     # Check for consecutive failures and create alert
-                    consecutive_failures = self.repository.get_consecutive_failures(job_id)
+                    consecutive_failures = self._record_outcome(job_id, failed=True)
                     logger.warning(
-                        f"Job {job_name} failed: {error_message} "
-                        f"(consecutive failures: {consecutive_failures})"
+                        "Job %s failed: %s (consecutive failures: %s)",
+                        job_name, error_message, consecutive_failures
                     )
 
                     if consecutive_failures >= 2:
@@ -171,7 +456,8 @@ class SchedulerJobTrackingService:
                             job_id,
                             job_name,
                             error_message,
-                            consecutive_failures
+                            consecutive_failures,
+                            now=completed_at
                         )
 
                     # Re-raise the exception
@@ -180,6 +466,88 @@ class SchedulerJobTrackingService:
             return wrapper
         return decorator
 
+    def _record_outcome(self, job_id: str, failed: bool) -> int:
+        """
+        Update the in-memory consecutive failure counter for a job.
+
+        The counter is seeded from execution history the first time a job
+        is seen, after which no database query is needed.
+
+        Args:
+            job_id: APScheduler job ID
+            failed: Whether the execution failed
+
+        Returns:
+            int: Number of consecutive failures after this execution
+        """
+        if job_id not in self._consec_failures:
+            seed = self.repository.get_consecutive_failures(job_id) if failed else 0
+            self._consec_failures.setdefault(job_id, seed)
+
+        with self._lock_for(job_id):
+            if failed:
+                count = self._consec_failures[job_id] + 1
+            else:
+                count = 0
+            self._consec_failures[job_id] = count
+        return count
+
+    def _lock_for(self, job_id: str) -> threading.Lock:
+        """Get the lock stripe guarding a job's in-memory state."""
+        return self._locks[hash(job_id) % _LOCK_STRIPES]
+
+    def _complete_execution(
+        self,
+        execution: JobExecution,
+        status: str,
+        completed_at: datetime,
+        duration_seconds: float,
+        records_processed: int = 0,
+        records_failed: int = 0,
+        error_message: Optional[str] = None,
+        error_traceback: Optional[str] = None,
+        metadata: Optional[dict] = None
+    ) -> None:
+        """
+        Record the terminal state of a job execution.
+
+        Updates the RUNNING row in place when in-progress tracking is enabled,
+        otherwise queues a single insert carrying the final status.
+
+        Args:
+            execution: Execution record created when the job started
+            status: Final status (SUCCESS/FAILURE)
+            completed_at: Completion timestamp
+            duration_seconds: Execution duration
+            records_processed: Number of records processed
+            records_failed: Number of records that failed
+            error_message: Error message if job failed
+            error_traceback: Full error traceback if job failed
+            metadata: Additional execution metadata
+        """
+        if self.in_progress_enabled:
+            self._writer.submit_update(execution.id, {
+                'status': status,
+                'completed_at': completed_at.isoformat(),
+                'duration_seconds': duration_seconds,
+                'records_processed': records_processed,
+                'records_failed': records_failed,
+                'error_message': error_message,
+                'error_traceback': error_traceback,
+                'metadata': metadata or {}
+            })
+            return
+
+        execution.status = status
+        execution.completed_at = completed_at
+        execution.duration_seconds = duration_seconds
+        execution.records_processed = records_processed
+        execution.records_failed = records_failed
+        execution.error_message = error_message
+        execution.error_traceback = error_traceback
+        execution.metadata = metadata or {}
+        self._writer.submit(execution)
+
     def _update_metrics(
         self,
         job_id: str,
@@ -187,11 +555,17 @@ class SchedulerJobTrackingService:
         status: str,
         duration_seconds: float,
         records_processed: int = 0,
-        records_failed: int = 0
+        records_failed: int = 0,
+        error_message: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        now: Optional[datetime] = None
     ) -> None:
         """
         Update job metrics after execution.
 
+        Only touches the in-memory aggregate; the database row is written by
+        the periodic metrics flush.
+
         Args:
             job_id: APScheduler job ID
             job_name: Human-readable job name
@@ -199,49 +573,81 @@ class SchedulerJobTrackingService:
             duration_seconds: Execution duration
             records_processed: Number of records processed
             records_failed: Number of records that failed
+            error_message: Error message if the job failed
+            started_at: Execution start time
+            now: Execution completion time (defaults to the current time)
         """
         try:
-            # Get or create metrics
-            metrics = self.repository.get_job_metrics(job_id)
+            agg = self._get_metrics_agg(job_id, job_name)
 
-            if not metrics:
-                # Create new metrics record
-                metrics = JobMetrics(
-                    job_id=job_id,
-                    job_name=job_name,
-                    total_executions=1,
-                    successful_executions=1 if status == 'SUCCESS' else 0,
-                    failed_executions=1 if status == 'FAILURE' else 0,
-                    skipped_executions=1 if status == 'SKIPPED' else 0,
-                    avg_duration_seconds=duration_seconds,
-                    min_duration_seconds=duration_seconds if duration_seconds > 0 else None,
-                    max_duration_seconds=duration_seconds if duration_seconds > 0 else None,
-                    success_rate=100.0 if status == 'SUCCESS' else 0.0,
-                    last_execution_status=status,
-                    last_execution_at=datetime.utcnow()
-                )
-                self.repository.store_job_metrics(metrics)
-            else:
-                # Update existing metrics
-                self.repository.update_job_metrics(
-                    job_id,
-                    status,
-                    duration_seconds,
-                    records_processed,
-                    records_failed
+            with self._lock_for(job_id):
+                agg.record(
+                    status, duration_seconds, now or datetime.utcnow(), error_message, started_at
                 )
 
-            logger.debug(f"Updated metrics for job {job_id}")
+            self._ensure_metrics_flusher()
+            logger.debug("Updated metrics for job %s", job_id)
 
         except Exception as e:
-            logger.error(f"Error updating metrics for job {job_id}: {e}")
+            logger.error("Error updating metrics for job %s: %s", job_id, e)
+
+    def _get_metrics_agg(self, job_id: str, job_name: str) -> _JobMetricsAgg:
+        """Get the metrics aggregate for a job, loading it from the database on first use."""
+        agg = self._metrics_cache.get(job_id)
+        if agg is not None:
+            return agg
+
+        stored = self.repository.get_job_metrics(job_id)
+
+        # setdefault is atomic, so a concurrent first use keeps one aggregate
+        return self._metrics_cache.setdefault(job_id, _JobMetricsAgg(job_id, job_name, stored))
+
+    def _ensure_metrics_flusher(self) -> None:
+        """Start the background metrics flush thread on first use."""
+        if self._metrics_flusher is not None:
+            return
+        with self._flusher_lock:
+            if self._metrics_flusher is None:
+                self._metrics_flusher = threading.Thread(
+                    target=self._run_metrics_flusher,
+                    name='job-metrics-flusher',
+                    daemon=True
+                )
+                self._metrics_flusher.start()
+
+    def _run_metrics_flusher(self) -> None:
+        """Flush dirty metrics every flush interval."""
+        while True:
+            time.sleep(self._metrics_flush_interval)
+            self.flush_metrics()
+
+    def flush_metrics(self) -> None:
+        """Write all metrics changed since the last flush in one upsert."""
+        dirty = []
+        snapshots = []
+        for agg in list(self._metrics_cache.values()):
+            with self._lock_for(agg.job_id):
+                if agg.dirty:
+                    snapshots.append(agg.to_metrics())
+                    agg.dirty = False
+                    dirty.append(agg)
+
+        if not snapshots:
+            return
+
+        if not self.repository.upsert_job_metrics_bulk(snapshots):
+            # Retry on the next flush
+            for agg in dirty:
+                with self._lock_for(agg.job_id):
+                    agg.dirty = True
 
     def _create_failure_alert(
         self,
         job_id: str,
         job_name: str,
         error_message: str,
-        consecutive_failures: int
+        consecutive_failures: int,
+        now: Optional[datetime] = None
     ) -> None:
         """
         Create a failure alert for consecutive job failures.
@@ -251,16 +657,10 @@ class SchedulerJobTrackingService:
             job_name: Human-readable job name
             error_message: Error message from failure
             consecutive_failures: Number of consecutive failures
+            now: Failure time (defaults to the current time)
         """
         try:
-            # Get last successful execution
-            executions = self.repository.get_job_executions_by_id(job_id, limit=20)
-            last_successful_execution = None
-
-            for execution in executions:
-                if execution.status == 'SUCCESS':
-                    last_successful_execution = execution.started_at
-                    break
+            last_successful_execution = self._get_last_success_at(job_id)
 
             # Determine recommendation based on error
             recommendation = self._get_recommendation(error_message, job_name)
@@ -270,7 +670,7 @@ class SchedulerJobTrackingService:
                 job_id=job_id,
                 job_name=job_name,
                 error_message=error_message,
-                failure_timestamp=datetime.utcnow(),
+                failure_timestamp=now or datetime.utcnow(),
                 consecutive_failures=consecutive_failures,
                 last_successful_execution=last_successful_execution,
                 recommendation=recommendation
@@ -280,14 +680,42 @@ class SchedulerJobTrackingService:
 
             if success:
                 logger.warning(
-                    f"Created alert for job {job_name}: "
-                    f"{consecutive_failures} consecutive failures"
+                    "Created alert for job %s: %s consecutive failures",
+                    job_name, consecutive_failures
                 )
             else:
-                logger.error(f"Failed to create alert for job {job_name}")
+                logger.error("Failed to create alert for job %s", job_name)
 
         except Exception as e:
-            logger.error(f"Error creating failure alert for {job_name}: {e}")
+            logger.error("Error creating failure alert for %s: %s", job_name, e)
+
+    def _get_last_success_at(self, job_id: str) -> Optional[datetime]:
+        """
+        Get the start time of the last successful execution of a job.
+
+        Served from the metrics cache; the database is only queried the
+        first time it is needed for a job that has not succeeded since startup.
+
+        Args:
+            job_id: APScheduler job ID
+
+        Returns:
+            Start time of the last successful execution, or None if unknown
+        """
+        agg = self._metrics_cache.get(job_id)
+        if agg is not None and agg.last_success_known:
+            return agg.last_success_at
+
+        last_success_at = self.repository.get_last_successful_execution_time(job_id)
+
+        if agg is not None:
+            with self._lock_for(job_id):
+                if not agg.last_success_known:
+                    agg.last_success_at = last_success_at
+                    agg.last_success_known = True
+                    return last_success_at
+                return agg.last_success_at
+        return last_success_at
 
     def _get_recommendation(self, error_message: str, job_name: str) -> str:
         """
@@ -300,39 +728,14 @@ class SchedulerJobTrackingService:
         Returns:
             str: Recommendation for resolving the issue
         """
-        error_lower = error_message.lower()
+        match = _RECOMMENDATION_RE.match(error_message)
+        if match:
+            return _RECOMMENDATIONS[match.lastgroup]
 
-        # Common error patterns
-        if 'timeout' in error_lower or 'timed out' in error_lower:
-            return (
-                "Job is timing out. Consider increasing the timeout limit "
-                "in SchedulerConfig or optimizing the job logic."
-            )
-        elif 'connection' in error_lower or 'network' in error_lower:
-            return (
-                "Network/connection error detected. Check internet connectivity "
-                "and external service availability (Supabase, YFinance)."
-            )
-        elif 'authentication' in error_lower or 'unauthorized' in error_lower:
-            return (
-                "Authentication/authorization error. Verify API keys and "
-                "credentials in environment variables."
-            )
-        elif 'database' in error_lower or 'supabase' in error_lower:
-            return (
-                "Database error detected. Check Supabase connectivity "
-                "and table schema."
-            )
-        elif 'memory' in error_lower or 'out of' in error_lower:
-            return (
-                "Memory or resource exhaustion. Consider increasing system "
-                "resources or optimizing job memory usage."
-            )
-        else:
-            return (
-                f"Job {job_name} has encountered consecutive failures. "
-                "Check logs for more details."
-            )
+        return (
+            f"Job {job_name} has encountered consecutive failures. "
+            "Check logs for more details."
+        )
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
@@ -345,8 +748,13 @@ class SchedulerJobTrackingService:
             Dict with job status information
         """
         try:
-            # Get metrics
-            metrics = self.repository.get_job_metrics(job_id)
+            # Get metrics (in-memory aggregate is ahead of the last flush)
+            agg = self._metrics_cache.get(job_id)
+            if agg is not None:
+                with self._lock_for(job_id):
+                    metrics = agg.to_metrics()
+            else:
+                metrics = self.repository.get_job_metrics(job_id)
 
             if not metrics:
                 return {
@@ -361,27 +769,37 @@ class SchedulerJobTrackingService:
             # Get execution statistics (last 24 hours)
             stats = self.repository.get_execution_statistics(job_id, hours=24)
 
-            return {
-                'job_id': job_id,
-                'job_name': metrics.job_name,
-                'status': metrics.last_execution_status,
-                'last_execution_at': metrics.last_execution_at.isoformat() if metrics.last_execution_at else None,
-                'total_executions': metrics.total_executions,
-                'successful_executions': metrics.successful_executions,
-                'failed_executions': metrics.failed_executions,
-                'success_rate': round(metrics.success_rate, 2),
-                'avg_duration': round(metrics.avg_duration_seconds, 2),
-                'min_duration': round(metrics.min_duration_seconds, 2) if metrics.min_duration_seconds else None,
-                'max_duration': round(metrics.max_duration_seconds, 2) if metrics.max_duration_seconds else None,
-                'last_error_message': metrics.last_error_message,
-                'active_alerts': len(alerts),
-                'last_24h_stats': stats
-            }
+            return self._build_job_status(job_id, metrics, alerts, stats)
 
         except Exception as e:
-            logger.error(f"Error retrieving job status for {job_id}: {e}")
+            logger.error("Error retrieving job status for %s: %s", job_id, e)
             return {'error': str(e)}
 
+    @staticmethod
+    def _build_job_status(
+        job_id: str,
+        metrics: JobMetrics,
+        alerts: List[FailedJobAlert],
+        stats: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the status dict for a job from its metrics, alerts and stats."""
+        return {
+            'job_id': job_id,
+            'job_name': metrics.job_name,
+            'status': metrics.last_execution_status,
+            'last_execution_at': metrics.last_execution_at.isoformat() if metrics.last_execution_at else None,
+            'total_executions': metrics.total_executions,
+            'successful_executions': metrics.successful_executions,
+            'failed_executions': metrics.failed_executions,
+            'success_rate': round(metrics.success_rate, 2),
+            'avg_duration': round(metrics.avg_duration_seconds, 2),
+            'min_duration': round(metrics.min_duration_seconds, 2) if metrics.min_duration_seconds else None,
+            'max_duration': round(metrics.max_duration_seconds, 2) if metrics.max_duration_seconds else None,
+            'last_error_message': metrics.last_error_message,
+            'active_alerts': len(alerts),
+            'last_24h_stats': stats
+        }
+
     def get_all_job_statuses(self) -> Dict[str, Any]:
         """
         Get status for all jobs.
@@ -390,11 +808,28 @@ class SchedulerJobTrackingService:
             Dict with all job statuses
         """
         try:
-            metrics_list = self.repository.get_all_job_metrics()
-            statuses = {}
+            metrics_by_job = {
+                metrics.job_id: metrics for metrics in self.repository.get_all_job_metrics()
+            }
+
+            # In-memory aggregates are ahead of the last flush
+            for job_id, agg in list(self._metrics_cache.items()):
+                with self._lock_for(job_id):
+                    metrics_by_job[job_id] = agg.to_metrics()
+
+            job_ids = list(metrics_by_job)
+            alerts_by_job = self.repository.get_active_alerts_for_jobs(job_ids)
+            stats_by_job = self.repository.get_execution_statistics_for_jobs(job_ids, hours=24)
 
-            for metrics in metrics_list:
-                statuses[metrics.job_id] = self.get_job_status(metrics.job_id)
+            statuses = {
+                job_id: self._build_job_status(
+                    job_id,
+                    metrics,
+                    alerts_by_job.get(job_id, []),
+                    stats_by_job.get(job_id, {})
+                )
+                for job_id, metrics in metrics_by_job.items()
+            }
 
             return {
                 'total_jobs': len(statuses),
@@ -402,5 +837,5 @@ class SchedulerJobTrackingService:
             }
 
         except Exception as e:
-            logger.error(f"Error retrieving all job statuses: {e}")
+            logger.error("Error retrieving all job statuses: %s", e)
             return {'error': str(e)}
@@ -5,10 +5,16 @@ This service verifies predictions by comparing predicted direction
 with actual price movements after 15 minutes.
 """
 
+import bisect
 import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from ..database.repositories.ticker_repository import TickerRepository
 from ..database.repositories.market_data_repository import MarketDataRepository
 from ..database.repositories.prediction_repository import PredictionRepository
@@ -16,6 +22,22 @@ from ..database.models.prediction import Prediction
 
 logger = logging.getLogger(__name__)
 
+# Columns written when a prediction is verified
+_VERIFICATION_FIELDS = ('actual_result', 'actual_price_change', 'verification_timestamp', 'metadata')
+
+# Most unverified predictions picked up per ticker in one verification pass
+_VERIFICATION_BATCH_SIZE = 100
+
+# How long an empty verification pass is remembered before querying again
+_IDLE_RECHECK_SECONDS = 5.0
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a timestamp column from a raw Supabase row."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
 
 class PredictionVerificationService:
     """Service to verify prediction accuracy against actual market movements.
@@ -28,7 +50,8 @@ class PredictionVerificationService:
         ticker_repo: TickerRepository,
         market_data_repo: MarketDataRepository,
         prediction_repo: PredictionRepository,
-        neutral_threshold_percent: float = 0.1
+        neutral_threshold_percent: float = 0.1,
+        max_workers: int = 16
     ):
         """Initialize PredictionVerificationService with injected dependencies.
 
@@ -37,11 +60,19 @@ class PredictionVerificationService:
             market_data_repo: MarketDataRepository for market data access
             prediction_repo: PredictionRepository for prediction data access
             neutral_threshold_percent: Threshold for neutral vs directional price change (default: 0.1%)
+            max_workers: Number of concurrent market data lookups during verification
         """
         self.ticker_repo = ticker_repo
         self.market_data_repo = market_data_repo
         self.prediction_repo = prediction_repo
         self.neutral_threshold_percent = neutral_threshold_percent
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='verification'
+        )
+        # Monotonic deadline before which a pass is skipped because the
+        # previous one found nothing pending
+        self._idle_until = 0.0
 
     def verify_pending_predictions(self) -> Dict[str, Any]:
         """
@@ -50,13 +81,6 @@ class PredictionVerificationService:
         Returns:
             Dict[str, Any]: Summary of verification results
         """
-        logger.info("Starting prediction verification...")
-
-        # Find predictions older than 15 minutes with NULL actual_result
-        cutoff_time = datetime.utcnow() - timedelta(minutes=15)
-
-        tickers = self.ticker_repo.get_enabled_tickers()
-
         results = {
             'success': True,
             'timestamp': datetime.utcnow().isoformat(),
@@ -66,14 +90,45 @@ class PredictionVerificationService:
             'errors': []
         }
 
+        if time.monotonic() < self._idle_until:
+            logger.debug("No pending predictions at last check, skipping verification")
+            return results
+
+        logger.info("Starting prediction verification...")
+
+        # Find predictions older than 15 minutes with NULL actual_result
+        cutoff_time = datetime.utcnow() - timedelta(minutes=15)
+
+        tickers = self.ticker_repo.get_enabled_tickers()
+
+        # Get unverified predictions for all tickers together
+        predictions_by_ticker = self._get_unverified_predictions(
+            [ticker.id for ticker in tickers],
+            cutoff_time
+        )
+
+        if predictions_by_ticker is None:
+            predictions_by_ticker = {}
+        elif not predictions_by_ticker:
+            # Nothing pending for any ticker; absorb bursts of scheduler calls
+            self._idle_until = time.monotonic() + _IDLE_RECHECK_SECONDS
+            logger.info("No pending predictions to verify")
+            return results
+
         for ticker in tickers:
+            if ticker.id not in predictions_by_ticker:
+                continue
+
             try:
-                # Get unverified predictions for this ticker
-                verified_count = self._verify_ticker_predictions(ticker.id, ticker.symbol, cutoff_time)
+                verified_count = self._verify_ticker_predictions(
+                    ticker.id,
+                    ticker.symbol,
+                    predictions_by_ticker.get(ticker.id, [])
+                )
                 results['total_verified'] += verified_count
 
             except Exception as e:
-                logger.error(f"Error verifying predictions for {ticker.symbol}: {e}")
+                logger.error("Error verifying predictions for %s: %s", ticker.symbol, e)
                 results['errors'].append({
                     'ticker': ticker.symbol,
                     'error': str(e)
@@ -81,7 +136,7 @@ class PredictionVerificationService:
 
         # Get counts of correct/wrong (across all tickers)
         # This is a summary - actual counts are calculated per prediction
-        logger.info(f"Verification completed: {results['total_verified']} predictions verified")
+        logger.info("Verification completed: %s predictions verified", results['total_verified'])
 
         return results
 
@@ -89,7 +144,7 @@ class PredictionVerificationService:
         self,
         ticker_id: str,
         symbol: str,
-        cutoff_time: datetime
+        predictions: List[Dict[str, Any]]
     ) -> int:
         """
         Verify predictions for a specific ticker.
@@ -97,83 +152,192 @@ class PredictionVerificationService:
         Args:
             ticker_id: Ticker UUID
             symbol: Ticker symbol
-            cutoff_time: Only verify predictions older than this time
+            predictions: Unverified prediction rows for this ticker
 
         Returns:
             int: Number of predictions verified
         """
-        # Get predictions that need verification
-        # (older than cutoff and actual_result is NULL)
-        predictions = self._get_unverified_predictions(ticker_id, cutoff_time)
-
         if not predictions:
-            logger.debug(f"No unverified predictions for {symbol}")
+            logger.debug("No unverified predictions for %s", symbol)
             return 0
 
-        logger.info(f"Found {len(predictions)} unverified predictions for {symbol}")
+        logger.info("Found %s unverified predictions for %s", len(predictions), symbol)
+
+        # Each prediction needs its own market data window; overlap the lookups
+        futures = []
+        for row in predictions:
+            try:
+                futures.append((row, self.executor.submit(
+                    self._measure_price_change,
+                    row['id'],
+                    _parse_timestamp(row['timestamp']),
+                    row.get('metadata'),
+                    ticker_id,
+                    symbol
+                )))
 
-        verified_count = 0
+            except Exception as e:
+                logger.error("Error verifying prediction %s for %s: %s", row.get('id'), symbol, e)
+                continue
 
-        for prediction in predictions:
+        measured = []
+        for row, future in futures:
             try:
-                success = self.verify_single_prediction(prediction.id, ticker_id, symbol)
-                if success:
-                    verified_count += 1
+                update_data = future.result()
+                if update_data:
+                    measured.append((row, update_data))
 
             except Exception as e:
-                logger.error(f"Error verifying prediction {prediction.id} for {symbol}: {e}")
+                logger.error("Error verifying prediction %s for %s: %s", row.get('id'), symbol, e)
                 continue
 
-        return verified_count
+        if not measured:
+            return 0
+
+        # Evaluate the whole batch at once
+        results = self._evaluate_predictions_bulk(
+            np.array([row['prediction'] for row, _ in measured]),
+            np.array([data['metadata']['price_change_percent'] for _, data in measured])
+        )
+
+        rows = []
+        for (row, update_data), actual_result in zip(measured, results.tolist()):
+            update_data['actual_result'] = actual_result
+            self._log_verification(row['id'], row['prediction'], symbol, update_data)
+            rows.append({'id': row['id'], **update_data})
+
+        return self._store_verification_updates(rows, symbol)
+
+    def _store_verification_updates(self, rows: List[Dict[str, Any]], symbol: str) -> int:
+        """
+        Write verification results for a batch of predictions.
+
+        Only the id and verification fields are sent, so columns changed by
+        other writers since the predictions were read are left alone. The batch
+        is written with a single upsert; if it fails, each row is retried as an
+        individual update.
+
+        Args:
+            rows: Prediction ids with their verification results
+            symbol: Ticker symbol
+
+        Returns:
+            int: Number of predictions written
+        """
+        if not rows:
+            return 0
+
+        table = self.prediction_repo.client.table(self.prediction_repo.predictions_table)
+        updates = [
+            {'id': row['id'], **{key: row[key] for key in _VERIFICATION_FIELDS}}
+            for row in rows
+        ]
+
+        try:
+            table.upsert(updates, on_conflict='id').execute()
+            return len(updates)
+
+        except Exception as e:
+            logger.warning(
+                "Bulk verification update failed for %s, falling back to per-row updates: %s",
+                symbol, e
+            )
+
+        written = 0
+        for update_data in updates:
+            prediction_id = update_data.pop('id')
+            try:
+                table.update(update_data).eq('id', prediction_id).execute()
+                written += 1
+
+            except Exception as e:
+                logger.error("Error storing verification for prediction %s: %s", prediction_id, e)
+
+        return written
 
     def _get_unverified_predictions(
         self,
-        ticker_id: str,
+        ticker_ids: List[str],
         cutoff_time: datetime
-    ) -> List[Prediction]:
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
-        Get predictions that need verification.
+        Get predictions that need verification for several tickers.
+
+        Rows are returned as raw dicts; verification only reads a few fields,
+        so they are not hydrated into Prediction objects.
+
+        Each ticker gets up to _VERIFICATION_BATCH_SIZE of its oldest rows. A
+        single query usually covers every ticker; if it comes back full, the
+        tickers that did not fill their share are queried again, so a backlog
+        on one ticker cannot use up the limit for the others.
 
         Args:
-            ticker_id: Ticker UUID
+            ticker_ids: Ticker UUIDs
             cutoff_time: Only get predictions older than this time
 
         Returns:
-            List[Prediction]: List of unverified predictions
+            Dict[str, List[Dict[str, Any]]]: Unverified prediction rows keyed by
+            ticker_id (tickers without pending rows are absent), or None if the
+            query failed
         """
+        if not ticker_ids:
+            return {}
+
+        predictions_by_ticker: Dict[str, List[Dict[str, Any]]] = {}
+        remaining = list(ticker_ids)
+
         try:
-            # Query predictions where:
-            # - ticker_id matches
-            # - timestamp < cutoff_time (older than 15 min)
-            # - actual_result IS NULL (not yet verified)
-            response = (
-                self.prediction_repo.client
-                .table(self.prediction_repo.predictions_table)
-                .select('*')
-                .eq('ticker_id', ticker_id)
-                .lt('timestamp', cutoff_time.isoformat())
-                .is_('actual_result', 'null')
-                .order('timestamp', desc=False)
-                .limit(100)  # Verify in batches
-                .execute()
-            )
+            while remaining:
+                limit = _VERIFICATION_BATCH_SIZE * len(remaining)
+
+                # Query predictions where:
+                # - ticker_id is one of the remaining tickers
+                # - timestamp < cutoff_time (older than 15 min)
+                # - actual_result IS NULL (not yet verified)
+                response = (
+                    self.prediction_repo.client
+                    .table(self.prediction_repo.predictions_table)
+                    .select('*')
+                    .in_('ticker_id', remaining)
+                    .lt('timestamp', cutoff_time.isoformat())
+                    .is_('actual_result', 'null')
+                    .order('timestamp', desc=False)
+                    .limit(limit)  # Verify in batches
+                    .execute()
+                )
+                rows = response.data or []
+
+                batch: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+                for row in rows:
+                    batch[row['ticker_id']].append(row)
 
-            predictions = [Prediction.from_dict(row) for row in response.data] if response.data else []
+                if len(rows) < limit:
+                    # Nothing was cut off, so every remaining ticker is complete
+                    for ticker_id, ticker_rows in batch.items():
+                        predictions_by_ticker[ticker_id] = ticker_rows[:_VERIFICATION_BATCH_SIZE]
+                    break
 
-            return predictions
+                # A full response holds at least one full ticker; keep those and
+                # query again for the rest, whose rows may have been cut off
+                for ticker_id, ticker_rows in batch.items():
+                    if len(ticker_rows) >= _VERIFICATION_BATCH_SIZE:
+                        predictions_by_ticker[ticker_id] = ticker_rows[:_VERIFICATION_BATCH_SIZE]
+                remaining = [t for t in remaining if t not in predictions_by_ticker]
+
+            return predictions_by_ticker
 
         except Exception as e:
-            logger.error(f"Error querying unverified predictions: {e}")
-            return []
+            logger.error("Error querying unverified predictions: %s", e)
+            return None
 
-    def verify_single_prediction(
+    def verify_single_prediction_by_id(
         self,
         prediction_id: str,
         ticker_id: str,
         symbol: str
     ) -> bool:
         """
-        Verify a specific prediction by comparing predicted vs actual price movement.
+        Fetch a prediction by id and verify it.
 
         Args:
             prediction_id: Prediction UUID
@@ -184,7 +348,6 @@ class PredictionVerificationService:
             bool: True if verification succeeded, False otherwise
         """
         try:
-            # Get the prediction
             response = (
                 self.prediction_repo.client
                 .table(self.prediction_repo.predictions_table)
@@ -195,18 +358,115 @@ class PredictionVerificationService:
             )
 
             if not response.data:
-                logger.warning(f"Prediction {prediction_id} not found")
+                logger.warning("Prediction %s not found", prediction_id)
                 return False
 
             prediction = Prediction.from_dict(response.data)
 
+        except Exception as e:
+            logger.error("Error fetching prediction %s: %s", prediction_id, e, exc_info=True)
+            return False
+
+        return self.verify_single_prediction(prediction, ticker_id, symbol)
+
+    def verify_single_prediction(
+        self,
+        prediction: Prediction,
+        ticker_id: str,
+        symbol: str
+    ) -> bool:
+        """
+        Verify a specific prediction by comparing predicted vs actual price movement.
+
+        Args:
+            prediction: Prediction to verify
+            ticker_id: Ticker UUID
+            symbol: Ticker symbol
+
+        Returns:
+            bool: True if verification succeeded, False otherwise
+        """
+        update_data = self._build_verification_update(prediction, ticker_id, symbol)
+        if not update_data:
+            return False
+
+        try:
+            self.prediction_repo.client.table(self.prediction_repo.predictions_table).update(
+                update_data
+            ).eq('id', prediction.id).execute()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error verifying prediction %s: %s", prediction.id, e, exc_info=True)
+            return False
+
+    def _build_verification_update(
+        self,
+        prediction: Prediction,
+        ticker_id: str,
+        symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compare predicted vs actual price movement and build the verification fields.
+
+        Args:
+            prediction: Prediction to verify
+            ticker_id: Ticker UUID
+            symbol: Ticker symbol
+
+        Returns:
+            Dict of verification fields to store, or None if the prediction
+            cannot be verified yet
+        """
+        update_data = self._measure_price_change(
+            prediction.id,
+            prediction.timestamp,
+            prediction.metadata,
+            ticker_id,
+            symbol
+        )
+        if not update_data:
+            return None
+
+        # Determine if prediction was correct
+        update_data['actual_result'] = self._evaluate_prediction(
+            prediction.prediction,
+            update_data['metadata']['price_change_percent']
+        )
+
+        self._log_verification(prediction.id, prediction.prediction, symbol, update_data)
+        return update_data
+
+    def _measure_price_change(
+        self,
+        prediction_id: str,
+        prediction_timestamp: datetime,
+        metadata: Optional[Dict[str, Any]],
+        ticker_id: str,
+        symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Measure the actual price movement 15 minutes after a prediction.
+
+        Args:
+            prediction_id: Prediction UUID
+            prediction_timestamp: When the prediction was made
+            metadata: Prediction metadata (must contain baseline_price)
+            ticker_id: Ticker UUID
+            symbol: Ticker symbol
+
+        Returns:
+            Dict of verification fields to store, without actual_result, or
+            None if the prediction cannot be verified yet
+        """
+        try:
             # Get baseline price from metadata
-            if not prediction.metadata or 'baseline_price' not in prediction.metadata:
-                logger.warning(f"Prediction {prediction_id} has no baseline_price, skipping verification")
-                return False
+            if not metadata or 'baseline_price' not in metadata:
+                logger.warning("Prediction %s has no baseline_price, skipping verification", prediction_id)
+                return None
 
-            baseline_price = float(prediction.metadata['baseline_price'])
-            prediction_timestamp = prediction.timestamp
+            baseline_price = float(metadata['baseline_price'])
 
             # Get price 15 minutes later
             verification_time = prediction_timestamp + timedelta(minutes=15)
@@ -225,16 +485,14 @@ class PredictionVerificationService:
 
             if not verification_data:
                 logger.warning(
-                    f"No market data found for verification of {symbol} "
-                    f"prediction at {verification_time}, will retry later"
+                    "No market data found for verification of %s prediction at %s, "
+                    "will retry later",
+                    symbol, verification_time
                 )
-                return False
+                return None
 
             # Get the closest data point to verification_time
-            closest_data = min(
-                verification_data,
-                key=lambda x: abs((x.timestamp - verification_time).total_seconds())
-            )
+            closest_data = self._closest_data_point(verification_data, verification_time)
 
             verification_price = float(closest_data.close)
 
@@ -242,40 +500,62 @@ class PredictionVerificationService:
             price_change = verification_price - baseline_price
             price_change_percent = (price_change / baseline_price) * 100
 
-            # Determine if prediction was correct
-            actual_result = self._evaluate_prediction(
-                prediction.prediction,
-                price_change_percent
-            )
+            verification_metadata = metadata.copy()
+            verification_metadata['verification_price'] = verification_price
+            verification_metadata['verification_data_timestamp'] = closest_data.timestamp.isoformat()
+            verification_metadata['price_change_percent'] = price_change_percent
 
-            # Update prediction with verification results
-            update_data = {
-                'actual_result': actual_result,
+            # Verification results to store on the prediction
+            return {
                 'actual_price_change': price_change,
                 'verification_timestamp': datetime.utcnow().isoformat(),
-                'metadata': {
-                    **prediction.metadata,
-                    'verification_price': verification_price,
-                    'verification_data_timestamp': closest_data.timestamp.isoformat(),
-                    'price_change_percent': price_change_percent
-                }
+                'metadata': verification_metadata
             }
 
-            self.prediction_repo.client.table(self.prediction_repo.predictions_table).update(
-                update_data
-            ).eq('id', prediction_id).execute()
+        except Exception as e:
+            logger.error("Error verifying prediction %s: %s", prediction_id, e, exc_info=True)
+            return None
 
-            logger.info(
-                f"Verified prediction {prediction_id} for {symbol}: "
-                f"{prediction.prediction} → {actual_result} "
-                f"(price change: {price_change_percent:+.2f}%)"
-            )
+    @staticmethod
+    def _log_verification(
+        prediction_id: str,
+        prediction_type: str,
+        symbol: str,
+        update_data: Dict[str, Any]
+    ) -> None:
+        """Log the outcome of a verified prediction."""
+        logger.info(
+            "Verified prediction %s for %s: %s → %s (price change: %+.2f%%)",
+            prediction_id,
+            symbol,
+            prediction_type,
+            update_data['actual_result'],
+            update_data['metadata']['price_change_percent']
+        )
+
+    @staticmethod
+    def _closest_data_point(data: List[Any], target_time: datetime) -> Any:
+        """
+        Find the data point closest in time to target_time.
 
-            return True
+        Args:
+            data: Market data points ordered by timestamp (as returned by
+                get_historical_data)
+            target_time: Time to match
 
-        except Exception as e:
-            logger.error(f"Error verifying prediction {prediction_id}: {e}", exc_info=True)
-            return False
+        Returns:
+            The data point with the timestamp nearest to target_time
+        """
+        times = [point.timestamp.timestamp() for point in data]
+        target = target_time.timestamp()
+        i = bisect.bisect_left(times, target)
+
+        if i == 0:
+            return data[0]
+        if i == len(times):
+            return data[-1]
+        # Ties go to the earlier point, as min() over the list did
+        return data[i] if times[i] - target < target - times[i - 1] else data[i - 1]
 
     def _evaluate_prediction(
         self,
@@ -306,9 +586,43 @@ class PredictionVerificationService:
             # Predicted neutral but price moved significantly
             return 'WRONG'
         else:
-            logger.warning(f"Unknown prediction type: {prediction_type}")
+            logger.warning("Unknown prediction type: %s", prediction_type)
             return 'WRONG'
 
+    def _evaluate_predictions_bulk(
+        self,
+        prediction_types: np.ndarray,
+        price_change_percents: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _evaluate_prediction for a batch of predictions.
+
+        Args:
+            prediction_types: Array of BULLISH, BEARISH, or NEUTRAL
+            price_change_percents: Array of actual price change percentages
+
+        Returns:
+            np.ndarray: 'CORRECT', 'WRONG', or 'NEUTRAL_RANGE' per prediction
+        """
+        neutral_range = np.abs(price_change_percents) <= self.neutral_threshold_percent
+        is_neutral = prediction_types == 'NEUTRAL'
+        bullish_correct = (prediction_types == 'BULLISH') & (price_change_percents > 0)
+        bearish_correct = (prediction_types == 'BEARISH') & (price_change_percents < 0)
+
+        unknown = ~(is_neutral | (prediction_types == 'BULLISH') | (prediction_types == 'BEARISH'))
+        if unknown.any():
+            logger.warning("Unknown prediction types: %s", sorted(set(prediction_types[unknown])))
+
+        return np.select(
+            [
+                neutral_range & is_neutral,
+                neutral_range,
+                bullish_correct | bearish_correct,
+            ],
+            ['CORRECT', 'NEUTRAL_RANGE', 'CORRECT'],
+            default='WRONG'
+        )
+
     def get_verification_status(self, ticker_id: str) -> Dict[str, Any]:
         """
         Get verification status for a ticker.
@@ -320,16 +634,17 @@ class PredictionVerificationService:
             Dict with verification statistics
         """
         try:
-            # Get all predictions for this ticker
-            response = (
-                self.prediction_repo.client
-                .table(self.prediction_repo.predictions_table)
-                .select('actual_result, timestamp')
+            # Count server-side; only the Content-Range count comes back
+            table = self.prediction_repo.client.table(self.prediction_repo.predictions_table)
+
+            total = (
+                table.select('id', count='exact')
                 .eq('ticker_id', ticker_id)
+                .limit(1)
                 .execute()
-            )
+            ).count or 0
 
-            if not response.data:
+            if total == 0:
                 return {
                     'total_predictions': 0,
                     'verified': 0,
@@ -337,8 +652,13 @@ class PredictionVerificationService:
                     'verification_rate': 0.0
                 }
 
-            total = len(response.data)
-            verified = sum(1 for p in response.data if p.get('actual_result') is not None)
+            verified = (
+                table.select('id', count='exact')
+                .eq('ticker_id', ticker_id)
+                .not_.is_('actual_result', 'null')
+                .limit(1)
+                .execute()
+            ).count or 0
             pending = total - verified
 
             return {
@@ -349,7 +669,7 @@ class PredictionVerificationService:
             }
 
         except Exception as e:
-            logger.error(f"Error getting verification status: {e}")
+            logger.error("Error getting verification status: %s", e)
             return {
                 'error': str(e)
             }
@@ -2,17 +2,40 @@
 Thread-safe caching utilities
 """
 import threading
-import pytz
-from datetime import datetime
-from typing import Optional, Tuple, Any, Dict
+import time
+from datetime import date as date_type, datetime, timezone
+from typing import Optional, Tuple, Any, Dict, List
 
 
 class ThreadSafeCache:
-    """Thread-safe cache for storing market data"""
-
-    def __init__(self):
-        self._cache = {'data': None, 'timestamp': None}
-        self._predictions = {}  # Store daily predictions: {date: {hour: prediction_data}}
+    """
+    Thread-safe cache for storing market data
+
+    Reads are lock-free: the cached entry is a single (data, timestamp)
+    tuple swapped atomically by writers, and the prediction table is
+    copy-on-write, so readers never see it mutate. The lock only
+    serializes writers.
+
+    The prediction store is bounded: once more than ``max_prediction_dates``
+    dates are held, the oldest calendar date is evicted on insert, like a
+    ring buffer wrapping over days.
+    """
+
+    __slots__ = (
+        '_entry',
+        '_entry_epoch',
+        '_predictions',
+        '_prediction_dates',
+        '_max_prediction_dates',
+        '_lock',
+    )
+
+    def __init__(self, max_prediction_dates: int = 31):
+        self._entry: Tuple[Optional[Any], Optional[datetime]] = (None, None)
+        self._entry_epoch: Optional[float] = None  # Entry timestamp as epoch seconds, None if empty
+        self._predictions: Dict[Tuple[str, int], Dict[str, Any]] = {}  # {(date, hour): prediction_data}
+        self._prediction_dates: Dict[str, Optional[date_type]] = {}  # Parsed once per date string
+        self._max_prediction_dates = max_prediction_dates
         self._lock = threading.Lock()
 
     def get(self) -> Tuple[Optional[Any], Optional[datetime]]:
@@ -22,8 +45,7 @@ class ThreadSafeCache:
         Returns:
             Tuple of (data, timestamp)
         """
-        with self._lock:
-            return self._cache['data'], self._cache['timestamp']
+        return self._entry
 
     def set(self, data: Any, timestamp: datetime) -> None:
         """
@@ -33,9 +55,15 @@ class ThreadSafeCache:
             data: Data to cache
             timestamp: Timestamp of the data
         """
+        epoch = None
+        if data is not None and timestamp is not None:
+            # Naive timestamps are treated as UTC
+            aware = timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+            epoch = aware.timestamp()
+
         with self._lock:
-            self._cache['data'] = data
-            self._cache['timestamp'] = timestamp
+            self._entry = (data, timestamp)
+            self._entry_epoch = epoch
 
     def is_valid(self, duration: int) -> bool:
         """
@@ -47,25 +75,14 @@ class ThreadSafeCache:
         Returns:
             True if cache is valid, False otherwise
         """
-        with self._lock:
-            if self._cache['data'] is None or self._cache['timestamp'] is None:
-                return False
-            # Use UTC-aware datetime for comparison to handle both naive and aware timestamps
-            current_time = datetime.now(pytz.UTC)
-            cached_time = self._cache['timestamp']
-
-            # Ensure cached_time is aware (convert if naive)
-            if cached_time.tzinfo is None:
-                cached_time = pytz.UTC.localize(cached_time)
-
-            time_diff = (current_time - cached_time).total_seconds()
-            return time_diff < duration
+        epoch = self._entry_epoch
+        return epoch is not None and time.time() - epoch < duration
 
     def clear(self) -> None:
         """Clear the cache"""
         with self._lock:
-            self._cache['data'] = None
-            self._cache['timestamp'] = None
+            self._entry = (None, None)
+            self._entry_epoch = None
 
     def store_prediction(self, date: str, hour: int, prediction_data: Dict[str, Any]) -> None:
         """
@@ -77,9 +94,24 @@ class ThreadSafeCache:
             prediction_data: Prediction data dictionary
         """
         with self._lock:
-            if date not in self._predictions:
-                self._predictions[date] = {}
-            self._predictions[date][hour] = prediction_data
+            if date not in self._prediction_dates:
+                self._prediction_dates[date] = self._parse_date(date)
+                if len(self._prediction_dates) > self._max_prediction_dates:
+                    oldest = self._oldest_date()
+                    self._evict_dates([oldest])
+                    if oldest == date:
+                        return  # Older than everything retained
+            predictions = dict(self._predictions)
+            predictions[(date, hour)] = prediction_data
+            self._predictions = predictions
+
+    @staticmethod
+    def _parse_date(date: str) -> Optional[date_type]:
+        """Parse a YYYY-MM-DD string, returning None if it is invalid."""
+        try:
+            return date_type.fromisoformat(date)
+        except ValueError:
+            return None
 
     def get_prediction(self, date: str, hour: int) -> Optional[Dict[str, Any]]:
         """
@@ -92,10 +124,7 @@ class ThreadSafeCache:
         Returns:
             Prediction data dictionary or None if not found
         """
-        with self._lock:
-            if date in self._predictions and hour in self._predictions[date]:
-                return self._predictions[date][hour]
-            return None
+        return self._predictions.get((date, hour))
 
     def get_day_predictions(self, date: str) -> Dict[int, Dict[str, Any]]:
         """
@@ -107,8 +136,11 @@ class ThreadSafeCache:
         Returns:
             Dictionary of predictions by hour {9: {...}, 10: {...}}
         """
-        with self._lock:
-            return self._predictions.get(date, {})
+        return {
+            pred_hour: data
+            for (pred_date, pred_hour), data in self._predictions.items()
+            if pred_date == date
+        }
 
     def clear_old_predictions(self, days_to_keep: int = 7) -> None:
         """
@@ -118,23 +150,36 @@ class ThreadSafeCache:
             days_to_keep: Number of days to keep (default 7)
         """
         with self._lock:
-            current_date = datetime.now(pytz.UTC).date()
-            dates_to_remove = []
-
-            for date_str in self._predictions.keys():
-                try:
-                    pred_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    age_days = (current_date - pred_date).days
-                    if age_days > days_to_keep:
-                        dates_to_remove.append(date_str)
-                except ValueError:
-                    # Invalid date format, mark for removal
-                    dates_to_remove.append(date_str)
-
-            for date_str in dates_to_remove:
-                del self._predictions[date_str]
+            current_date = datetime.now(timezone.utc).date()
+
+            # Invalid date strings were parsed to None and are removed too
+            dates_to_remove = [
+                date_str for date_str, pred_date in self._prediction_dates.items()
+                if pred_date is None or (current_date - pred_date).days > days_to_keep
+            ]
+
+            if dates_to_remove:
+                self._evict_dates(dates_to_remove)
+
+    def _oldest_date(self) -> str:
+        """Return the stored date string to evict first. Caller holds the lock."""
+        # Unparseable dates sort before every real date
+        return min(
+            self._prediction_dates,
+            key=lambda date_str: self._prediction_dates[date_str] or date_type.min
+        )
+
+    def _evict_dates(self, dates: List[str]) -> None:
+        """Remove all predictions for the given dates. Caller holds the lock."""
+        for date_str in dates:
+            del self._prediction_dates[date_str]
+        self._predictions = {
+            key: data for key, data in self._predictions.items()
+            if key[0] in self._prediction_dates
+        }
 
     def clear_predictions(self) -> None:
         """Clear all stored predictions"""
         with self._lock:
             self._predictions = {}
+            self._prediction_dates = {}
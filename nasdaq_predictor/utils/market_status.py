@@ -1,15 +1,130 @@
 """
 Market status utilities for determining if markets are open
 """
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..models.market_data import MarketStatus
 
 logger = logging.getLogger(__name__)
 
+_ET = ZoneInfo('America/New_York')
+_LON = ZoneInfo('Europe/London')
+_UTC = timezone.utc
+
+
+# Shared results; MarketStatus is frozen so these are safe to hand out
+_OPEN = MarketStatus(status='OPEN', next_open=None)
+_OPEN_247 = MarketStatus(status='OPEN (24/7)', next_open=None)
+_UNKNOWN = MarketStatus(status='UNKNOWN', next_open=None)
+
+# Futures (NQ=F, ES=F): Sunday 6:00 PM - Friday 5:00 PM ET (nearly 24/5)
+_FRI_CLOSE_MIN = 17 * 60    # Friday 5:00 PM ET
+_SUN_OPEN_MIN = 18 * 60     # Sunday 6:00 PM ET
+_FUTURES_CLOSED = MarketStatus(status='CLOSED', next_open='Sunday 6:00 PM ET')
+
+# FTSE 100: 8:00 AM - 4:30 PM London time (GMT/BST)
+_FTSE_OPEN = 8 * 60         # 8:00 AM
+_FTSE_CLOSE = 16 * 60 + 30  # 4:30 PM
+_FTSE_CLOSED_WEEKEND = MarketStatus(status='CLOSED', next_open='Monday 8:00 AM GMT')
+_FTSE_CLOSED_PRE_OPEN = MarketStatus(status='CLOSED', next_open='Today 8:00 AM GMT')
+_FTSE_CLOSED_OVERNIGHT = MarketStatus(status='CLOSED', next_open='Tomorrow 8:00 AM GMT')
+
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+def _futures_rule(weekday: int, current_time_minutes: int) -> MarketStatus:
+    """Futures are closed Friday 5:00 PM - Sunday 6:00 PM ET."""
+    if (
+        weekday == 5
+        or (weekday == 4 and current_time_minutes >= _FRI_CLOSE_MIN)
+        or (weekday == 6 and current_time_minutes < _SUN_OPEN_MIN)
+    ):
+        return _FUTURES_CLOSED
+
+    return _OPEN
+
+
+def _ftse_rule(weekday: int, current_time_minutes: int) -> MarketStatus:
+    """FTSE 100 trades weekdays 8:00 AM - 4:30 PM London time."""
+    if weekday >= 5:  # Saturday (5) or Sunday (6)
+        return _FTSE_CLOSED_WEEKEND
+
+    if current_time_minutes < _FTSE_OPEN:
+        return _FTSE_CLOSED_PRE_OPEN
+
+    if current_time_minutes >= _FTSE_CLOSE:
+        # Friday -> Monday
+        return _FTSE_CLOSED_WEEKEND if weekday == 4 else _FTSE_CLOSED_OVERNIGHT
+
+    return _OPEN
+
+
+def _build_week_table(rule, statuses: Tuple[MarketStatus, ...]) -> bytes:
+    """
+    Evaluate a status rule for every local minute of the week
+
+    Returns one byte per (weekday, minute) holding the index of the result
+    in ``statuses``, so a lookup is a single index instead of the rule's
+    comparisons.
+    """
+    return bytes(
+        statuses.index(rule(weekday, minute))
+        for weekday in range(7)
+        for minute in range(_MINUTES_PER_DAY)
+    )
+
+
+_FUTURES_STATUSES = (_OPEN, _FUTURES_CLOSED)
+_FUTURES_TABLE = _build_week_table(_futures_rule, _FUTURES_STATUSES)
+
+_FTSE_STATUSES = (_OPEN, _FTSE_CLOSED_WEEKEND, _FTSE_CLOSED_PRE_OPEN, _FTSE_CLOSED_OVERNIGHT)
+_FTSE_TABLE = _build_week_table(_ftse_rule, _FTSE_STATUSES)
+
+
+def _futures_status(current_time: datetime) -> MarketStatus:
+    """Look up futures status for the ET minute of the week."""
+    local = current_time.astimezone(_ET)
+    return _FUTURES_STATUSES[
+        _FUTURES_TABLE[local.weekday() * _MINUTES_PER_DAY + local.hour * 60 + local.minute]
+    ]
+
+
+def _crypto_status(current_time: datetime) -> MarketStatus:
+    """Cryptocurrency trades 24/7."""
+    return _OPEN_247
+
+
+def _ftse_status(current_time: datetime) -> MarketStatus:
+    """Look up FTSE status for the London minute of the week."""
+    local = current_time.astimezone(_LON)
+    return _FTSE_STATUSES[
+        _FTSE_TABLE[local.weekday() * _MINUTES_PER_DAY + local.hour * 60 + local.minute]
+    ]
+
+
+def _unknown_status(current_time: datetime) -> MarketStatus:
+    """Tickers without known market hours."""
+    return _UNKNOWN
+
+
+# Status function per ticker, resolved once instead of branching per call
+_STATUS_FN: Dict[str, Callable[[datetime], MarketStatus]] = {
+    'NQ=F': _futures_status,
+    'ES=F': _futures_status,
+    'BTC-USD': _crypto_status,
+    'SOL-USD': _crypto_status,
+    'ADA-USD': _crypto_status,
+    '^FTSE': _ftse_status,
+}
+
 
 def get_market_status(ticker_symbol: str, current_time: datetime) -> MarketStatus:
     """
@@ -23,110 +138,11 @@ def get_market_status(ticker_symbol: str, current_time: datetime) -> MarketStatu
         MarketStatus object with status and next_open time (if closed)
     """
     try:
-        # Convert to US Eastern Time
-        eastern = pytz.timezone('US/Eastern')
-        current_time_et = current_time.astimezone(eastern)
-
-        # Get current day of week (0=Monday, 6=Sunday)
-        weekday = current_time_et.weekday()
-        current_hour = current_time_et.hour
-        current_minute = current_time_et.minute
-        current_time_minutes = current_hour * 60 + current_minute
-
-        # Market hours in ET (in minutes from midnight)
-        pre_market_start = 4 * 60  # 4:00 AM
-        market_open = 9 * 60 + 30   # 9:30 AM
-        market_close = 16 * 60      # 4:00 PM
-        after_hours_end = 20 * 60   # 8:00 PM
-
-        if ticker_symbol in ['NQ=F', 'ES=F']:
-            # Futures (NQ=F, ES=F): Sunday 6:00 PM - Friday 5:00 PM ET (nearly 24/5)
-            # Closed: Friday 5:00 PM - Sunday 6:00 PM
-
-            if weekday == 4 and current_time_minutes >= 17 * 60:  # Friday after 5:00 PM
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open='Sunday 6:00 PM ET'
-                )
-            elif weekday == 5:  # Saturday (all day closed)
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open='Sunday 6:00 PM ET'
-                )
-            elif weekday == 6 and current_time_minutes < 18 * 60:  # Sunday before 6:00 PM
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open='Sunday 6:00 PM ET'
-                )
-            else:
-                return MarketStatus(
-                    status='OPEN',
-                    next_open=None
-                )
-
-        elif ticker_symbol in ['BTC-USD', 'SOL-USD', 'ADA-USD']:
-            # Cryptocurrency trades 24/7
-            return MarketStatus(
-                status='OPEN (24/7)',
-                next_open=None
-            )
-
-        elif ticker_symbol == '^FTSE':
-            # FTSE 100: 8:00 AM - 4:30 PM London time (GMT/BST)
-            # Using London timezone for accurate market hours
-            london = pytz.timezone('Europe/London')
-            current_time_london = current_time.astimezone(london)
-
-            # Get current day and time
-            weekday = current_time_london.weekday()
-            current_hour = current_time_london.hour
-            current_minute = current_time_london.minute
-            current_time_minutes = current_hour * 60 + current_minute
-
-            # Market hours in London time (in minutes from midnight)
-            market_open = 8 * 60           # 8:00 AM
-            market_close = 16 * 60 + 30    # 4:30 PM
-
-            # Check if weekend
-            if weekday >= 5:  # Saturday (5) or Sunday (6)
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open='Monday 8:00 AM GMT'
-                )
-
-            # Check if before market open
-            if current_time_minutes < market_open:
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open='Today 8:00 AM GMT'
-                )
-
-            # Check if after market close
-            if current_time_minutes >= market_close:
-                next_day = 'Monday' if weekday == 4 else 'Tomorrow'  # Friday -> Monday
-                return MarketStatus(
-                    status='CLOSED',
-                    next_open=f'{next_day} 8:00 AM GMT'
-                )
-
-            # Market is open
-            return MarketStatus(
-                status='OPEN',
-                next_open=None
-            )
-
-        else:
-            return MarketStatus(
-                status='UNKNOWN',
-                next_open=None
-            )
+        return _STATUS_FN.get(ticker_symbol, _unknown_status)(current_time)
 
     except Exception as e:
         logger.error(f"Error determining market status for {ticker_symbol}: {str(e)}", exc_info=True)
-        return MarketStatus(
-            status='UNKNOWN',
-            next_open=None
-        )
+        return _UNKNOWN
 
 
 def is_within_trading_session(timestamp: datetime, ticker_symbol: str, trading_sessions: Dict) -> bool:
@@ -146,30 +162,100 @@ def is_within_trading_session(timestamp: datetime, ticker_symbol: str, trading_s
 
     session = trading_sessions[ticker_symbol]
 
+    # Crypto trades 24/7 - no filtering
+    if session['type'] == 'crypto':
+        return True
+
     # Convert timestamp to UTC if not already
     if timestamp.tzinfo is None:
-        timestamp = pytz.UTC.localize(timestamp)
+        timestamp = timestamp.replace(tzinfo=_UTC)
     else:
-        timestamp = timestamp.astimezone(pytz.UTC)
+        timestamp = timestamp.astimezone(_UTC)
 
-    hour = timestamp.hour + timestamp.minute / 60.0
+    return _session_decision(
+        timestamp.weekday(),
+        timestamp.hour * 60 + timestamp.minute,
+        session['type'],
+        session['uses_main_only'],
+        session['main_session_start'],
+        session['main_session_end'],
+    )
 
-    # Crypto trades 24/7 - no filtering
-    if session['type'] == 'crypto':
-        return True
 
-    if session['type'] == 'futures' and not session['uses_main_only']:
+@lru_cache(maxsize=32768)
+def _session_decision(
+    weekday: int,
+    minute_of_day: int,
+    session_type: str,
+    uses_main_only: bool,
+    main_session_start: float,
+    main_session_end: float
+) -> bool:
+    """
+    Session check for one UTC weekday/minute, memoized
+
+    Keyed on the exact minute rather than a coarser bucket so results match
+    the unmemoized rule at every session boundary; that is at most
+    7 * 1440 entries per session configuration.
+    """
+    hour = minute_of_day / 60.0
+
+    if session_type == 'futures' and not uses_main_only:
         # Futures trade nearly 24/7, exclude only the 1-hour maintenance break (21:00-22:00 UTC)
         # Also exclude weekends (Saturday 21:00 to Sunday 22:00)
-        if timestamp.weekday() == 5:  # Saturday
+        if weekday == 5:  # Saturday
             return hour < 21.0
-        elif timestamp.weekday() == 6:  # Sunday
+        elif weekday == 6:  # Sunday
             return hour >= 22.0
         else:
             return not (21.0 <= hour < 22.0)
     else:
         # Cash index or main session only
         # Exclude weekends entirely
-        if timestamp.weekday() >= 5:  # Saturday or Sunday
+        if weekday >= 5:  # Saturday or Sunday
             return False
-        return session['main_session_start'] <= hour <= session['main_session_end']
+        return main_session_start <= hour <= main_session_end
+
+
+def is_within_trading_session_batch(
+    timestamps: pd.DatetimeIndex,
+    ticker_symbol: str,
+    trading_sessions: Dict
+) -> np.ndarray:
+    """
+    Vectorized is_within_trading_session over an index of timestamps
+
+    Naive timestamps are treated as UTC, matching the scalar version.
+
+    Args:
+        timestamps: Timestamps to check
+        ticker_symbol: Ticker symbol
+        trading_sessions: Trading session configuration dict
+
+    Returns:
+        Boolean array, True where the timestamp is within the trading session
+    """
+    if ticker_symbol not in trading_sessions:
+        return np.ones(len(timestamps), dtype=bool)
+
+    session = trading_sessions[ticker_symbol]
+    if session['type'] == 'crypto':
+        return np.ones(len(timestamps), dtype=bool)
+
+    # .values is UTC for tz-aware indexes and wall time for naive ones
+    minutes = pd.DatetimeIndex(timestamps).values.astype('datetime64[m]').astype(np.int64)
+    days, minute_of_day = np.divmod(minutes, 24 * 60)
+    weekday = (days + 3) % 7  # 1970-01-01 was a Thursday
+    hour = minute_of_day / 60.0
+
+    if session['type'] == 'futures' and not session['uses_main_only']:
+        return np.where(
+            weekday == 5, hour < 21.0,
+            np.where(weekday == 6, hour >= 22.0, (hour < 21.0) | (hour >= 22.0))
+        )
+
+    return (
+        (weekday < 5)
+        & (hour >= session['main_session_start'])
+        & (hour <= session['main_session_end'])
+    )
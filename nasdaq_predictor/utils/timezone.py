@@ -1,8 +1,17 @@
 """
 Timezone utilities for handling market time conversions
 """
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+# zoneinfo resolves offsets from the wall time itself, so a datetime built
+# with replace() is already correct; no localize()/normalize() needed
+_ET = ZoneInfo('America/New_York')
+_LON = ZoneInfo('Europe/London')
+_UTC = timezone.utc
 
 
 def ensure_utc(timestamp: datetime) -> datetime:
@@ -15,9 +24,29 @@ def ensure_utc(timestamp: datetime) -> datetime:
     Returns:
         Datetime object in UTC timezone
     """
-    if timestamp.tzinfo is None:
-        return pytz.UTC.localize(timestamp)
-    return timestamp.astimezone(pytz.UTC)
+    tzinfo = timestamp.tzinfo
+    if tzinfo is _UTC:
+        return timestamp
+    if tzinfo is None:
+        return timestamp.replace(tzinfo=_UTC)
+    return timestamp.astimezone(_UTC)
+
+
+def _to_local(utc_time: datetime, tz: ZoneInfo) -> datetime:
+    """
+    Convert to a local zone in a single astimezone() call
+
+    astimezone() converts from any aware zone directly, so only naive
+    input (taken as UTC) needs handling; no intermediate UTC hop.
+    """
+    if utc_time.tzinfo is None:
+        utc_time = utc_time.replace(tzinfo=_UTC)
+    return utc_time.astimezone(tz)
+
+
+def _ticker_tz(ticker_symbol: str) -> ZoneInfo:
+    """London for the FTSE; NY for US futures, indices, and crypto."""
+    return _LON if ticker_symbol == '^FTSE' else _ET
 
 
 def get_et_midnight(current_time_utc: datetime) -> datetime:
@@ -30,13 +59,11 @@ def get_et_midnight(current_time_utc: datetime) -> datetime:
     Returns:
         Midnight ET converted to UTC
     """
-    eastern = pytz.timezone('US/Eastern')
-    current_time_et = current_time_utc.astimezone(eastern)
+    current_time_et = current_time_utc.astimezone(_ET)
 
     # Get midnight ET for current day
-    et_midnight_naive = current_time_et.replace(hour=0, minute=0, second=0, microsecond=0)
-    et_midnight = eastern.normalize(eastern.localize(et_midnight_naive.replace(tzinfo=None)))
-    et_midnight_utc = et_midnight.astimezone(pytz.UTC)
+    et_midnight = current_time_et.replace(hour=0, minute=0, second=0, microsecond=0)
+    et_midnight_utc = et_midnight.astimezone(_UTC)
 
     return et_midnight_utc
 
@@ -56,14 +83,15 @@ def get_candle_open_time(current_time: datetime, interval_minutes: int) -> datet
         If current_time is 14:37 and interval is 5 minutes:
         Returns 14:35 (the start of the 14:35-14:40 candle)
     """
-    if interval_minutes == 240:  # 4-hourly
-        candle_hour = (current_time.hour // 4) * 4
-        return current_time.replace(hour=candle_hour, minute=0, second=0, microsecond=0)
-    elif interval_minutes == 60:  # Hourly
-        return current_time.replace(minute=0, second=0, microsecond=0)
-    else:  # 3, 5, 30 minutes
-        candle_minute = (current_time.minute // interval_minutes) * interval_minutes
-        return current_time.replace(minute=candle_minute, second=0, microsecond=0)
+    # Floor the wall-clock seconds since midnight; every supported interval
+    # divides a day, so this matches flooring the hour/minute fields
+    seconds = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+    candle_open = current_time - timedelta(
+        seconds=seconds % (interval_minutes * 60),
+        microseconds=current_time.microsecond
+    )
+    # Subtraction resets fold; keep it so a repeated DST hour keeps its offset
+    return candle_open.replace(fold=current_time.fold)
 
 
 def get_week_start(current_time: datetime) -> datetime:
@@ -96,6 +124,46 @@ def get_month_start(current_time: datetime) -> datetime:
     return current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
+def candle_open_batch(timestamps: pd.DatetimeIndex, interval_minutes: int) -> pd.DatetimeIndex:
+    """
+    Vectorized get_candle_open_time over an index of timestamps
+
+    Args:
+        timestamps: Timestamps in UTC
+        interval_minutes: candle interval in minutes (3, 5, 30, 60, 240)
+
+    Returns:
+        Candle open times, same timezone as the input
+    """
+    return timestamps.floor(f'{interval_minutes}min')
+
+
+def week_start_batch(timestamps: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """
+    Vectorized get_week_start over an index of timestamps
+
+    Args:
+        timestamps: Timestamps in UTC
+
+    Returns:
+        Monday 00:00 of each timestamp's week, same timezone as the input
+    """
+    return timestamps.normalize() - pd.to_timedelta(timestamps.weekday, unit='D')
+
+
+def month_start_batch(timestamps: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """
+    Vectorized get_month_start over an index of timestamps
+
+    Args:
+        timestamps: Timestamps in UTC
+
+    Returns:
+        1st of month 00:00 for each timestamp, same timezone as the input
+    """
+    return timestamps.normalize() - pd.to_timedelta(timestamps.day - 1, unit='D')
+
+
 def get_ny_time(utc_time: datetime) -> datetime:
     """
     Convert UTC time to NY Eastern Time (handles DST automatically)
@@ -106,9 +174,7 @@ def get_ny_time(utc_time: datetime) -> datetime:
     Returns:
         Datetime object in US/Eastern timezone
     """
-    utc_time = ensure_utc(utc_time)
-    eastern = pytz.timezone('US/Eastern')
-    return utc_time.astimezone(eastern)
+    return _to_local(utc_time, _ET)
 
 
 def get_ny_hour_timestamp(date: datetime, hour: int, minute: int = 0) -> datetime:
@@ -123,17 +189,14 @@ def get_ny_hour_timestamp(date: datetime, hour: int, minute: int = 0) -> datetim
     Returns:
         UTC timestamp for that NY time
     """
-    eastern = pytz.timezone('US/Eastern')
-
     # Convert input to NY timezone
-    ny_date = date.astimezone(eastern) if date.tzinfo else eastern.localize(date)
+    ny_date = date.astimezone(_ET) if date.tzinfo else date.replace(tzinfo=_ET)
 
     # Create target time in NY
     ny_time = ny_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    ny_time = eastern.normalize(ny_time)
 
     # Convert to UTC
-    return ny_time.astimezone(pytz.UTC)
+    return ny_time.astimezone(_UTC)
 
 
 def get_7am_ny_timestamp(current_time_utc: datetime) -> datetime:
@@ -172,9 +235,7 @@ def get_london_time(utc_time: datetime) -> datetime:
     Returns:
         Datetime object in Europe/London timezone
     """
-    utc_time = ensure_utc(utc_time)
-    london = pytz.timezone('Europe/London')
-    return utc_time.astimezone(london)
+    return _to_local(utc_time, _LON)
 
 
 def get_london_hour_timestamp(date: datetime, hour: int, minute: int = 0) -> datetime:
@@ -189,17 +250,14 @@ def get_london_hour_timestamp(date: datetime, hour: int, minute: int = 0) -> dat
     Returns:
         UTC timestamp for that London time
     """
-    london = pytz.timezone('Europe/London')
-
     # Convert input to London timezone
-    london_date = date.astimezone(london) if date.tzinfo else london.localize(date)
+    london_date = date.astimezone(_LON) if date.tzinfo else date.replace(tzinfo=_LON)
 
     # Create target time in London
     london_time = london_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    london_time = london.normalize(london_time)
 
     # Convert to UTC
-    return london_time.astimezone(pytz.UTC)
+    return london_time.astimezone(_UTC)
 
 
 def get_ticker_time(utc_time: datetime, ticker_symbol: str) -> datetime:
@@ -213,11 +271,7 @@ def get_ticker_time(utc_time: datetime, ticker_symbol: str) -> datetime:
     Returns:
         Datetime object in the appropriate timezone
     """
-    if ticker_symbol == '^FTSE':
-        return get_london_time(utc_time)
-    else:
-        # Default to NY time for US futures, indices, and crypto
-        return get_ny_time(utc_time)
+    return _to_local(utc_time, _ticker_tz(ticker_symbol))
 
 
 def get_ticker_hour_timestamp(date: datetime, hour: int, minute: int, ticker_symbol: str) -> datetime:
@@ -240,6 +294,50 @@ def get_ticker_hour_timestamp(date: datetime, hour: int, minute: int, ticker_sym
         return get_ny_hour_timestamp(date, hour, minute)
 
 
+def get_ticker_hour_timestamps_batch(
+    dates: pd.DatetimeIndex,
+    hour: int,
+    minute: int,
+    ticker_symbol: str
+) -> pd.DatetimeIndex:
+    """
+    Vectorized get_ticker_hour_timestamp over an index of dates
+
+    Naive dates are taken as local dates in the ticker's timezone. DST gaps
+    and overlaps resolve the same way as the scalar version (a nonexistent
+    wall time is shifted forward an hour, an ambiguous one takes DST).
+
+    Args:
+        dates: Dates (in any timezone)
+        hour: Hour in ticker's local time (0-23)
+        minute: Minute in ticker's local time (0-59)
+        ticker_symbol: Ticker symbol (e.g., 'NQ=F', '^FTSE')
+
+    Returns:
+        UTC timestamps for that local time on each date
+    """
+    tz = _ticker_tz(ticker_symbol)
+    dates = pd.DatetimeIndex(dates)
+    if dates.tz is not None:
+        dates = dates.tz_convert(tz).tz_localize(None)
+
+    wall_times = dates.normalize() + pd.Timedelta(hours=hour, minutes=minute)
+    return wall_times.tz_localize(
+        tz,
+        ambiguous=np.ones(len(wall_times), dtype=bool),
+        nonexistent=pd.Timedelta(hours=1)
+    ).tz_convert(_UTC)
+
+
+# Prediction window for each local hour 0-23
+_WINDOW_BY_HOUR = (
+    ('pre_9am',) * 9        # 12am-8:59am
+    + ('9am_hour', '10am_hour')
+    + ('post_10am',) * 8    # 11am-6:59pm
+    + ('evening',) * 5      # 7pm-11:59pm
+)
+
+
 def get_current_prediction_window(current_time_utc: datetime, ticker_symbol: str = 'NQ=F') -> str:
     """
     Determine which prediction time window we're currently in
@@ -256,19 +354,7 @@ def get_current_prediction_window(current_time_utc: datetime, ticker_symbol: str
         - 'post_10am': 11:00am-6:59pm local
         - 'evening': 7:00pm-11:59pm local
     """
-    local_time = get_ticker_time(current_time_utc, ticker_symbol)
-    hour = local_time.hour
-
-    if hour < 9:
-        return 'pre_9am'
-    elif hour == 9:
-        return '9am_hour'
-    elif hour == 10:
-        return '10am_hour'
-    elif 11 <= hour < 19:  # 11am to 6:59pm
-        return 'post_10am'
-    else:  # 7pm to 11:59pm
-        return 'evening'
+    return _WINDOW_BY_HOUR[get_ticker_time(current_time_utc, ticker_symbol).hour]
 
 
 def format_time_until(target_time: datetime, current_time: datetime) -> str:
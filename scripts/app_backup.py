@@ -1,11 +1,18 @@
 import os
 import logging
 import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from flask import Flask, render_template, jsonify
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pytz
 from dotenv import load_dotenv
 
@@ -16,14 +23,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+TRACEBACK_LOG_INTERVAL = 60  # seconds between tracebacks logged from the same call site
+
+
+class TracebackThrottle(logging.Filter):
+    """
+    Drop the traceback from repeat error logs at the same call site.
+
+    The message is still logged every time; only the first traceback per
+    interval is formatted, so a burst of upstream failures doesn't pay for
+    formatting the same stack on every request.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self._last_logged: Dict[tuple, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.exc_info:
+            site = (record.pathname, record.lineno)
+            now = time.monotonic()
+            if now - self._last_logged.get(site, float('-inf')) < self.interval:
+                record.exc_info = None
+                record.exc_text = None
+            else:
+                self._last_logged[site] = now
+        return True
+
+
+logger.addFilter(TracebackThrottle(TRACEBACK_LOG_INTERVAL))
+
 load_dotenv()
 
+
+_ORJSON_OPTION = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _dump_json_bytes(obj):
+    """Serialize obj to JSON bytes the same way jsonify does"""
+    return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_ORJSON_OPTION)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider serializing with orjson; numpy scalars from pandas need no conversion"""
+    # Never sort keys or pretty-print, in debug mode included
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        return _dump_json_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Constants
 APP_VERSION = '1.0.0'
 CACHE_DURATION = 900  # seconds (15 minutes)
 ALLOWED_TICKERS = ['NQ=F', '^NDX', '^FTSE']
+DASHBOARD_TICKERS = ['NQ=F', '^NDX']  # Tickers served by /api/data
+SIGNATURE_RECHECK_SECONDS = 30 * 60  # Check upstream for new bars at every 30-minute candle open
+
+# Timezones, resolved once
+_UTC = timezone.utc
+_EASTERN = pytz.timezone('US/Eastern')
 
 # Data fetching configuration
 HIST_PERIOD_HOURLY = '30d'  # Period for hourly data
@@ -50,28 +117,197 @@ assert abs(_weights_sum - 1.0) < 0.001, f"Weights must sum to 1.0, got {_weights
 
 # Thread-safe cache
 class ThreadSafeCache:
+    # Reads are lock-free: the entry is one (data, timestamp, refreshed_at, data_json,
+    # signature, checked_at) tuple that set() replaces in a single attribute assignment
     def __init__(self):
-        self._cache = {'data': None, 'timestamp': None}
+        # timestamp is wall time for display; refreshed_at is monotonic for expiry;
+        # data_json is data serialized once so cache hits don't re-serialize it;
+        # signature identifies the upstream data the entry was built from and
+        # checked_at is the wall time (epoch) it was last confirmed current
+        self._state = (None, None, None, None, None, None)
         self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # Held while one thread rebuilds an expired entry
 
     def get(self):
+        data, timestamp = self._state[:2]
+        return data, timestamp
+
+    def set(self, data, timestamp, signature=None):
+        self._store(data, timestamp, signature)
+
+    def _store(self, data, timestamp, signature=None):
+        data_json = _dump_json_bytes(data)
         with self._lock:
-            return self._cache['data'], self._cache['timestamp']
+            self._state = state = (data, timestamp, time.monotonic(), data_json, signature, time.time())
+        return state
 
-    def set(self, data, timestamp):
+    def _extend(self, state):
+        """Restart the entry's expiry without rebuilding it"""
         with self._lock:
-            self._cache['data'] = data
-            self._cache['timestamp'] = timestamp
+            self._state = state = state[:2] + (time.monotonic(),) + state[3:5] + (time.time(),)
+        return state
+
+    @staticmethod
+    def _fresh(state, duration, recheck_seconds=None):
+        data, _, refreshed_at, _, _, checked_at = state
+        if data is None or refreshed_at is None or time.monotonic() - refreshed_at >= duration:
+            return False
+        # Also stale once a new recheck slot (e.g. a new 30-minute candle) has started
+        return not recheck_seconds or time.time() // recheck_seconds == checked_at // recheck_seconds
 
     def is_valid(self, duration):
-        with self._lock:
-            if self._cache['data'] is None or self._cache['timestamp'] is None:
-                return False
-            time_diff = (datetime.now() - self._cache['timestamp']).total_seconds()
-            return time_diff < duration
+        return self._fresh(self._state, duration)
+
+    def get_or_refresh(self, producer, duration, probe=None, recheck_seconds=None):
+        """
+        Return the cached entry, rebuilding it with producer() once if expired
+
+        Concurrent callers that find the entry expired wait for the single
+        rebuild instead of each calling producer().
+
+        Args:
+            producer: Callable building fresh data
+            duration: Seconds an entry is served without checking upstream
+            probe: Optional cheap callable returning a signature of the upstream
+                data (None if unknown). An expired entry whose signature still
+                matches is extended instead of rebuilt.
+            recheck_seconds: With a probe, also check upstream whenever a new
+                wall-clock slot of this length starts, even before expiry
+
+        Returns:
+            Tuple of (data, data_json, timestamp, cached) where data_json is
+            data already serialized to JSON bytes
+        """
+        state = self._state
+        if self._fresh(state, duration, recheck_seconds):
+            return state[0], state[3], state[1], True
+
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            state = self._state
+            if self._fresh(state, duration, recheck_seconds):
+                return state[0], state[3], state[1], True
+
+            signature = probe() if probe is not None else None
+            if signature is not None and state[0] is not None and signature == state[4]:
+                # Upstream hasn't moved on since the entry was built
+                state = self._extend(state)
+                return state[0], state[3], state[1], True
+
+            timestamp = datetime.now()
+            state = self._store(producer(), timestamp, signature)
+            return state[0], state[3], state[1], False
 
 cache = ThreadSafeCache()
 
+# yfinance Ticker objects and history results, shared across requests
+_ticker_registry = {}
+_history_cache = {}  # (symbol, period, interval) -> (DataFrame, monotonic fetch time)
+_yf_lock = threading.Lock()
+
+
+def _get_ticker(symbol):
+    """Return a shared yf.Ticker for the symbol"""
+    ticker = _ticker_registry.get(symbol)
+    if ticker is None:
+        with _yf_lock:
+            ticker = _ticker_registry.setdefault(symbol, yf.Ticker(symbol))
+    return ticker
+
+
+def _get_history(symbol, period, interval):
+    """Return ticker history, reusing a fetch younger than CACHE_DURATION"""
+    key = (symbol, period, interval)
+    cached = _history_cache.get(key)
+    if cached is not None and time.monotonic() - cached[1] < CACHE_DURATION:
+        return cached[0]
+
+    hist = _get_ticker(symbol).history(period=period, interval=interval)
+    if not hist.empty:  # Don't pin a failed fetch for the whole TTL
+        _history_cache[key] = (hist, time.monotonic())
+    return hist
+
+
+def _bulk_fetch(symbols, period, interval):
+    """
+    Download history for several symbols in one request and seed the history cache
+
+    Returns:
+        Dictionary of {symbol: DataFrame}; symbols missing from the download are omitted
+    """
+    df = yf.download(
+        tickers=' '.join(symbols),
+        period=period,
+        interval=interval,
+        group_by='ticker',
+        auto_adjust=True,   # Match Ticker.history() defaults
+        ignore_tz=False,    # Keep tz-aware indexes like Ticker.history()
+        threads=True,
+        progress=False,
+        prepost=False
+    )
+
+    result = {}
+    if df is None or df.empty:
+        return result
+
+    fetched_at = time.monotonic()
+    for symbol in symbols:
+        if symbol not in df.columns.get_level_values(0):
+            continue
+        # Rows are the union of all symbols' timestamps; drop the other symbols' rows
+        hist = df[symbol].dropna(how='all')
+        if not hist.empty:
+            result[symbol] = hist
+            _history_cache[(symbol, period, interval)] = (hist, fetched_at)
+    return result
+
+
+def _latest_bar_signature(symbols):
+    """
+    Newest 5-minute bar time per symbol; a cheap check of whether upstream data has moved on
+
+    Returns:
+        Tuple of timestamps aligned with symbols, or None if the download failed
+    """
+    try:
+        df = yf.download(
+            tickers=' '.join(symbols),
+            period='1d',
+            interval='5m',
+            group_by='ticker',
+            auto_adjust=True,
+            ignore_tz=False,
+            threads=True,
+            progress=False,
+            prepost=False
+        )
+    except Exception as e:
+        logger.warning(f"Latest bar probe failed: {str(e)}")
+        return None
+
+    if df is None or df.empty:
+        return None
+
+    fetched = set(df.columns.get_level_values(0))
+    return tuple(
+        df[symbol].dropna(how='all').index.max() if symbol in fetched else None
+        for symbol in symbols
+    )
+
+
+def _market_data_signature():
+    """Signature of the upstream data behind get_market_data()"""
+    return _latest_bar_signature(DASHBOARD_TICKERS)
+
+
+# (period, interval) pairs read per ticker by get_reference_levels and get_session_range
+_MARKET_DATA_FETCHES = (
+    (HIST_PERIOD_HOURLY, HIST_INTERVAL_HOURLY),
+    (HIST_PERIOD_MINUTE, HIST_INTERVAL_MINUTE),
+    ('2d', '5m'),
+)
+
 # Trading session hours (in UTC)
 TRADING_SESSIONS = {
     'NQ=F': {
@@ -104,6 +340,20 @@ TRADING_SESSIONS = {
 }
 
 
+def _is_utc(tz):
+    """True for any UTC tzinfo (pytz, zoneinfo or datetime.timezone.utc)"""
+    return str(tz) == 'UTC'
+
+
+def _as_utc(timestamp):
+    """Return timestamp as aware UTC; naive values are taken as UTC and UTC values pass through unconverted"""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=_UTC)
+    if _is_utc(timestamp.tzinfo):
+        return timestamp
+    return timestamp.astimezone(_UTC)
+
+
 def is_within_trading_session(timestamp, ticker_symbol):
     """Check if a timestamp falls within the trading session for a given ticker"""
     if ticker_symbol not in TRADING_SESSIONS:
@@ -111,11 +361,7 @@ def is_within_trading_session(timestamp, ticker_symbol):
 
     session = TRADING_SESSIONS[ticker_symbol]
 
-    # Convert timestamp to UTC if not already
-    if timestamp.tzinfo is None:
-        timestamp = pytz.UTC.localize(timestamp)
-    else:
-        timestamp = timestamp.astimezone(pytz.UTC)
+    timestamp = _as_utc(timestamp)
 
     hour = timestamp.hour + timestamp.minute / 60.0
 
@@ -136,50 +382,86 @@ def is_within_trading_session(timestamp, ticker_symbol):
         return session['main_session_start'] <= hour <= session['main_session_end']
 
 
+def _naive_utc_index(index):
+    """Return a DatetimeIndex as naive UTC; comparisons and field access are much faster without tz"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        return index
+    if _is_utc(index.tz):
+        return index.tz_localize(None)
+    return index.tz_convert('UTC').tz_localize(None)
+
+
+def _session_mask_fn(session):
+    """Build a mask function of (hours, dow) arrays with the session's branch resolved up front"""
+    if session['type'] == 'futures' and not session['uses_main_only']:
+        # Open except the daily 21:00-22:00 break and Saturday 21:00 to Sunday 22:00
+        return lambda hours, dow: (
+            ~((dow == 5) & (hours >= 21.0))
+            & ~((dow == 6) & (hours < 22.0))
+            & ~((dow < 5) & (hours >= 21.0) & (hours < 22.0))
+        )
+
+    start = session['main_session_start']
+    end = session['main_session_end']
+    return lambda hours, dow: (dow < 5) & (hours >= start) & (hours <= end)
+
+
+_SESSION_FNS = {symbol: _session_mask_fn(session) for symbol, session in TRADING_SESSIONS.items()}
+
+
 def filter_trading_session_data(hist, ticker_symbol):
     """Filter historical data to only include trading session hours"""
     if hist.empty:
         return hist
 
-    # Apply trading session filter
-    mask = hist.index.map(lambda x: is_within_trading_session(x, ticker_symbol))
-    filtered_hist = hist[mask]
+    if ticker_symbol not in _SESSION_FNS:
+        return hist  # If no session defined, include all data
+
+    # Same rules as is_within_trading_session, evaluated over the whole index at once
+    index_utc = _naive_utc_index(hist.index)
+    hours = index_utc.hour.to_numpy() + index_utc.minute.to_numpy() / 60.0
+    dow = index_utc.dayofweek.to_numpy()
 
-    return filtered_hist
+    return hist[_SESSION_FNS[ticker_symbol](hours, dow)]
+
+
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def _floor_to_interval(ts_ns, interval_minutes):
+    """Floor epoch nanoseconds (an int or int64 array) to the start of their candle"""
+    step = interval_minutes * _NS_PER_MINUTE
+    return (ts_ns // step) * step
 
 
 def get_candle_open_time(current_time, interval_minutes):
     """
     Calculate the opening time of the current candle based on clock timing.
 
+    Candles are aligned to the UTC epoch, so 4-hourly candles open at
+    00:00, 04:00, ... UTC and the shorter intervals on the hour.
+
     Args:
         current_time: datetime object in UTC
         interval_minutes: candle interval in minutes (3, 5, 30, 60, 240)
 
     Returns:
-        datetime object representing the candle open time
+        pandas Timestamp representing the candle open time
 
     Example:
         If current_time is 14:37 and interval is 5 minutes:
         Returns 14:35 (the start of the 14:35-14:40 candle)
     """
-    if interval_minutes == 240:  # 4-hourly
-        candle_hour = (current_time.hour // 4) * 4
-        return current_time.replace(hour=candle_hour, minute=0, second=0, microsecond=0)
-    elif interval_minutes == 60:  # Hourly
-        return current_time.replace(minute=0, second=0, microsecond=0)
-    else:  # 3, 5, 30 minutes
-        candle_minute = (current_time.minute // interval_minutes) * interval_minutes
-        return current_time.replace(minute=candle_minute, second=0, microsecond=0)
+    current_time = pd.Timestamp(current_time)
+    return pd.Timestamp(_floor_to_interval(current_time.value, interval_minutes), tz=current_time.tzinfo)
 
 
 def get_reference_levels(ticker_symbol):
     """Calculate all reference levels for a given ticker"""
     try:
-        ticker = yf.Ticker(ticker_symbol)
-
         # Fetch hourly data
-        hist = ticker.history(period=HIST_PERIOD_HOURLY, interval=HIST_INTERVAL_HOURLY)
+        hist = _get_history(ticker_symbol, HIST_PERIOD_HOURLY, HIST_INTERVAL_HOURLY)
 
         if hist.empty:
             return None
@@ -191,7 +473,7 @@ def get_reference_levels(ticker_symbol):
             return None
 
         # Fetch 1-minute data for small timeframe calculations
-        hist_1m = ticker.history(period=HIST_PERIOD_MINUTE, interval=HIST_INTERVAL_MINUTE)
+        hist_1m = _get_history(ticker_symbol, HIST_PERIOD_MINUTE, HIST_INTERVAL_MINUTE)
 
         # Filter 1-minute data to trading session hours
         hist_1m = filter_trading_session_data(hist_1m, ticker_symbol)
@@ -200,131 +482,89 @@ def get_reference_levels(ticker_symbol):
         current_price = hist['Close'].iloc[-1]
         current_time = hist.index[-1]
 
-        # Convert to UTC if not already
-        if current_time.tzinfo is None:
-            current_time = pytz.UTC.localize(current_time)
-        else:
-            current_time = current_time.astimezone(pytz.UTC)
+        current_time = _as_utc(current_time)
 
-        # Get daily data for previous day high/low
-        daily_hist = ticker.history(period='7d', interval='1d')
+        reference_levels = {}
 
-        # Filter daily data to trading session days
-        daily_hist = filter_trading_session_data(daily_hist, ticker_symbol)
+        # hist is sorted by time; locate reference times by binary search instead of masking.
+        # Searches run on a naive UTC copy of the index (hist itself is shared via the
+        # history cache and is left untouched), so reference times drop their UTC tzinfo.
+        idx = _naive_utc_index(hist.index)
+        opens = hist['Open'].to_numpy()
 
-        reference_levels = {}
+        def position(t):
+            return idx.searchsorted(t.replace(tzinfo=None), side='left')
+
+        def open_at_or_after(t):
+            pos = position(t)
+            return opens[pos] if pos < len(opens) else None
 
-        # Previous Day High/Low
-        if len(daily_hist) >= 2:
-            prev_day = daily_hist.iloc[-2]
-            reference_levels['prev_day_high'] = prev_day['High']
-            reference_levels['prev_day_low'] = prev_day['Low']
+        def candle_open(t):
+            # First candle at/after t, falling back to the last candle before it
+            pos = position(t)
+            if pos < len(opens):
+                return opens[pos]
+            return opens[-1] if len(opens) else None
+
+        # Midnight ET for the current day (with proper DST handling); today's candles start here
+        current_time_et = current_time.astimezone(_EASTERN)
+        et_midnight_naive = current_time_et.replace(hour=0, minute=0, second=0, microsecond=0)
+        et_midnight = _EASTERN.normalize(_EASTERN.localize(et_midnight_naive.replace(tzinfo=None)))
+        et_midnight_utc = et_midnight.astimezone(_UTC)
+        today_pos = position(et_midnight_utc)
+
+        # Previous Day High/Low from the hourly candles of the last ET day before today
+        # that has any (skips weekends and holidays without a separate daily download)
+        if today_pos > 0:
+            prev_day_start = (
+                idx[today_pos - 1].tz_localize(_UTC).tz_convert(_EASTERN).normalize().tz_convert(_UTC)
+            )
+            prev_pos = position(prev_day_start)
+            reference_levels['prev_day_high'] = hist['High'].to_numpy()[prev_pos:today_pos].max()
+            reference_levels['prev_day_low'] = hist['Low'].to_numpy()[prev_pos:today_pos].min()
         else:
             reference_levels['prev_day_high'] = None
             reference_levels['prev_day_low'] = None
 
         # 30-Minute Open (current 30-minute candle opening price based on clock timing)
         candle_30m_time = get_candle_open_time(current_time, 30)
-        thirty_min_data = hist[hist.index >= candle_30m_time]
-        if not thirty_min_data.empty:
-            reference_levels['30_min_open'] = thirty_min_data['Open'].iloc[0]
-        else:
-            # Fallback: find nearest candle
-            nearby_data = hist[hist.index <= candle_30m_time]
-            if not nearby_data.empty:
-                reference_levels['30_min_open'] = nearby_data['Open'].iloc[-1]
-            else:
-                reference_levels['30_min_open'] = None
+        reference_levels['30_min_open'] = candle_open(candle_30m_time)
 
         # Hourly Open (current hourly candle opening price based on clock timing)
         candle_1h_time = get_candle_open_time(current_time, 60)
-        hourly_data = hist[hist.index >= candle_1h_time]
-        if not hourly_data.empty:
-            reference_levels['hourly_open'] = hourly_data['Open'].iloc[0]
-        else:
-            # Fallback: find nearest candle
-            nearby_data = hist[hist.index <= candle_1h_time]
-            if not nearby_data.empty:
-                reference_levels['hourly_open'] = nearby_data['Open'].iloc[-1]
-            else:
-                reference_levels['hourly_open'] = None
+        reference_levels['hourly_open'] = candle_open(candle_1h_time)
 
         # 4-Hourly Open (current 4-hourly candle opening price based on clock timing)
         candle_4h_time = get_candle_open_time(current_time, 240)
-        four_hourly_data = hist[hist.index >= candle_4h_time]
-        if not four_hourly_data.empty:
-            reference_levels['4_hourly_open'] = four_hourly_data['Open'].iloc[0]
-        else:
-            # Fallback: find nearest candle
-            nearby_data = hist[hist.index <= candle_4h_time]
-            if not nearby_data.empty:
-                reference_levels['4_hourly_open'] = nearby_data['Open'].iloc[-1]
-            else:
-                reference_levels['4_hourly_open'] = None
-
-        # Daily Open (Midnight ET with proper DST handling)
-        eastern = pytz.timezone('US/Eastern')
-        current_time_et = current_time.astimezone(eastern)
-
-        # Get midnight ET for current day
-        et_midnight_naive = current_time_et.replace(hour=0, minute=0, second=0, microsecond=0)
-        et_midnight = eastern.normalize(eastern.localize(et_midnight_naive.replace(tzinfo=None)))
-        et_midnight_utc = et_midnight.astimezone(pytz.UTC)
+        reference_levels['4_hourly_open'] = candle_open(candle_4h_time)
 
-        daily_open_data = hist[hist.index >= et_midnight_utc]
-        if not daily_open_data.empty:
-            reference_levels['daily_open'] = daily_open_data['Open'].iloc[0]
-        else:
-            reference_levels['daily_open'] = None
+        # Daily Open: today's hourly candles from midnight ET to now; the first one is the
+        # daily open and the slice is reused for volatility
+        today_hourly_data = hist.iloc[today_pos:]
+        reference_levels['daily_open'] = (
+            today_hourly_data['Open'].iloc[0] if not today_hourly_data.empty else None
+        )
 
         # Weekly Open (Monday 00:00 UTC this week)
         days_since_monday = current_time.weekday()
         week_start = (current_time - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-        weekly_open_data = hist[hist.index >= week_start]
-        if not weekly_open_data.empty:
-            reference_levels['weekly_open'] = weekly_open_data['Open'].iloc[0]
-        else:
-            reference_levels['weekly_open'] = None
+        reference_levels['weekly_open'] = open_at_or_after(week_start)
 
         # Monthly Open (1st of month 00:00 UTC)
         month_start = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        monthly_open_data = hist[hist.index >= month_start]
-        if not monthly_open_data.empty:
-            reference_levels['monthly_open'] = monthly_open_data['Open'].iloc[0]
-        else:
-            reference_levels['monthly_open'] = None
+        reference_levels['monthly_open'] = open_at_or_after(month_start)
 
         # Previous Week Open (Previous Monday 00:00 UTC)
         prev_week_start = week_start - timedelta(days=7)
-        prev_week_data = hist[(hist.index >= prev_week_start) & (hist.index < week_start)]
-        if not prev_week_data.empty:
-            reference_levels['prev_week_open'] = prev_week_data['Open'].iloc[0]
-        else:
-            reference_levels['prev_week_open'] = None
+        lo, hi = position(prev_week_start), position(week_start)
+        reference_levels['prev_week_open'] = opens[lo] if lo < hi else None
 
         # Midnight Open (00:00 UTC today) - already calculated as daily_open
         midnight_open = reference_levels.get('daily_open')
 
         # NY 9:30 AM Open (13:30 UTC / 9:30 AM ET)
         ny_open_time = current_time.replace(hour=13, minute=30, second=0, microsecond=0)
-        ny_open_data = hist[hist.index >= ny_open_time]
-        ny_open = ny_open_data['Open'].iloc[0] if not ny_open_data.empty else None
-
-        # Today's hourly price movement from midnight ET to now
-        # Use the same et_midnight_utc calculated above
-        today_hourly_data = hist[hist.index >= et_midnight_utc]
-
-        hourly_movement = []
-        if not today_hourly_data.empty:
-            for idx, row in today_hourly_data.iterrows():
-                hourly_movement.append({
-                    'time': idx.strftime('%H:%M UTC'),
-                    'open': row['Open'],
-                    'high': row['High'],
-                    'low': row['Low'],
-                    'close': row['Close'],
-                    'change_from_midnight': row['Close'] - midnight_open if midnight_open else 0
-                })
+        ny_open = open_at_or_after(ny_open_time)
 
         return {
             'current_price': current_price,
@@ -332,7 +572,7 @@ def get_reference_levels(ticker_symbol):
             'reference_levels': reference_levels,
             'midnight_open': midnight_open,
             'ny_open': ny_open,
-            'hourly_movement': hourly_movement  # Still calculated for volatility purposes
+            'today_hourly': today_hourly_data
         }
 
     except Exception as e:
@@ -340,7 +580,7 @@ def get_reference_levels(ticker_symbol):
         return None
 
 
-def get_session_range(ticker_symbol, session_start_hour, session_start_minute, session_end_hour, session_end_minute, current_time):
+def get_session_range(ticker_symbol, session_start_hour, session_start_minute, session_end_hour, session_end_minute, current_time, hist=None, today_start=None):
     """
     Calculate the HIGH and LOW range for a specific trading session from start until current time (live range)
     Based on ICT Killzone methodology - "Live Trading Hours Until To Close"
@@ -352,20 +592,23 @@ def get_session_range(ticker_symbol, session_start_hour, session_start_minute, s
         session_end_hour: End hour in UTC (0-23)
         session_end_minute: End minute (0-59)
         current_time: Current timestamp in UTC
+        hist: Pre-fetched 5-minute data to slice; fetched when not given
+        today_start: Midnight UTC of current_time's day; derived when not given
 
     Returns:
         Dictionary with high, low, and range, or None if data unavailable
     """
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        # Fetch intraday data (5-minute intervals for better granularity)
-        hist = ticker.history(period='2d', interval='5m')
+        if hist is None:
+            # Fetch intraday data (5-minute intervals for better granularity)
+            hist = _get_history(ticker_symbol, '2d', '5m')
 
         if hist.empty:
             return None
 
-        # Get today's date in UTC
-        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        if today_start is None:
+            # Get today's date in UTC
+            today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Define session start and end times
         session_start = today_start.replace(hour=session_start_hour, minute=session_start_minute)
@@ -375,14 +618,16 @@ def get_session_range(ticker_symbol, session_start_hour, session_start_minute, s
         # This creates a dynamic range that grows as the session progresses
         range_end_time = min(current_time, session_end)
 
-        # Get data for the session (from start until current time or session end)
-        session_data = hist[(hist.index >= session_start) & (hist.index <= range_end_time)]
+        # Get data for the session (from start until current time or session end);
+        # the index is sorted, so locate the bounds instead of masking every row
+        lo = hist.index.searchsorted(session_start, side='left')
+        hi = hist.index.searchsorted(range_end_time, side='right')
 
-        if session_data.empty:
+        if lo >= hi:
             return None
 
-        session_high = session_data['High'].max()
-        session_low = session_data['Low'].min()
+        session_high = hist['High'].iloc[lo:hi].max()
+        session_low = hist['Low'].iloc[lo:hi].min()
 
         return {
             'high': session_high,
@@ -413,6 +658,33 @@ def analyze_price_vs_range(current_price, session_range):
         return 'WITHIN'
 
 
+_MINUTES_PER_DAY = 24 * 60
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# NQ=F Futures: Sunday 6:00 PM - Friday 5:00 PM ET (nearly 24/5), keyed on minutes since Monday 00:00 ET.
+# Closed from Friday 5:00 PM to Sunday 6:00 PM
+_NQ_BOUNDS = (4 * _MINUTES_PER_DAY + 17 * 60, 6 * _MINUTES_PER_DAY + 18 * 60)
+_NQ_STATUSES = (
+    ('OPEN', None),
+    ('CLOSED', 'Sunday 6:00 PM ET'),
+    ('OPEN', None),
+)
+
+# NDX Cash Index: NYSE hours 9:30 AM - 4:00 PM ET, Monday-Friday, keyed on minutes since midnight ET.
+# Bounds are pre-market start (4:00 AM), open (9:30 AM), close (4:00 PM) and after-hours end (8:00 PM)
+_NDX_BOUNDS = (4 * 60, 9 * 60 + 30, 16 * 60, 20 * 60)
+_NDX_STATUSES = tuple(
+    (('CLOSED', 'Monday 9:30 AM ET'),) * (len(_NDX_BOUNDS) + 1) if weekday >= 5 else (
+        ('CLOSED', f'{_WEEKDAY_NAMES[weekday]} 9:30 AM ET'),
+        ('PRE-MARKET', f'{_WEEKDAY_NAMES[weekday]} 9:30 AM ET'),
+        ('OPEN', None),
+        ('AFTER-HOURS', 'Next trading day 9:30 AM ET'),
+        ('CLOSED', 'Next trading day 9:30 AM ET'),
+    )
+    for weekday in range(7)
+)
+
+
 def get_market_status(ticker_symbol, current_time):
     """
     Determine if the market is open, closed, pre-market, or after-hours
@@ -426,88 +698,24 @@ def get_market_status(ticker_symbol, current_time):
     """
     try:
         # Convert to US Eastern Time
-        eastern = pytz.timezone('US/Eastern')
-        current_time_et = current_time.astimezone(eastern)
+        current_time_et = current_time.astimezone(_EASTERN)
 
         # Get current day of week (0=Monday, 6=Sunday)
         weekday = current_time_et.weekday()
-        current_hour = current_time_et.hour
-        current_minute = current_time_et.minute
-        current_time_minutes = current_hour * 60 + current_minute
-
-        # Market hours in ET (in minutes from midnight)
-        pre_market_start = 4 * 60  # 4:00 AM
-        market_open = 9 * 60 + 30   # 9:30 AM
-        market_close = 16 * 60      # 4:00 PM
-        after_hours_end = 20 * 60   # 8:00 PM
+        current_time_minutes = current_time_et.hour * 60 + current_time_et.minute
 
         if ticker_symbol == 'NQ=F':
-            # NQ=F Futures: Sunday 6:00 PM - Friday 5:00 PM ET (nearly 24/5)
-            # Closed: Friday 5:00 PM - Sunday 6:00 PM
-
-            if weekday == 4 and current_time_minutes >= 17 * 60:  # Friday after 5:00 PM
-                return {
-                    'status': 'CLOSED',
-                    'next_open': 'Sunday 6:00 PM ET'
-                }
-            elif weekday == 5:  # Saturday (all day closed)
-                return {
-                    'status': 'CLOSED',
-                    'next_open': 'Sunday 6:00 PM ET'
-                }
-            elif weekday == 6 and current_time_minutes < 18 * 60:  # Sunday before 6:00 PM
-                return {
-                    'status': 'CLOSED',
-                    'next_open': 'Sunday 6:00 PM ET'
-                }
-            else:
-                return {
-                    'status': 'OPEN',
-                    'next_open': None
-                }
-
+            week_minutes = weekday * _MINUTES_PER_DAY + current_time_minutes
+            status, next_open = _NQ_STATUSES[bisect_right(_NQ_BOUNDS, week_minutes)]
         elif ticker_symbol == '^NDX':
-            # NDX Cash Index: NYSE hours 9:30 AM - 4:00 PM ET, Monday-Friday
-
-            # Weekend check
-            if weekday >= 5:  # Saturday or Sunday
-                return {
-                    'status': 'CLOSED',
-                    'next_open': 'Monday 9:30 AM ET'
-                }
-
-            # Weekday checks
-            if current_time_minutes < pre_market_start:
-                return {
-                    'status': 'CLOSED',
-                    'next_open': f'{current_time_et.strftime("%A")} 9:30 AM ET'
-                }
-            elif pre_market_start <= current_time_minutes < market_open:
-                return {
-                    'status': 'PRE-MARKET',
-                    'next_open': f'{current_time_et.strftime("%A")} 9:30 AM ET'
-                }
-            elif market_open <= current_time_minutes < market_close:
-                return {
-                    'status': 'OPEN',
-                    'next_open': None
-                }
-            elif market_close <= current_time_minutes < after_hours_end:
-                return {
-                    'status': 'AFTER-HOURS',
-                    'next_open': 'Next trading day 9:30 AM ET'
-                }
-            else:
-                return {
-                    'status': 'CLOSED',
-                    'next_open': 'Next trading day 9:30 AM ET'
-                }
-
+            status, next_open = _NDX_STATUSES[weekday][bisect_right(_NDX_BOUNDS, current_time_minutes)]
         else:
-            return {
-                'status': 'UNKNOWN',
-                'next_open': None
-            }
+            status, next_open = 'UNKNOWN', None
+
+        return {
+            'status': status,
+            'next_open': next_open
+        }
 
     except Exception as e:
         logger.error(f"Error determining market status for {ticker_symbol}: {str(e)}", exc_info=True)
@@ -517,29 +725,52 @@ def get_market_status(ticker_symbol, current_time):
         }
 
 
+def _level_arrays(reference_levels):
+    """
+    Reference levels as arrays aligned with the dict's key order
+
+    Returns:
+        Tuple of (keys, values, levels, present) where levels is a float array
+        with NaN for missing levels and present marks levels that are not None
+    """
+    keys = list(reference_levels)
+    values = list(reference_levels.values())
+    present = np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+    levels = np.fromiter(
+        (v if v is not None else np.nan for v in values), dtype=float, count=len(values)
+    )
+    return keys, values, levels, present
+
+
+@lru_cache(maxsize=8)
+def _weight_vector(keys):
+    """Read-only WEIGHTS vector for a tuple of level keys; reference levels always arrive in the same order"""
+    weights = np.fromiter((WEIGHTS[key] for key in keys), dtype=float, count=len(keys))
+    weights.flags.writeable = False
+    return weights
+
+
 def calculate_signals(current_price, reference_levels):
     """Calculate signals, weighted score, prediction, and confidence"""
-    signals = {}
-    weighted_score = 0.0
-    valid_signals = 0
+    keys, values, levels, present = _level_arrays(reference_levels)
+    weights = _weight_vector(tuple(keys))
 
-    for key, ref_level in reference_levels.items():
-        if ref_level is not None:
-            # Signal = 1 if current price > reference, else 0
-            signal = 1 if current_price > ref_level else 0
-            distance = current_price - ref_level
-            status = 'BULLISH' if signal == 1 else 'BEARISH'
+    # Signal = 1 if current price > reference, else 0 (missing levels contribute nothing)
+    bullish = present & (current_price > levels)
+    weighted_score = float(np.dot(bullish, weights))
+    valid_signals = int(present.sum())
+    bullish_count = int(bullish.sum())
 
+    signals = {}
+    for i, key in enumerate(keys):
+        if present[i]:
+            signal = int(bullish[i])
             signals[key] = {
                 'signal': signal,
-                'reference_level': ref_level,
-                'distance': distance,
-                'status': status
+                'reference_level': values[i],
+                'distance': current_price - values[i],
+                'status': 'BULLISH' if signal == 1 else 'BEARISH'
             }
-
-            # Add to weighted score
-            weighted_score += signal * WEIGHTS[key]
-            valid_signals += 1
         else:
             signals[key] = {
                 'signal': None,
@@ -552,9 +783,6 @@ def calculate_signals(current_price, reference_levels):
     prediction = 'BULLISH' if weighted_score >= 0.5 else 'BEARISH'
     confidence = abs((weighted_score - 0.5) / 0.5) * 100
 
-    # Count bullish signals
-    bullish_count = sum(1 for s in signals.values() if s['signal'] == 1)
-
     return {
         'signals': signals,
         'weighted_score': weighted_score,
@@ -605,36 +833,38 @@ def calculate_confidence_horizons(base_confidence):
     return horizons
 
 
-def calculate_volatility(hourly_movement):
+def calculate_volatility(today_hourly):
     """
     Calculate current volatility from hourly price movements
 
     Args:
-        hourly_movement: List of hourly OHLC data
+        today_hourly: DataFrame of today's hourly OHLC data
 
     Returns:
         Dictionary with volatility metrics
     """
-    if not hourly_movement or len(hourly_movement) < 2:
+    if today_hourly is None or len(today_hourly) < 2:
         return {
             'hourly_range_pct': 0,
             'level': 'UNKNOWN'
         }
 
-    # Calculate average hourly range as percentage
-    ranges = []
-    for candle in hourly_movement:
-        if candle['high'] and candle['low'] and candle['open']:
-            range_pct = abs((candle['high'] - candle['low']) / candle['open']) * 100
-            ranges.append(range_pct)
+    # Calculate average hourly range as percentage, skipping zero or missing prices
+    opens = today_hourly['Open'].to_numpy(dtype=float)
+    highs = today_hourly['High'].to_numpy(dtype=float)
+    lows = today_hourly['Low'].to_numpy(dtype=float)
+    valid = (
+        np.isfinite(opens) & np.isfinite(highs) & np.isfinite(lows)
+        & (opens != 0) & (highs != 0) & (lows != 0)
+    )
 
-    if not ranges:
+    if not valid.any():
         return {
             'hourly_range_pct': 0,
             'level': 'UNKNOWN'
         }
 
-    avg_range_pct = sum(ranges) / len(ranges)
+    avg_range_pct = float(np.mean(np.abs((highs[valid] - lows[valid]) / opens[valid]) * 100))
 
     # Classify volatility level
     if avg_range_pct < 0.5:
@@ -664,17 +894,20 @@ def calculate_risk_metrics(current_price, reference_levels, signals_data):
     Returns:
         Dictionary with risk metrics
     """
-    # Find nearest support level (highest level below current price)
-    supports = []
-    for key, level in reference_levels.items():
-        if level and level < current_price:
-            supports.append({
-                'level': level,
-                'name': key,
-                'distance': current_price - level
-            })
+    keys, values, levels, present = _level_arrays(reference_levels)
+    # Zero levels are treated as missing; NaN compares False on both sides
+    usable = present & (levels != 0)
 
-    nearest_support = min(supports, key=lambda x: x['distance']) if supports else None
+    # Find nearest support level (highest level below current price)
+    below = usable & (levels < current_price)
+    nearest_support = None
+    if below.any():
+        i = int(np.argmin(np.where(below, current_price - levels, np.inf)))
+        nearest_support = {
+            'level': values[i],
+            'name': keys[i],
+            'distance': current_price - values[i]
+        }
 
     # Calculate stop loss (nearest support or 1% below)
     if nearest_support:
@@ -695,16 +928,15 @@ def calculate_risk_metrics(current_price, reference_levels, signals_data):
         # Need to lose enough bullish signals to flip
         signals_to_flip = bullish_count - (total_signals - bullish_count) + 1
 
-        # Find the highest reference level above current price
-        resistances = []
-        for key, level in reference_levels.items():
-            if level and level > current_price:
-                resistances.append({
-                    'level': level,
-                    'name': key
-                })
-
-        flip_level = min(resistances, key=lambda x: x['level']) if resistances else None
+        # Find the lowest reference level above current price
+        above = usable & (levels > current_price)
+        flip_level = None
+        if above.any():
+            i = int(np.argmin(np.where(above, levels, np.inf)))
+            flip_level = {
+                'level': values[i],
+                'name': keys[i]
+            }
     else:
         # BEARISH - need to gain enough bullish signals to flip
         signals_to_flip = (total_signals - bullish_count) - bullish_count + 1
@@ -764,18 +996,22 @@ def process_ticker_data(ticker_symbol: str) -> Optional[Dict[str, Any]]:
         # Asian Session: 2000-0000 EST = 01:00-05:00 UTC
         # London Open: 0200-0500 EST = 07:00-10:00 UTC
         # New York AM: 0830-1100 EST = 13:30-16:00 UTC
-        asia_range = get_session_range(ticker_symbol, 1, 0, 5, 0, data['current_time'])
-        london_range = get_session_range(ticker_symbol, 7, 0, 10, 0, data['current_time'])
-        ny_range = get_session_range(ticker_symbol, 13, 30, 16, 0, data['current_time'])
+        # All three ranges slice the same 5-minute fetch from the same UTC midnight
+        current_time = data['current_time']
+        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        intraday_hist = _get_history(ticker_symbol, '2d', '5m')
+        asia_range = get_session_range(ticker_symbol, 1, 0, 5, 0, current_time, intraday_hist, today_start)
+        london_range = get_session_range(ticker_symbol, 7, 0, 10, 0, current_time, intraday_hist, today_start)
+        ny_range = get_session_range(ticker_symbol, 13, 30, 16, 0, current_time, intraday_hist, today_start)
 
         # Get market status
-        market_status = get_market_status(ticker_symbol, data['current_time'])
+        market_status = get_market_status(ticker_symbol, current_time)
 
         # Calculate confidence horizons
         confidence_horizons = calculate_confidence_horizons(signals['confidence'])
 
         # Calculate volatility
-        volatility = calculate_volatility(data.get('hourly_movement', []))
+        volatility = calculate_volatility(data.get('today_hourly'))
 
         # Calculate risk metrics
         risk_metrics = calculate_risk_metrics(
@@ -786,7 +1022,7 @@ def process_ticker_data(ticker_symbol: str) -> Optional[Dict[str, Any]]:
 
         return {
             'current_price': data['current_price'],
-            'current_time': data['current_time'].strftime('%Y-%m-%d %H:%M:%S %Z'),
+            'current_time': current_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
             'market_status': market_status['status'],
             'next_open': market_status['next_open'],
             'midnight_open': data.get('midnight_open'),
@@ -818,11 +1054,24 @@ def process_ticker_data(ticker_symbol: str) -> Optional[Dict[str, Any]]:
 def get_market_data():
     """Fetch and calculate market data for both instruments"""
     result = {}
+    tickers = DASHBOARD_TICKERS
 
-    # Process both tickers
-    for ticker in ['NQ=F', '^NDX']:
-        ticker_data = process_ticker_data(ticker)
-        result[ticker] = ticker_data if ticker_data else {'error': 'Failed to fetch data'}
+    def prefetch(fetch):
+        period, interval = fetch
+        try:
+            _bulk_fetch(tickers, period, interval)
+        except Exception as e:
+            # Per-ticker fetches fall back to Ticker.history()
+            logger.warning(f"Bulk fetch failed for {period}/{interval}: {str(e)}")
+
+    with ThreadPoolExecutor(max_workers=len(_MARKET_DATA_FETCHES)) as executor:
+        # One download per timeframe for all tickers, all timeframes in flight together;
+        # per-ticker lookups then hit the history cache
+        list(executor.map(prefetch, _MARKET_DATA_FETCHES))
+
+        # Process tickers concurrently
+        for ticker, ticker_data in zip(tickers, executor.map(process_ticker_data, tickers)):
+            result[ticker] = ticker_data if ticker_data else {'error': 'Failed to fetch data'}
 
     return result
 
@@ -833,10 +1082,17 @@ def index():
     return render_template('index.html')
 
 
+# Fixed parts of the healthy /health body, serialized once; only the per-request
+# fields between them are serialized on each probe
+_HEALTHY_PREFIX = b'{"status":"healthy",'
+_HEALTHY_SUFFIX = b',' + _dump_json_bytes({'version': APP_VERSION})[1:] + b'\n'
+
+
 @app.route('/health')
 @app.route('/api/health')
 def health_check():
     """Health check endpoint for monitoring and deployment platforms"""
+    timestamp = datetime.now(_UTC).strftime('%Y-%m-%d %H:%M:%S %Z')
     try:
         cached_data, cached_time = cache.get()
         cache_status = 'healthy' if cached_data is not None else 'empty'
@@ -844,58 +1100,70 @@ def health_check():
         if cached_time is not None:
             cache_age = (datetime.now() - cached_time).total_seconds()
 
-        return jsonify({
-            'status': 'healthy',
-            'timestamp': datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S %Z'),
+        fields = _dump_json_bytes({
+            'timestamp': timestamp,
             'cache_status': cache_status,
-            'cache_age_seconds': cache_age,
-            'version': APP_VERSION
-        }), 200
+            'cache_age_seconds': cache_age
+        })
+        body = _HEALTHY_PREFIX + fields[1:-1] + _HEALTHY_SUFFIX
+        return app.response_class(body, status=200, mimetype=app.json.mimetype)
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}", exc_info=True)
         return jsonify({
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S %Z')
+            'timestamp': timestamp
         }), 500
 
 
+def _data_response(data_json, **fields):
+    """
+    JSON response for {'data': ..., **fields} from data already serialized to bytes
+
+    Only the small per-request fields are serialized; the data body is spliced in as-is.
+    """
+    body = b'{"data":' + data_json + b',' + _dump_json_bytes(fields)[1:] + b'\n'
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
 @app.route('/api/data')
 def api_data():
     """API endpoint to get market data with caching"""
-    request_start = datetime.now()
+    request_start = time.perf_counter()
 
-    # Check if cache is valid
-    if cache.is_valid(CACHE_DURATION):
-        cached_data, cached_time = cache.get()
-        time_diff = (datetime.now() - cached_time).total_seconds()
-        response_time = (datetime.now() - request_start).total_seconds() * 1000  # in milliseconds
-        logger.info(f"Serving cached data (age: {time_diff:.1f}s, response_time: {response_time:.2f}ms)")
-        return jsonify({
-            'data': cached_data,
-            'cached': True,
-            'cache_age': time_diff,
-            'response_time_ms': round(response_time, 2)
-        })
-
-    # Fetch fresh data
     try:
-        logger.info("Fetching fresh market data")
-        current_time = datetime.now()
-        data = get_market_data()
-        cache.set(data, current_time)
+        # Only one request rebuilds an expired cache; concurrent ones wait for it. Expired
+        # entries are only rebuilt when newer bars exist, and a new 30-minute candle
+        # triggers that check early
+        _, data_json, current_time, cached = cache.get_or_refresh(
+            get_market_data,
+            CACHE_DURATION,
+            probe=_market_data_signature,
+            recheck_seconds=SIGNATURE_RECHECK_SECONDS
+        )
 
-        response_time = (datetime.now() - request_start).total_seconds() * 1000  # in milliseconds
+        if cached:
+            time_diff = (datetime.now() - current_time).total_seconds()
+            response_time = (time.perf_counter() - request_start) * 1000  # in milliseconds
+            logger.info(f"Serving cached data (age: {time_diff:.1f}s, response_time: {response_time:.2f}ms)")
+            return _data_response(
+                data_json,
+                cached=True,
+                cache_age=time_diff,
+                response_time_ms=round(response_time, 2)
+            )
+
+        response_time = (time.perf_counter() - request_start) * 1000  # in milliseconds
         logger.info(f"Fresh data fetched successfully (response_time: {response_time:.2f}ms)")
 
-        return jsonify({
-            'data': data,
-            'cached': False,
-            'timestamp': current_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'response_time_ms': round(response_time, 2)
-        })
+        return _data_response(
+            data_json,
+            cached=False,
+            timestamp=current_time.strftime('%Y-%m-%d %H:%M:%S'),
+            response_time_ms=round(response_time, 2)
+        )
     except Exception as e:
-        response_time = (datetime.now() - request_start).total_seconds() * 1000
+        response_time = (time.perf_counter() - request_start) * 1000
         logger.error(f"Error fetching market data (response_time: {response_time:.2f}ms): {str(e)}", exc_info=True)
         return jsonify({
             'error': 'Failed to fetch market data',
@@ -12,11 +12,14 @@ Usage:
 
 import yfinance as yf
 import pandas as pd
-import pytz
 import argparse
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 import sys
 import os
 from dotenv import load_dotenv
@@ -30,7 +33,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from nasdaq_predictor.database.repositories.ticker_repository import TickerRepository
 from nasdaq_predictor.database.repositories.intraday_prediction_repository import IntradayPredictionRepository
 from nasdaq_predictor.database.models.intraday_prediction import IntradayPrediction
-from nasdaq_predictor.analysis.reference_levels import calculate_all_reference_levels
+from nasdaq_predictor.analysis.reference_levels import (
+    calculate_all_reference_levels,
+    calculate_daily_reference_levels
+)
+from nasdaq_predictor.utils.timezone import get_et_midnight, get_week_start, get_month_start
 from nasdaq_predictor.analysis.signals import calculate_signals
 from nasdaq_predictor.analysis.intraday import calculate_intraday_predictions
 
@@ -41,6 +48,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tickers are backfilled concurrently; their downloads are independent
+MAX_BACKFILL_WORKERS = 8
+
+# Yahoo accepts up to 20 symbols per bulk download request
+YF_SYMBOLS_PER_REQUEST = 20
+
+# Random delay between ticker launches (seconds) so requests don't hit Yahoo in one burst
+LAUNCH_JITTER_SECONDS = (0.2, 0.5)
+
+# zoneinfo resolves the offset from the wall time itself, so naive NY times
+# can be tagged with replace() rather than localize()
+_ET = ZoneInfo('America/New_York')
+_UTC = timezone.utc
+
 
 def ensure_timezone(df: pd.DataFrame) -> pd.DataFrame:
     """Ensure DataFrame has UTC timezone-aware index"""
@@ -55,6 +76,92 @@ def ensure_timezone(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _history_periods(hours_back: int) -> Tuple[str, str, str]:
+    """Return the (30-minute, hourly, daily) download periods for a backfill window"""
+    # For 30-min data: need at least 2 days for reference calculations
+    period_30min = f"{min(hours_back, 60)}d"  # yfinance limit
+    period_hourly = f"{min(hours_back * 2, 730)}d"  # More history for reference levels
+    period_daily = "1y"  # Year for daily reference levels
+    return period_30min, period_hourly, period_daily
+
+
+def _download_interval(symbols: List[str], period: str, interval: str) -> Dict[str, pd.DataFrame]:
+    """
+    Download one interval for many symbols with bulk requests.
+
+    Returns:
+        Dictionary of {symbol: UTC-indexed DataFrame}; symbols without data are omitted
+    """
+    logger.info(f"  ⏳ Downloading {interval} data ({period}) for {len(symbols)} tickers...")
+
+    result = {}
+    for start in range(0, len(symbols), YF_SYMBOLS_PER_REQUEST):
+        chunk = symbols[start:start + YF_SYMBOLS_PER_REQUEST]
+        raw = yf.download(
+            tickers=chunk,
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            auto_adjust=True,   # Match Ticker.history() defaults
+            ignore_tz=False,
+            threads=True,
+            progress=False
+        )
+        if raw is None or raw.empty:
+            continue
+
+        fetched = set(raw.columns.get_level_values(0))
+        for symbol in chunk:
+            if symbol not in fetched:
+                continue
+            # Rows are the union of all symbols' timestamps; drop the other symbols' rows
+            df = raw[symbol].dropna(how='all')
+            if not df.empty:
+                result[symbol] = ensure_timezone(df)
+    return result
+
+
+def fetch_all(
+    symbols: List[str],
+    hours_back: int = 48
+) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """
+    Fetch historical data for several tickers with one bulk download per interval.
+
+    Args:
+        symbols: Ticker symbols
+        hours_back: How many hours of data to fetch (default: 48 for buffer)
+
+    Returns:
+        Dictionary of {symbol: (data_30min, data_hourly, data_daily)}; symbols
+        missing from every download are omitted
+    """
+    logger.info(f"📊 Fetching historical data for {', '.join(symbols)}...")
+
+    period_30min, period_hourly, period_daily = _history_periods(hours_back)
+
+    # The three intervals are independent requests; download them together
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        future_30min = executor.submit(_download_interval, symbols, period_30min, '30m')
+        future_hourly = executor.submit(_download_interval, symbols, period_hourly, '1h')
+        future_daily = executor.submit(_download_interval, symbols, period_daily, '1d')
+
+    data_30min = future_30min.result()
+    data_hourly = future_hourly.result()
+    data_daily = future_daily.result()
+
+    empty = pd.DataFrame()
+    return {
+        symbol: (
+            data_30min.get(symbol, empty),
+            data_hourly.get(symbol, empty),
+            data_daily.get(symbol, empty)
+        )
+        for symbol in symbols
+        if symbol in data_30min or symbol in data_hourly or symbol in data_daily
+    }
+
+
 def fetch_historical_data(
     ticker_symbol: str,
     hours_back: int = 48
@@ -71,28 +178,23 @@ def fetch_historical_data(
     """
     logger.info(f"📊 Fetching historical data for {ticker_symbol}...")
 
-    ticker = yf.Ticker(ticker_symbol)
+    period_30min, period_hourly, period_daily = _history_periods(hours_back)
 
-    # Determine period
-    # For 30-min data: need at least 2 days for reference calculations
-    period_30min = f"{min(hours_back, 60)}d"  # yfinance limit
-    period_hourly = f"{min(hours_back * 2, 730)}d"  # More history for reference levels
-    period_daily = "1y"  # Year for daily reference levels
+    def _fetch(period: str, interval: str) -> pd.DataFrame:
+        # One Ticker per request; a Ticker keeps per-history state that concurrent calls would share
+        logger.info(f"  ⏳ Downloading {interval} data ({period})...")
+        return ensure_timezone(yf.Ticker(ticker_symbol).history(period=period, interval=interval))
 
     try:
-        logger.info(f"  ⏳ Downloading 30-minute data ({period_30min})...")
-        data_30min = ticker.history(period=period_30min, interval='30m')
-
-        logger.info(f"  ⏳ Downloading hourly data ({period_hourly})...")
-        data_hourly = ticker.history(period=period_hourly, interval='1h')
-
-        logger.info(f"  ⏳ Downloading daily data ({period_daily})...")
-        data_daily = ticker.history(period=period_daily, interval='1d')
+        # The three intervals are independent requests; download them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_30min = executor.submit(_fetch, period_30min, '30m')
+            future_hourly = executor.submit(_fetch, period_hourly, '1h')
+            future_daily = executor.submit(_fetch, period_daily, '1d')
 
-        # Ensure UTC timezone
-        data_30min = ensure_timezone(data_30min)
-        data_hourly = ensure_timezone(data_hourly)
-        data_daily = ensure_timezone(data_daily)
+        data_30min = future_30min.result()
+        data_hourly = future_hourly.result()
+        data_daily = future_daily.result()
 
         logger.info(
             f"  ✅ Fetched {len(data_30min)} 30-min, {len(data_hourly)} hourly, "
@@ -106,6 +208,25 @@ def fetch_historical_data(
         raise
 
 
+def _rows_between(
+    df: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    end_inclusive: bool = False
+) -> pd.DataFrame:
+    """
+    Slice a time-sorted DataFrame to start <= index < end (or <= end).
+
+    Bounds are located by binary search and the result is a positional slice,
+    not a boolean-mask copy; callers must not modify it.
+    """
+    if df.empty:
+        return df
+    lo = df.index.searchsorted(start, side='left') if start is not None else 0
+    hi = df.index.searchsorted(end, side='right' if end_inclusive else 'left') if end is not None else len(df)
+    return df.iloc[lo:hi]
+
+
 def generate_prediction_at_time(
     prediction_time: datetime,
     target_hour: int,
@@ -113,7 +234,8 @@ def generate_prediction_at_time(
     data_hourly: pd.DataFrame,
     data_daily: pd.DataFrame,
     ticker_id: str,
-    ticker_symbol: str
+    ticker_symbol: str,
+    daily_levels_cache: Optional[Dict[tuple, Dict[str, Optional[float]]]] = None
 ) -> Optional[IntradayPrediction]:
     """
     Generate a single intraday prediction at a specific time.
@@ -126,41 +248,55 @@ def generate_prediction_at_time(
         data_daily: Daily OHLC data
         ticker_id: Ticker UUID
         ticker_symbol: Ticker symbol
+        daily_levels_cache: Day-anchored reference levels already computed from
+            this ticker's data, reused across prediction times of the same day
 
     Returns:
         IntradayPrediction object or None if data unavailable
     """
-    eastern = pytz.timezone('US/Eastern')
-
     # Convert to UTC (handle both naive and aware datetimes)
     if prediction_time.tzinfo is None:
-        pred_time_utc = eastern.localize(prediction_time).astimezone(pytz.UTC)
+        pred_time_utc = prediction_time.replace(tzinfo=_ET).astimezone(_UTC)
     else:
-        pred_time_utc = prediction_time.astimezone(pytz.UTC)
+        pred_time_utc = prediction_time.astimezone(_UTC)
 
     target_time_ny = prediction_time.replace(hour=target_hour, minute=0, second=0)
     if target_time_ny.tzinfo is None:
-        target_time_utc = eastern.localize(target_time_ny).astimezone(pytz.UTC)
+        target_time_utc = target_time_ny.replace(tzinfo=_ET).astimezone(_UTC)
     else:
-        target_time_utc = target_time_ny.astimezone(pytz.UTC)
+        target_time_utc = target_time_ny.astimezone(_UTC)
 
     # Get historical data UP TO prediction time (no look-ahead bias)
-    hourly_hist = data_hourly[data_hourly.index < pred_time_utc].copy()
-    minute_hist = data_30min[data_30min.index < pred_time_utc].copy()
-    daily_hist = data_daily[data_daily.index < pred_time_utc].copy()
+    hourly_hist = _rows_between(data_hourly, end=pred_time_utc)
+    minute_hist = _rows_between(data_30min, end=pred_time_utc)
+    daily_hist = _rows_between(data_daily, end=pred_time_utc)
 
     # Check if we have sufficient data
     if minute_hist.empty or hourly_hist.empty:
-        logger.warning(f"  ⚠️  Insufficient data for {prediction_time}")
+        logger.warning("  ⚠️  Insufficient data for %s", prediction_time)
         return None
 
     # Get current price at prediction time
     current_price = float(minute_hist['Close'].iloc[-1])
 
     try:
-        # Calculate reference levels
+        # Calculate reference levels; the day/week/month anchored ones only
+        # change with their anchors or when another daily candle closes
+        daily_key = (
+            get_et_midnight(pred_time_utc),
+            get_week_start(pred_time_utc),
+            get_month_start(pred_time_utc),
+            len(daily_hist)
+        )
+        daily_levels = daily_levels_cache.get(daily_key) if daily_levels_cache is not None else None
+        if daily_levels is None:
+            daily_levels = calculate_daily_reference_levels(hourly_hist, daily_hist, pred_time_utc)
+            # A level that's still missing may appear once its candle is in the history
+            if daily_levels_cache is not None and None not in daily_levels.values():
+                daily_levels_cache[daily_key] = daily_levels
+
         ref_levels = calculate_all_reference_levels(
-            hourly_hist, minute_hist, daily_hist, pred_time_utc
+            hourly_hist, minute_hist, daily_hist, pred_time_utc, daily_levels=daily_levels
         )
 
         # Generate signals
@@ -175,21 +311,23 @@ def generate_prediction_at_time(
         )
 
         if not intraday_preds or target_hour not in intraday_preds:
-            logger.warning(f"  ⚠️  No prediction generated for hour {target_hour}")
+            logger.warning("  ⚠️  No prediction generated for hour %s", target_hour)
             return None
 
         pred_data = intraday_preds[target_hour]
 
         # Get reference price (open at prediction hour)
-        # Find candle that contains prediction_time
-        pred_candles = data_30min[
-            (data_30min.index >= pred_time_utc - timedelta(minutes=30)) &
-            (data_30min.index <= pred_time_utc)
-        ]
-        reference_price = float(pred_candles['Open'].iloc[0]) if not pred_candles.empty else current_price
+        # Find candle that contains prediction_time: the first one opening
+        # within the 30 minutes up to it
+        candle_times = data_30min.index
+        pos = candle_times.searchsorted(pred_time_utc - timedelta(minutes=30))
+        if pos < len(candle_times) and candle_times[pos] <= pred_time_utc:
+            reference_price = float(data_30min.iat[pos, data_30min.columns.get_loc('Open')])
+        else:
+            reference_price = current_price
 
         # Check if we can verify (target hour has passed)
-        now_utc = datetime.now(pytz.UTC)
+        now_utc = datetime.now(_UTC)
         can_verify = now_utc > target_time_utc + timedelta(hours=1)
 
         target_close_price = None
@@ -197,14 +335,11 @@ def generate_prediction_at_time(
         verified_at = None
 
         if can_verify:
-            # Get target close price
-            target_close_candles = data_30min[
-                (data_30min.index >= target_time_utc) &
-                (data_30min.index < target_time_utc + timedelta(hours=1))
-            ]
+            # Get target close price: the last candle opening within the target hour
+            pos = candle_times.searchsorted(target_time_utc + timedelta(hours=1)) - 1
 
-            if not target_close_candles.empty:
-                target_close_price = float(target_close_candles['Close'].iloc[-1])
+            if pos >= 0 and candle_times[pos] >= target_time_utc:
+                target_close_price = float(data_30min.iat[pos, data_30min.columns.get_loc('Close')])
 
                 # Determine if prediction was correct
                 actual_direction = 'BULLISH' if target_close_price > reference_price else 'BEARISH'
@@ -234,21 +369,67 @@ def generate_prediction_at_time(
                 'bullish_signals': signals['bullish_count'],
                 'total_signals': signals['total_signals'],
                 'backfilled': True,
-                'backfill_date': datetime.now(pytz.UTC).isoformat()
+                'backfill_date': datetime.now(_UTC).isoformat()
             }
         )
 
         return intraday_prediction
 
     except Exception as e:
-        logger.error(f"  ❌ Error generating prediction for {prediction_time}: {e}")
+        logger.error("  ❌ Error generating prediction for %s: %s", prediction_time, e)
         return None
 
 
+def _prediction_schedule(cutoff_time: datetime, now_ny: datetime) -> Tuple[List[datetime], List[int]]:
+    """
+    Prediction times and target hours for every market hour from cutoff_time to now_ny.
+
+    Hours are stepped on the New York wall clock, so each one is used once across
+    a DST change: a repeated 1 AM is predicted once (its first occurrence) and a
+    skipped 2 AM not at all. Each prediction is made one real minute before its
+    target hour, i.e. at :59 of the previous hour.
+
+    Args:
+        cutoff_time: Start of the backfill period (New York time)
+        now_ny: End of the backfill period (New York time)
+
+    Returns:
+        Tuple of (prediction_times, target_hours), prediction times New York-aware
+    """
+    # All hours: Midnight to 4 PM (16:00)
+    market_hours = list(range(0, 17))  # 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16
+
+    # Every wall-clock top of the hour from cutoff_time to now; the target hours
+    # are the market hours after midnight (a prediction for midnight would be
+    # made the previous day)
+    start = cutoff_time.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    check_times = pd.date_range(start, now_ny.replace(tzinfo=None), freq='h')
+    check_times = check_times[check_times.hour.isin(market_hours) & (check_times.hour > 0)]
+
+    prediction_times = []
+    target_hours = []
+    for check_time in check_times.to_pydatetime():
+        target_time = check_time.replace(tzinfo=_ET)
+        # Skip hours the clocks jump over
+        if target_time.astimezone(_UTC).astimezone(_ET).replace(tzinfo=None) != check_time:
+            continue
+        # Prediction made at :59 minutes of previous hour; stepped back in UTC so
+        # it is right after a skipped hour too (01:59 EST before 03:00 EDT)
+        prediction_time = target_time.astimezone(_UTC) - timedelta(minutes=1)
+        prediction_times.append(prediction_time.astimezone(_ET))
+        target_hours.append(check_time.hour)
+
+    return prediction_times, target_hours
+
+
 def backfill_ticker(
     ticker_symbol: str,
     hours_back: int = 24,
-    dry_run: bool = False
+    dry_run: bool = False,
+    data: Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]] = None,
+    pending: Optional[List[IntradayPrediction]] = None,
+    ticker_repo: Optional[TickerRepository] = None,
+    intraday_repo: Optional[IntradayPredictionRepository] = None
 ) -> Tuple[int, int]:
     """
     Backfill predictions for a single ticker.
@@ -257,118 +438,108 @@ def backfill_ticker(
         ticker_symbol: Ticker symbol
         hours_back: How many hours back to backfill
         dry_run: If True, don't actually store predictions
+        data: Pre-fetched (data_30min, data_hourly, data_daily); fetched when not given
+        pending: When given, predictions are appended here for the caller to
+            store instead of being stored per ticker (total_stored is then 0)
+        ticker_repo: Shared TickerRepository; created when not given
+        intraday_repo: Shared IntradayPredictionRepository; created when needed and not given
 
     Returns:
         Tuple of (total_generated, total_stored)
     """
-    logger.info(f"\n{'='*80}")
-    logger.info(f"🎯 Backfilling {ticker_symbol} - Last {hours_back} hours")
-    logger.info(f"{'='*80}")
+    logger.info("\n%s", '=' * 80)
+    logger.info("🎯 Backfilling %s - Last %s hours", ticker_symbol, hours_back)
+    logger.info("%s", '=' * 80)
 
     # Get ticker from database
-    ticker_repo = TickerRepository()
+    ticker_repo = ticker_repo or TickerRepository()
     ticker = ticker_repo.get_ticker_by_symbol(ticker_symbol)
 
     if not ticker:
-        logger.error(f"❌ Ticker {ticker_symbol} not found in database")
+        logger.error("❌ Ticker %s not found in database", ticker_symbol)
         return 0, 0
 
-    logger.info(f"✅ Found ticker: {ticker.name} (ID: {ticker.id})")
+    logger.info("✅ Found ticker: %s (ID: %s)", ticker.name, ticker.id)
 
     # Fetch historical data
-    try:
-        data_30min, data_hourly, data_daily = fetch_historical_data(
-            ticker_symbol,
-            hours_back=hours_back * 2  # Fetch extra for buffer
-        )
-    except Exception as e:
-        logger.error(f"❌ Failed to fetch data: {e}")
-        return 0, 0
+    if data is not None:
+        data_30min, data_hourly, data_daily = data
+    else:
+        try:
+            data_30min, data_hourly, data_daily = fetch_historical_data(
+                ticker_symbol,
+                hours_back=hours_back * 2  # Fetch extra for buffer
+            )
+        except Exception as e:
+            logger.error("❌ Failed to fetch data: %s", e)
+            return 0, 0
 
     # Generate prediction times (every hour from 9 AM to 4 PM market hours)
-    eastern = pytz.timezone('US/Eastern')
-    now_ny = datetime.now(eastern)
+    now_ny = datetime.now(_ET)
     cutoff_time = now_ny - timedelta(hours=hours_back)
 
-    # All hours: Midnight to 4 PM (16:00)
-    market_hours = list(range(0, 17))  # 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16
-
     predictions_to_store = []
 
-    # Generate all prediction timestamps within the backfill period
-    # Start from cutoff_time and go forward to now
-    current_check = cutoff_time.replace(minute=0, second=0, microsecond=0)
-
-    while current_check <= now_ny:
-        # Check if this hour is a market hour
-        if current_check.hour in market_hours:
-            # Prediction made at :59 minutes of previous hour
-            pred_hour = current_check.hour - 1
-            if pred_hour < 0:
-                # If prediction would be before midnight, skip
-                current_check += timedelta(hours=1)
-                continue
+    prediction_times, target_hours = _prediction_schedule(cutoff_time, now_ny)
 
-            pred_minute = 59
-            prediction_time = current_check.replace(
-                hour=pred_hour,
-                minute=pred_minute,
-                second=0,
-                microsecond=0
-            )
-
-            # Target hour is the current check hour
-            target_hour = current_check.hour
+    # Hours of the same day share their day-anchored reference levels
+    daily_levels_cache = {}
 
+    log_progress = logger.isEnabledFor(logging.INFO)
+    for prediction_time, target_hour in zip(prediction_times, target_hours):
+        if log_progress:
             logger.info(
-                f"  📍 Generating prediction made at {prediction_time.strftime('%Y-%m-%d %H:%M')} "
-                f"for target hour {target_hour}:00"
+                "  📍 Generating prediction made at %s for target hour %s:00",
+                prediction_time.strftime('%Y-%m-%d %H:%M'), target_hour
             )
 
-            intraday_pred = generate_prediction_at_time(
-                prediction_time=prediction_time,
-                target_hour=target_hour,
-                data_30min=data_30min,
-                data_hourly=data_hourly,
-                data_daily=data_daily,
-                ticker_id=ticker.id,
-                ticker_symbol=ticker_symbol
-            )
+        intraday_pred = generate_prediction_at_time(
+            prediction_time=prediction_time,
+            target_hour=target_hour,
+            data_30min=data_30min,
+            data_hourly=data_hourly,
+            data_daily=data_daily,
+            ticker_id=ticker.id,
+            ticker_symbol=ticker_symbol,
+            daily_levels_cache=daily_levels_cache
+        )
 
-            if intraday_pred:
-                predictions_to_store.append(intraday_pred)
-                result_str = f"{intraday_pred.actual_result}" if intraday_pred.actual_result else "PENDING"
+        if intraday_pred:
+            predictions_to_store.append(intraday_pred)
+            if log_progress:
                 logger.info(
-                    f"    ✅ {intraday_pred.prediction} "
-                    f"(Conf: {intraday_pred.final_confidence:.1f}%) - {result_str}"
+                    "    ✅ %s (Conf: %.1f%%) - %s",
+                    intraday_pred.prediction,
+                    intraday_pred.final_confidence,
+                    intraday_pred.actual_result or "PENDING"
                 )
 
-        # Move to next hour
-        current_check += timedelta(hours=1)
-
-    logger.info(f"\n📊 Summary for {ticker_symbol}:")
-    logger.info(f"  • Total predictions generated: {len(predictions_to_store)}")
+    logger.info("\n📊 Summary for %s:", ticker_symbol)
+    logger.info("  • Total predictions generated: %d", len(predictions_to_store))
 
     if predictions_to_store:
         verified = [p for p in predictions_to_store if p.actual_result in ['CORRECT', 'WRONG']]
         correct = [p for p in verified if p.actual_result == 'CORRECT']
         accuracy = (len(correct) / len(verified) * 100) if verified else 0
 
-        logger.info(f"  • Verified predictions: {len(verified)}")
-        logger.info(f"  • Correct predictions: {len(correct)}")
-        logger.info(f"  • Accuracy: {accuracy:.1f}%")
+        logger.info("  • Verified predictions: %d", len(verified))
+        logger.info("  • Correct predictions: %d", len(correct))
+        logger.info("  • Accuracy: %.1f%%", accuracy)
 
     # Store predictions
     stored_count = 0
-    if not dry_run and predictions_to_store:
+    if pending is not None and not dry_run:
+        pending.extend(predictions_to_store)
+        logger.info("  📦 Queued %d predictions for the bulk insert", len(predictions_to_store))
+    elif not dry_run and predictions_to_store:
         try:
-            intraday_repo = IntradayPredictionRepository()
+            intraday_repo = intraday_repo or IntradayPredictionRepository()
             stored_count = intraday_repo.bulk_store_intraday_predictions(predictions_to_store)
-            logger.info(f"  ✅ Stored {stored_count} predictions to database")
+            logger.info("  ✅ Stored %d predictions to database", stored_count)
         except Exception as e:
-            logger.error(f"  ❌ Error storing predictions: {e}")
+            logger.error("  ❌ Error storing predictions: %s", e)
     elif dry_run:
-        logger.info(f"  🔍 DRY RUN: Would store {len(predictions_to_store)} predictions")
+        logger.info("  🔍 DRY RUN: Would store %d predictions", len(predictions_to_store))
         stored_count = len(predictions_to_store)
 
     return len(predictions_to_store), stored_count
@@ -399,37 +570,77 @@ def main():
 
     args = parser.parse_args()
 
-    logger.info("\n" + "="*80)
+    logger.info("\n%s", "=" * 80)
     logger.info("🚀 NQP 24-HOUR PREDICTION BACKFILL")
-    logger.info("="*80)
-    logger.info(f"Tickers: {', '.join(args.tickers)}")
-    logger.info(f"Hours Back: {args.hours_back}")
-    logger.info(f"Dry Run: {args.dry_run}")
-    logger.info("="*80)
+    logger.info("%s", "=" * 80)
+    logger.info("Tickers: %s", ', '.join(args.tickers))
+    logger.info("Hours Back: %s", args.hours_back)
+    logger.info("Dry Run: %s", args.dry_run)
+    logger.info("%s", "=" * 80)
 
     total_generated = 0
     total_stored = 0
 
-    for ticker_symbol in args.tickers:
-        try:
-            generated, stored = backfill_ticker(
+    # Bulk-download every ticker up front; tickers missing from it fetch their own data
+    try:
+        prefetched = fetch_all(args.tickers, hours_back=args.hours_back * 2)  # Fetch extra for buffer
+    except Exception as e:
+        logger.warning("⚠️  Bulk download failed, fetching per ticker: %s", e)
+        prefetched = {}
+
+    # Predictions from every ticker are stored with one bulk insert at the end
+    pending: List[IntradayPrediction] = []
+
+    # Create the repositories (and the shared Supabase client behind them) once,
+    # before the ticker threads start, rather than once per ticker
+    ticker_repo = TickerRepository()
+    intraday_repo = IntradayPredictionRepository()
+
+    with ThreadPoolExecutor(max_workers=min(MAX_BACKFILL_WORKERS, len(args.tickers))) as executor:
+        futures = {}
+        fetching = False
+        for ticker_symbol in args.tickers:
+            if ticker_symbol not in prefetched:
+                # Stagger tickers that download their own data
+                if fetching:
+                    time.sleep(random.uniform(*LAUNCH_JITTER_SECONDS))
+                fetching = True
+            future = executor.submit(
+                backfill_ticker,
                 ticker_symbol=ticker_symbol,
                 hours_back=args.hours_back,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                data=prefetched.get(ticker_symbol),
+                pending=pending,
+                ticker_repo=ticker_repo,
+                intraday_repo=intraday_repo
             )
-            total_generated += generated
+            futures[future] = ticker_symbol
+
+        for future in as_completed(futures):
+            ticker_symbol = futures[future]
+            try:
+                generated, stored = future.result()
+                total_generated += generated
+                total_stored += stored
+            except Exception as e:
+                logger.error("❌ Error processing %s: %s", ticker_symbol, e)
+
+    if pending:
+        try:
+            stored = intraday_repo.bulk_store_intraday_predictions(pending)
             total_stored += stored
+            logger.info("✅ Stored %d predictions to database", stored)
         except Exception as e:
-            logger.error(f"❌ Error processing {ticker_symbol}: {e}")
-            continue
+            logger.error("❌ Error storing predictions: %s", e)
 
     # Print final summary
-    logger.info("\n" + "="*80)
+    logger.info("\n%s", "=" * 80)
     logger.info("📈 BACKFILL COMPLETE")
-    logger.info("="*80)
-    logger.info(f"Total predictions generated: {total_generated}")
-    logger.info(f"Total predictions stored: {total_stored}")
-    logger.info("="*80)
+    logger.info("%s", "=" * 80)
+    logger.info("Total predictions generated: %d", total_generated)
+    logger.info("Total predictions stored: %d", total_stored)
+    logger.info("%s", "=" * 80)
 
 
 if __name__ == '__main__':
@@ -22,6 +22,134 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Tickers added by seed_tickers; existing symbols are left unchanged
+SEED_TICKERS = (
+    {
+        'symbol': 'NQ=F',
+        'name': 'NASDAQ 100 E-mini Futures',
+        'type': 'futures',
+        'enabled': True,
+        'timezone': 'America/New_York',
+        'metadata': {
+            'exchange': 'CME',
+            'trading_hours': '18:00-17:00 ET',
+            'contract': 'E-mini'
+        }
+    },
+    {
+        'symbol': 'ES=F',
+        'name': 'S&P 500 E-mini Futures',
+        'type': 'futures',
+        'enabled': True,
+        'timezone': 'America/New_York',
+        'metadata': {
+            'exchange': 'CME',
+            'trading_hours': '18:00-17:00 ET',
+            'contract': 'E-mini'
+        }
+    },
+    {
+        'symbol': '^N225',
+        'name': 'Nikkei 225',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'Asia/Tokyo',
+        'metadata': {
+            'exchange': 'TSE',
+            'trading_hours': '09:00-15:00 JST',
+            'country': 'Japan'
+        }
+    },
+    {
+        'symbol': '^VIX',
+        'name': 'CBOE Volatility Index',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'America/Chicago',
+        'metadata': {
+            'exchange': 'CBOE',
+            'trading_hours': '08:30-15:15 CT',
+            'description': 'Fear Index'
+        }
+    },
+    {
+        'symbol': 'RTY=F',
+        'name': 'E-mini Russell 2000 Index Futures',
+        'type': 'futures',
+        'enabled': True,
+        'timezone': 'America/New_York',
+        'metadata': {
+            'exchange': 'CME',
+            'trading_hours': '18:00-17:00 ET',
+            'contract': 'E-mini'
+        }
+    },
+    {
+        'symbol': 'YM=F',
+        'name': 'Mini Dow Jones Indus.-$5 Dec 25',
+        'type': 'futures',
+        'enabled': True,
+        'timezone': 'America/New_York',
+        'metadata': {
+            'exchange': 'CBOT',
+            'trading_hours': '18:00-17:00 ET',
+            'contract': 'Mini'
+        }
+    },
+    {
+        'symbol': '^FTSE',
+        'name': 'FTSE 100',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'Europe/London',
+        'metadata': {
+            'exchange': 'LSE',
+            'trading_hours': '08:00-16:30 GMT',
+            'country': 'UK'
+        }
+    },
+    {
+        'symbol': 'BTC-USD',
+        'name': 'Bitcoin',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'UTC',
+        'metadata': {
+            'exchange': 'Crypto',
+            'trading_hours': '24/7',
+            'description': 'Bitcoin to USD',
+            'category': 'crypto'
+        }
+    },
+    {
+        'symbol': 'SOL-USD',
+        'name': 'Solana',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'UTC',
+        'metadata': {
+            'exchange': 'Crypto',
+            'trading_hours': '24/7',
+            'description': 'Solana to USD',
+            'category': 'crypto'
+        }
+    },
+    {
+        'symbol': 'ADA-USD',
+        'name': 'Cardano',
+        'type': 'index',
+        'enabled': True,
+        'timezone': 'UTC',
+        'metadata': {
+            'exchange': 'Crypto',
+            'trading_hours': '24/7',
+            'description': 'Cardano to USD',
+            'category': 'crypto'
+        }
+    }
+)
+
+
 def seed_tickers():
     """Add initial tickers to the database."""
     logger.info("=" * 80)
@@ -31,150 +159,23 @@ def seed_tickers():
     try:
         client = get_supabase_client()
 
-        # Define tickers to seed
-        tickers = [
-            {
-                'symbol': 'NQ=F',
-                'name': 'NASDAQ 100 E-mini Futures',
-                'type': 'futures',
-                'enabled': True,
-                'timezone': 'America/New_York',
-                'metadata': {
-                    'exchange': 'CME',
-                    'trading_hours': '18:00-17:00 ET',
-                    'contract': 'E-mini'
-                }
-            },
-            {
-                'symbol': 'ES=F',
-                'name': 'S&P 500 E-mini Futures',
-                'type': 'futures',
-                'enabled': True,
-                'timezone': 'America/New_York',
-                'metadata': {
-                    'exchange': 'CME',
-                    'trading_hours': '18:00-17:00 ET',
-                    'contract': 'E-mini'
-                }
-            },
-            {
-                'symbol': '^N225',
-                'name': 'Nikkei 225',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'Asia/Tokyo',
-                'metadata': {
-                    'exchange': 'TSE',
-                    'trading_hours': '09:00-15:00 JST',
-                    'country': 'Japan'
-                }
-            },
-            {
-                'symbol': '^VIX',
-                'name': 'CBOE Volatility Index',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'America/Chicago',
-                'metadata': {
-                    'exchange': 'CBOE',
-                    'trading_hours': '08:30-15:15 CT',
-                    'description': 'Fear Index'
-                }
-            },
-            {
-                'symbol': 'RTY=F',
-                'name': 'E-mini Russell 2000 Index Futures',
-                'type': 'futures',
-                'enabled': True,
-                'timezone': 'America/New_York',
-                'metadata': {
-                    'exchange': 'CME',
-                    'trading_hours': '18:00-17:00 ET',
-                    'contract': 'E-mini'
-                }
-            },
-            {
-                'symbol': 'YM=F',
-                'name': 'Mini Dow Jones Indus.-$5 Dec 25',
-                'type': 'futures',
-                'enabled': True,
-                'timezone': 'America/New_York',
-                'metadata': {
-                    'exchange': 'CBOT',
-                    'trading_hours': '18:00-17:00 ET',
-                    'contract': 'Mini'
-                }
-            },
-            {
-                'symbol': '^FTSE',
-                'name': 'FTSE 100',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'Europe/London',
-                'metadata': {
-                    'exchange': 'LSE',
-                    'trading_hours': '08:00-16:30 GMT',
-                    'country': 'UK'
-                }
-            },
-            {
-                'symbol': 'BTC-USD',
-                'name': 'Bitcoin',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'UTC',
-                'metadata': {
-                    'exchange': 'Crypto',
-                    'trading_hours': '24/7',
-                    'description': 'Bitcoin to USD',
-                    'category': 'crypto'
-                }
-            },
-            {
-                'symbol': 'SOL-USD',
-                'name': 'Solana',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'UTC',
-                'metadata': {
-                    'exchange': 'Crypto',
-                    'trading_hours': '24/7',
-                    'description': 'Solana to USD',
-                    'category': 'crypto'
-                }
-            },
-            {
-                'symbol': 'ADA-USD',
-                'name': 'Cardano',
-                'type': 'index',
-                'enabled': True,
-                'timezone': 'UTC',
-                'metadata': {
-                    'exchange': 'Crypto',
-                    'trading_hours': '24/7',
-                    'description': 'Cardano to USD',
-                    'category': 'crypto'
-                }
-            }
-        ]
-
-        for ticker_data in tickers:
-            symbol = ticker_data['symbol']
-
-            # Check if ticker already exists
-            existing = client.table('tickers').select('*').eq('symbol', symbol).execute()
+        # One INSERT ... ON CONFLICT (symbol) DO NOTHING for all tickers;
+        # only newly added rows are returned
+        result = (
+            client.table('tickers')
+            .upsert(list(SEED_TICKERS), on_conflict='symbol', ignore_duplicates=True)
+            .execute()
+        )
 
-            if existing.data and len(existing.data) > 0:
-                logger.info(f"✓ Ticker {symbol} already exists, skipping...")
-                continue
-
-            # Insert ticker
-            result = client.table('tickers').insert(ticker_data).execute()
-
-            if result.data:
+        added = {row['symbol'] for row in result.data or []}
+        for ticker_data in SEED_TICKERS:
+            symbol = ticker_data['symbol']
+            if symbol in added:
                 logger.info(f"✓ Successfully added ticker: {symbol}")
             else:
-                logger.error(f"✗ Failed to add ticker: {symbol}")
+                logger.info(f"✓ Ticker {symbol} already exists, skipping...")
+
+        logger.info(f"Added {len(added)} of {len(SEED_TICKERS)} tickers")
 
         logger.info("=" * 80)
         logger.info("TICKER SEEDING COMPLETE")
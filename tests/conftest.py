@@ -14,6 +14,7 @@ Usage:
 
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import pytz
 from unittest.mock import Mock, MagicMock, patch
@@ -62,21 +63,25 @@ def app_context(app):
 # LEGACY FIXTURES (for backward compatibility)
 # ========================================
 
-@pytest.fixture
+# Data fixtures are built once per session and shared; tests must copy
+# before modifying them
+
+@pytest.fixture(scope='session')
 def sample_ohlc_data():
     """Sample OHLC data for testing (hourly)"""
     dates = pd.date_range(start='2024-01-01', periods=24, freq='H', tz=pytz.UTC)
+    i = np.arange(24)
     data = {
-        'Open': [100 + i for i in range(24)],
-        'High': [101 + i for i in range(24)],
-        'Low': [99 + i for i in range(24)],
-        'Close': [100.5 + i for i in range(24)],
-        'Volume': [1000000] * 24
+        'Open': 100 + i,
+        'High': 101 + i,
+        'Low': 99 + i,
+        'Close': 100.5 + i,
+        'Volume': np.full(24, 1_000_000, dtype=np.int64)
     }
     return pd.DataFrame(data, index=dates)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_daily_data():
     """Sample daily OHLC data for testing"""
     dates = pd.date_range(start='2024-01-01', periods=7, freq='D', tz=pytz.UTC)
@@ -85,12 +90,12 @@ def sample_daily_data():
         'High': [102, 104, 106, 105, 108, 109, 108],
         'Low': [99, 101, 103, 102, 104, 106, 105],
         'Close': [101, 103, 105, 104, 107, 108, 107],
-        'Volume': [1000000] * 7
+        'Volume': np.full(7, 1_000_000, dtype=np.int64)
     }
     return pd.DataFrame(data, index=dates)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def current_time():
     """Sample current time for testing"""
     return datetime(2024, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
@@ -100,7 +105,7 @@ def current_time():
 # ENHANCED FIXTURES
 # ========================================
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_ohlc_bar():
     """Sample valid OHLC bar as dictionary"""
     return {
@@ -113,35 +118,31 @@ def sample_ohlc_bar():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_ohlc_bars_24h():
     """24 hours of OHLC data (hourly bars)"""
-    bars = []
     base_time = datetime.now(pytz.UTC).replace(hour=13, minute=30)
-    price = 100.0
+    timestamps = pd.date_range(base_time, periods=24, freq='h')
+    i = np.arange(24)
+    price = 100.0 * 1.01 ** i  # Each bar opens 1% above the previous one
 
-    for i in range(24):
-        bar_time = base_time + timedelta(hours=i)
-        bars.append({
-            'open': price,
-            'high': price * 1.02,
-            'low': price * 0.98,
-            'close': price * 1.01,
-            'volume': 1000000 + i * 10000,
-            'timestamp': bar_time.isoformat()
-        })
-        price = price * 1.01
+    return pd.DataFrame({
+        'open': price,
+        'high': price * 1.02,
+        'low': price * 0.98,
+        'close': price * 1.01,
+        'volume': 1000000 + i * 10000,
+        'timestamp': timestamps.strftime('%Y-%m-%dT%H:%M:%S.%f+00:00')
+    }).to_dict('records')
 
-    return bars
 
-
-@pytest.fixture
+@pytest.fixture(scope='session')
 def supported_tickers():
     """List of supported tickers"""
     return ['NQ=F', 'ES=F', '^FTSE']
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_request_data():
     """Sample request data for testing"""
     return {
@@ -152,7 +153,7 @@ def sample_request_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_success_response():
     """Sample successful API response"""
     return {
@@ -166,7 +167,7 @@ def sample_success_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_error_response():
     """Sample error API response"""
     return {
@@ -16,29 +16,30 @@ from nasdaq_predictor.database.repositories.block_prediction_repository import B
 from nasdaq_predictor.database.repositories.ticker_repository import TickerRepository
 
 
+@pytest.fixture(scope='module')
+def services():
+    """Provide integrated services, built once for the module."""
+    market_status_service = MarketStatusService()
+    fetcher = YahooFinanceDataFetcher()
+    block_pred_repo = BlockPredictionRepository()
+    ticker_repo = TickerRepository()
+
+    block_prediction_service = BlockPredictionService(
+        fetcher=fetcher,
+        block_prediction_repo=block_pred_repo,
+        ticker_repo=ticker_repo,
+        market_status_service=market_status_service
+    )
+
+    return {
+        'market_status': market_status_service,
+        'block_prediction': block_prediction_service
+    }
+
+
 class TestMarketAwarePredictionIntegration:
     """Test integration between market status and predictions."""
 
-    @pytest.fixture
-    def services(self):
-        """Provide integrated services."""
-        market_status_service = MarketStatusService()
-        fetcher = YahooFinanceDataFetcher()
-        block_pred_repo = BlockPredictionRepository()
-        ticker_repo = TickerRepository()
-
-        block_prediction_service = BlockPredictionService(
-            fetcher=fetcher,
-            block_prediction_repo=block_pred_repo,
-            ticker_repo=ticker_repo,
-            market_status_service=market_status_service
-        )
-
-        return {
-            'market_status': market_status_service,
-            'block_prediction': block_prediction_service
-        }
-
     def test_market_status_available_to_predictions(self, services):
         """Test that market status is accessible from prediction service."""
         service = services['block_prediction']
@@ -120,26 +121,6 @@ class TestMarketAwarePredictionIntegration:
 class TestMarketStatusConsistency:
     """Test consistency between market status and prediction metadata."""
 
-    @pytest.fixture
-    def services(self):
-        """Provide integrated services."""
-        market_status_service = MarketStatusService()
-        fetcher = YahooFinanceDataFetcher()
-        block_pred_repo = BlockPredictionRepository()
-        ticker_repo = TickerRepository()
-
-        block_prediction_service = BlockPredictionService(
-            fetcher=fetcher,
-            block_prediction_repo=block_pred_repo,
-            ticker_repo=ticker_repo,
-            market_status_service=market_status_service
-        )
-
-        return {
-            'market_status': market_status_service,
-            'block_prediction': block_prediction_service
-        }
-
     def test_timezone_consistency(self, services):
         """Test that timezone is consistent between services."""
         market_service = services['market_status']
@@ -172,26 +153,6 @@ class TestMarketStatusConsistency:
 class TestCryptoMarketIntegration:
     """Test crypto market integration."""
 
-    @pytest.fixture
-    def services(self):
-        """Provide integrated services."""
-        market_status_service = MarketStatusService()
-        fetcher = YahooFinanceDataFetcher()
-        block_pred_repo = BlockPredictionRepository()
-        ticker_repo = TickerRepository()
-
-        block_prediction_service = BlockPredictionService(
-            fetcher=fetcher,
-            block_prediction_repo=block_pred_repo,
-            ticker_repo=ticker_repo,
-            market_status_service=market_status_service
-        )
-
-        return {
-            'market_status': market_status_service,
-            'block_prediction': block_prediction_service
-        }
-
     def test_crypto_always_trading(self, services):
         """Test that crypto markets always show as trading."""
         market_service = services['market_status']
@@ -213,26 +174,6 @@ class TestCryptoMarketIntegration:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def services(self):
-        """Provide integrated services."""
-        market_status_service = MarketStatusService()
-        fetcher = YahooFinanceDataFetcher()
-        block_pred_repo = BlockPredictionRepository()
-        ticker_repo = TickerRepository()
-
-        block_prediction_service = BlockPredictionService(
-            fetcher=fetcher,
-            block_prediction_repo=block_pred_repo,
-            ticker_repo=ticker_repo,
-            market_status_service=market_status_service
-        )
-
-        return {
-            'market_status': market_status_service,
-            'block_prediction': block_prediction_service
-        }
-
     def test_invalid_ticker_handling(self, services):
         """Test handling of invalid ticker symbols."""
         pred_service = services['block_prediction']
@@ -274,26 +215,6 @@ class TestEdgeCases:
 class TestMultiMarketComparison:
     """Test comparing multiple markets at same time."""
 
-    @pytest.fixture
-    def services(self):
-        """Provide integrated services."""
-        market_status_service = MarketStatusService()
-        fetcher = YahooFinanceDataFetcher()
-        block_pred_repo = BlockPredictionRepository()
-        ticker_repo = TickerRepository()
-
-        block_prediction_service = BlockPredictionService(
-            fetcher=fetcher,
-            block_prediction_repo=block_pred_repo,
-            ticker_repo=ticker_repo,
-            market_status_service=market_status_service
-        )
-
-        return {
-            'market_status': market_status_service,
-            'block_prediction': block_prediction_service
-        }
-
     def test_market_status_at_same_utc_time(self, services):
         """Test checking multiple markets at same UTC time."""
         market_service = services['market_status']
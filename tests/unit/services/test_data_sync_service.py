@@ -0,0 +1,67 @@
+"""
+Unit Tests for DataSyncService
+
+Tests the per-ticker fan-out of the sync and prediction jobs:
+- Tickers processed concurrently
+- Results reported in ticker order, with failures isolated per ticker
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from nasdaq_predictor.services.data_sync_service import DataSyncService
+
+
+class TestDataSyncService:
+    """Test suite for DataSyncService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create DataSyncService with mocked dependencies and three tickers."""
+        ticker_repo = Mock()
+        ticker_repo.get_enabled_tickers.return_value = [
+            Mock(id='t1', symbol='NQ=F'),
+            Mock(id='t2', symbol='ES=F'),
+            Mock(id='t3', symbol='YM=F'),
+        ]
+        return DataSyncService(
+            fetcher=Mock(),
+            ticker_repo=ticker_repo,
+            market_data_repo=Mock(),
+            prediction_repo=Mock(),
+            ref_levels_repo=Mock()
+        )
+
+    def test_tickers_synced_concurrently_in_order(self, service):
+        """Test tickers are synced in parallel and reported in ticker order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def sync_ticker_data(ticker_id, symbol):
+            barrier.wait()  # Only passes once all three tickers are in flight together
+            return {'records_stored': int(ticker_id[1])}
+
+        service.sync_ticker_data = Mock(side_effect=sync_ticker_data)
+
+        results = service.sync_all_tickers()
+
+        assert [t['symbol'] for t in results['tickers']] == ['NQ=F', 'ES=F', 'YM=F']
+        assert [t['records_stored'] for t in results['tickers']] == [1, 2, 3]
+        assert results['successful'] == 3
+
+    def test_prediction_failure_isolated_to_ticker(self, service):
+        """Test one ticker's failed prediction doesn't affect the others."""
+        def calculate(ticker_id, symbol):
+            if ticker_id == 't2':
+                raise ValueError('no data')
+            return Mock(prediction='BULLISH')
+
+        service.calculate_and_store_prediction = Mock(side_effect=calculate)
+
+        results = service.calculate_predictions_for_all()
+
+        assert [p['success'] for p in results['predictions']] == [True, False, True]
+        assert results['predictions'][1]['error'] == 'no data'
+        assert results['successful'] == 2
+        assert results['failed'] == 1
@@ -248,6 +248,17 @@ class TestQuickStatusCheck:
         """Test is_market_open returns False for invalid ticker."""
         assert not service.is_market_open('INVALID_TICKER')
 
+    def test_is_market_open_skips_full_status(self, service, monkeypatch):
+        """Test is_market_open does not build a full MarketStatusInfo."""
+        def fail(*args, **kwargs):
+            raise AssertionError("get_market_status should not be called")
+
+        monkeypatch.setattr(service, 'get_market_status', fail)
+        test_time = datetime(2025, 11, 17, 18, 0, 0, tzinfo=pytz.UTC)
+        assert service.is_market_open('NQ=F', test_time)
+        assert service.is_market_open('BTC-USD', test_time)
+        assert not service.is_market_open('^FTSE', test_time)
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -363,3 +374,41 @@ class TestMultipleMarketStatusChecks:
         # Verify all are different timezones
         assert nq_status.timezone != ftse_status.timezone
         assert ftse_status.timezone != btc_status.timezone
+
+
+class TestMinuteStatusCache:
+    """Test statuses are computed once per ticker and minute."""
+
+    @pytest.fixture
+    def service(self):
+        return MarketStatusService()
+
+    def test_same_minute_computed_once(self, service, monkeypatch):
+        """Test repeat calls within a minute reuse the computed status."""
+        calls = []
+        original = service._is_market_open
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(service, '_is_market_open', counting)
+        first = datetime(2025, 11, 17, 18, 0, 5, tzinfo=pytz.UTC)
+        later = datetime(2025, 11, 17, 18, 0, 55, tzinfo=pytz.UTC)
+
+        status_first = service.get_market_status('NQ=F', first)
+        calls_after_first = len(calls)
+        status_later = service.get_market_status('NQ=F', later)
+
+        assert len(calls) == calls_after_first
+        assert status_later.current_time == later
+        assert status_later.next_close == status_first.next_close
+
+    def test_session_end_minute_not_shared(self, service):
+        """Test the minute a session ends gets its own status."""
+        # ^FTSE closes at 16:30 London time (UTC in November)
+        before_close = datetime(2025, 11, 17, 16, 29, 59, tzinfo=pytz.UTC)
+        at_close = datetime(2025, 11, 17, 16, 30, 0, tzinfo=pytz.UTC)
+
+        assert service.get_market_status('^FTSE', before_close).is_trading
+        assert not service.get_market_status('^FTSE', at_close).is_trading
@@ -0,0 +1,285 @@
+"""
+Unit Tests for SchedulerJobTrackingService
+
+Tests job execution tracking including:
+- Batched background writes of execution records
+- In-memory job metrics with periodic bulk flush
+- Success and failure tracking through the decorator
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from nasdaq_predictor.services.scheduler_job_tracking_service import (
+    SchedulerJobTrackingService,
+    _ExecutionWriter,
+    reload_config
+)
+from nasdaq_predictor.config.scheduler_config import SchedulerConfig
+from nasdaq_predictor.database.models.scheduler_job_execution import JobExecution
+
+
+class TestExecutionWriter:
+    """Test suite for the background execution writer."""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock job execution repository."""
+        return Mock()
+
+    def _execution(self, status='SUCCESS'):
+        return JobExecution(
+            job_id='test_job',
+            job_name='Test Job',
+            status=status,
+            started_at=datetime.utcnow()
+        )
+
+    def test_flush_writes_queued_records_in_one_batch(self, mock_repository):
+        """Test queued records are written with a single bulk insert."""
+        writer = _ExecutionWriter(mock_repository, batch_size=50)
+        writer._ensure_started = Mock()  # Keep the consumer thread out of the test
+
+        for _ in range(3):
+            writer.submit(self._execution())
+        writer.flush()
+
+        mock_repository.store_job_executions_bulk.assert_called_once()
+        batch = mock_repository.store_job_executions_bulk.call_args[0][0]
+        assert len(batch) == 3
+
+    def test_flush_respects_batch_size(self, mock_repository):
+        """Test flush splits the queue into batch_size chunks."""
+        writer = _ExecutionWriter(mock_repository, batch_size=2)
+        writer._ensure_started = Mock()
+
+        for _ in range(5):
+            writer.submit(self._execution())
+        writer.flush()
+
+        sizes = [len(c[0][0]) for c in mock_repository.store_job_executions_bulk.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_update_is_written_after_pending_inserts(self, mock_repository):
+        """Test an update flushes earlier inserts so its row exists."""
+        calls = []
+        mock_repository.store_job_executions_bulk.side_effect = lambda rows: calls.append('insert')
+        mock_repository.update_job_execution.side_effect = lambda *a: calls.append('update')
+
+        writer = _ExecutionWriter(mock_repository)
+        writer._ensure_started = Mock()
+
+        execution = self._execution(status='RUNNING')
+        writer.submit(execution)
+        writer.submit_update(execution.id, {'status': 'SUCCESS'})
+        writer.flush()
+
+        assert calls == ['insert', 'update']
+
+
+class TestSchedulerJobTrackingService:
+    """Test suite for SchedulerJobTrackingService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create SchedulerJobTrackingService with a mocked repository."""
+        with patch(
+            'nasdaq_predictor.services.scheduler_job_tracking_service.SchedulerJobExecutionRepository'
+        ):
+            service = SchedulerJobTrackingService()
+        service.tracking_enabled = True
+        service.history_enabled = True
+        service.in_progress_enabled = False
+        service._writer = Mock()
+        service._ensure_metrics_flusher = Mock()  # Keep the flusher thread out of the test
+        service.repository.get_job_metrics.return_value = None
+        service.repository.get_consecutive_failures.return_value = 0
+        return service
+
+    def test_success_is_queued_not_written_inline(self, service):
+        """Test execution records go through the writer, not the repository."""
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            return {'records_processed': 5}
+
+        assert job() == {'records_processed': 5}
+        assert service._writer.submit.called
+        service.repository.store_job_execution.assert_not_called()
+
+    def test_single_record_per_run(self, service):
+        """Test only the terminal state is written when in-progress tracking is off."""
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            return None
+
+        job()
+
+        service._writer.submit.assert_called_once()
+        assert service._writer.submit.call_args[0][0].status == 'SUCCESS'
+        service._writer.submit_update.assert_not_called()
+
+    def test_in_progress_tracking_updates_running_row(self, service):
+        """Test the RUNNING row is updated in place on completion."""
+        service.in_progress_enabled = True
+
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            return None
+
+        job()
+
+        running = service._writer.submit.call_args[0][0]
+        assert running.status == 'RUNNING'
+        execution_id, updates = service._writer.submit_update.call_args[0]
+        assert execution_id == running.id
+        assert updates['status'] == 'SUCCESS'
+
+    def test_failure_is_reraised(self, service):
+        """Test failures are tracked and re-raised."""
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            job()
+
+        statuses = [c[0][0].status for c in service._writer.submit.call_args_list]
+        assert 'FAILURE' in statuses
+
+    def test_metrics_are_aggregated_in_memory(self, service):
+        """Test metrics are updated in memory without writing per execution."""
+        service._update_metrics('test_job', 'Test Job', 'SUCCESS', 2.0)
+        service._update_metrics('test_job', 'Test Job', 'FAILURE', 4.0, error_message='boom')
+
+        service.repository.get_job_metrics.assert_called_once_with('test_job')
+        service.repository.store_job_metrics.assert_not_called()
+        service.repository.update_job_metrics.assert_not_called()
+
+        metrics = service._metrics_cache['test_job'].to_metrics()
+        assert metrics.total_executions == 2
+        assert metrics.successful_executions == 1
+        assert metrics.failed_executions == 1
+        assert metrics.avg_duration_seconds == pytest.approx(3.0)
+        assert metrics.min_duration_seconds == 2.0
+        assert metrics.max_duration_seconds == 4.0
+        assert metrics.last_error_message == 'boom'
+
+    def test_flush_metrics_upserts_dirty_entries_once(self, service):
+        """Test flush writes dirty metrics in one upsert and clears the dirty flag."""
+        service.repository.upsert_job_metrics_bulk.return_value = True
+        service._update_metrics('job_a', 'Job A', 'SUCCESS', 1.0)
+        service._update_metrics('job_b', 'Job B', 'SUCCESS', 1.0)
+
+        service.flush_metrics()
+        service.flush_metrics()
+
+        service.repository.upsert_job_metrics_bulk.assert_called_once()
+        flushed = service.repository.upsert_job_metrics_bulk.call_args[0][0]
+        assert {m.job_id for m in flushed} == {'job_a', 'job_b'}
+
+    def test_consecutive_failures_counted_in_memory(self, service):
+        """Test consecutive failures are counted locally and reset on success."""
+        service.repository.get_consecutive_failures.return_value = 1
+        service._create_failure_alert = Mock()
+
+        assert service._record_outcome('test_job', failed=True) == 2
+        assert service._record_outcome('test_job', failed=True) == 3
+        assert service._record_outcome('test_job', failed=False) == 0
+        assert service._record_outcome('test_job', failed=True) == 1
+
+        # History is only consulted to seed the counter
+        service.repository.get_consecutive_failures.assert_called_once_with('test_job')
+
+    @pytest.mark.parametrize('error_message, expected', [
+        ('Request Timed Out', 'timing out'),
+        ('supabase connection refused', 'Network/connection'),
+        ('401 Unauthorized', 'Authentication'),
+        ('Supabase returned an error', 'Database error'),
+        ('Out of memory', 'Memory or resource'),
+        ('Something else', 'Test Job has encountered'),
+    ])
+    def test_get_recommendation(self, service, error_message, expected):
+        """Test recommendations follow the error category priority."""
+        assert expected in service._get_recommendation(error_message, 'Test Job')
+
+    def test_failure_alert_uses_cached_last_success(self, service):
+        """Test the alert reads the last success from memory instead of the database."""
+        started_at = datetime(2025, 1, 1, 12, 0)
+        service._update_metrics('test_job', 'Test Job', 'SUCCESS', 1.0, started_at=started_at)
+        service._update_metrics('test_job', 'Test Job', 'FAILURE', 1.0, error_message='boom')
+
+        service._create_failure_alert('test_job', 'Test Job', 'boom', 2)
+
+        service.repository.get_last_successful_execution_time.assert_not_called()
+        service.repository.get_job_executions_by_id.assert_not_called()
+        alert = service.repository.store_job_alert.call_args[0][0]
+        assert alert.last_successful_execution == started_at
+
+    def test_completion_time_shared_by_execution_and_metrics(self, service):
+        """Test the execution record and metrics use the same completion timestamp."""
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            return None
+
+        job()
+
+        execution = service._writer.submit.call_args[0][0]
+        assert service._metrics_cache['test_job'].last_execution_at == execution.completed_at
+
+    def test_traceback_not_formatted_without_history(self, service):
+        """Test the traceback is only formatted when execution history is stored."""
+        service.history_enabled = False
+
+        @service.track_job_execution('test_job', 'Test Job')
+        def job():
+            raise RuntimeError('boom')
+
+        with patch(
+            'nasdaq_predictor.services.scheduler_job_tracking_service.traceback.format_exc'
+        ) as format_exc:
+            with pytest.raises(RuntimeError):
+                job()
+
+        format_exc.assert_not_called()
+
+    def test_all_job_statuses_use_bulk_queries(self, service):
+        """Test statuses for all jobs are built from three bulk queries."""
+        service.repository.get_all_job_metrics.return_value = []
+        service._update_metrics('job_a', 'Job A', 'SUCCESS', 1.0)
+        service._update_metrics('job_b', 'Job B', 'FAILURE', 1.0, error_message='boom')
+        service.repository.get_active_alerts_for_jobs.return_value = {'job_b': [Mock()]}
+        service.repository.get_execution_statistics_for_jobs.return_value = {
+            'job_a': {'total': 1},
+            'job_b': {'total': 1},
+        }
+
+        result = service.get_all_job_statuses()
+
+        assert result['total_jobs'] == 2
+        assert result['jobs']['job_a']['active_alerts'] == 0
+        assert result['jobs']['job_b']['active_alerts'] == 1
+        assert result['jobs']['job_b']['last_error_message'] == 'boom'
+        service.repository.get_active_alerts.assert_not_called()
+        service.repository.get_execution_statistics.assert_not_called()
+
+    def test_lock_stripes(self, service):
+        """Test a job always maps to the same lock stripe."""
+        assert service._lock_for('test_job') is service._lock_for('test_job')
+        stripes = {id(service._lock_for(f'job_{i}')) for i in range(64)}
+        assert len(stripes) > 1
+
+    def test_reload_config_applies_to_new_services(self):
+        """Test reload_config re-reads the tracking flags for new services."""
+        module = 'nasdaq_predictor.services.scheduler_job_tracking_service'
+        with patch(f'{module}.SchedulerConfig.TRACK_JOB_EXECUTION', False), \
+                patch(f'{module}.SchedulerJobExecutionRepository'):
+            reload_config()
+            service = SchedulerJobTrackingService()
+        reload_config()
+
+        assert service.tracking_enabled is False
+        with patch(f'{module}.SchedulerJobExecutionRepository'):
+            assert SchedulerJobTrackingService().tracking_enabled == bool(
+                SchedulerConfig.TRACK_JOB_EXECUTION
+            )
@@ -0,0 +1,244 @@
+"""
+Unit Tests for PredictionVerificationService
+
+Tests the 15-minute prediction verification pipeline including:
+- Bulk lookup of unverified predictions across tickers, capped per ticker
+- Skipping idle verification passes
+- Server-side verification status counts
+- Verification of already-fetched predictions
+- Concurrent market data lookups per verification window
+- Prediction evaluation against actual price movement (scalar and vectorized)
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, MagicMock
+
+from nasdaq_predictor.services.verification_service import PredictionVerificationService
+from nasdaq_predictor.database.models.prediction import Prediction
+
+
+def _prediction_row(prediction_id, ticker_id, prediction='BULLISH', baseline_price=100.0):
+    """Build a predictions table row as returned by Supabase."""
+    return {
+        'id': prediction_id,
+        'ticker_id': ticker_id,
+        'timestamp': '2025-01-02T14:00:00+00:00',
+        'prediction': prediction,
+        'confidence': 70.0,
+        'weighted_score': 0.7,
+        'bullish_count': 5,
+        'bearish_count': 2,
+        'total_signals': 7,
+        'metadata': {'baseline_price': baseline_price},
+    }
+
+
+class TestPredictionVerificationService:
+    """Test suite for PredictionVerificationService."""
+
+    @pytest.fixture
+    def prediction_repo(self):
+        """Create mock prediction repository with a chainable Supabase client."""
+        repo = Mock()
+        repo.predictions_table = 'predictions'
+        repo.client = MagicMock()
+        return repo
+
+    @pytest.fixture
+    def service(self, prediction_repo):
+        """Create PredictionVerificationService with mocked repositories."""
+        service = PredictionVerificationService(
+            ticker_repo=Mock(),
+            market_data_repo=Mock(),
+            prediction_repo=prediction_repo,
+            max_workers=4
+        )
+        yield service
+        service.executor.shutdown(wait=True)
+
+    def _query(self, prediction_repo):
+        """Return the mock at the end of the select(...) query chain."""
+        return prediction_repo.client.table.return_value.select.return_value
+
+    def test_unverified_predictions_fetched_in_one_query(self, service, prediction_repo):
+        """Test predictions for all tickers are fetched with a single IN query."""
+        query = self._query(prediction_repo)
+        query.in_.return_value.lt.return_value.is_.return_value.order.return_value \
+            .limit.return_value.execute.return_value.data = [
+                _prediction_row('p1', 't1'),
+                _prediction_row('p2', 't2'),
+                _prediction_row('p3', 't1'),
+            ]
+
+        result = service._get_unverified_predictions(['t1', 't2'], datetime(2025, 1, 2, 15, 0))
+
+        query.in_.assert_called_once_with('ticker_id', ['t1', 't2'])
+        assert [row['id'] for row in result['t1']] == ['p1', 'p3']
+        assert [row['id'] for row in result['t2']] == ['p2']
+
+    def test_ticker_backlog_does_not_starve_other_tickers(self, service, prediction_repo):
+        """Test a full response is followed by a query for the tickers it left out."""
+        query = self._query(prediction_repo)
+        limit = query.in_.return_value.lt.return_value.is_.return_value.order.return_value.limit
+        # t1's old backlog fills the whole first response
+        backlog = [_prediction_row(f'old{i}', 't1') for i in range(200)]
+        limit.return_value.execute.side_effect = [
+            Mock(data=backlog),
+            Mock(data=[_prediction_row('p2', 't2')]),
+        ]
+
+        result = service._get_unverified_predictions(['t1', 't2'], datetime(2025, 1, 2, 15, 0))
+
+        assert [call.args for call in query.in_.call_args_list] == [
+            ('ticker_id', ['t1', 't2']),
+            ('ticker_id', ['t2']),
+        ]
+        assert [call.args for call in limit.call_args_list] == [(200,), (100,)]
+        assert [row['id'] for row in result['t1']] == [f'old{i}' for i in range(100)]
+        assert [row['id'] for row in result['t2']] == ['p2']
+
+    def test_idle_pass_skips_until_recheck(self, service):
+        """Test an empty pass short-circuits the next calls."""
+        service.ticker_repo.get_enabled_tickers.return_value = [Mock(id='t1', symbol='NQ=F')]
+        service._get_unverified_predictions = Mock(return_value={})
+        service._verify_ticker_predictions = Mock()
+
+        assert service.verify_pending_predictions()['total_verified'] == 0
+        assert service.verify_pending_predictions()['total_verified'] == 0
+
+        service._get_unverified_predictions.assert_called_once()
+        service._verify_ticker_predictions.assert_not_called()
+
+    def test_only_tickers_with_pending_rows_are_verified(self, service):
+        """Test tickers absent from the pending query are skipped."""
+        service.ticker_repo.get_enabled_tickers.return_value = [
+            Mock(id='t1', symbol='NQ=F'),
+            Mock(id='t2', symbol='ES=F'),
+        ]
+        rows = [_prediction_row('p1', 't2')]
+        service._get_unverified_predictions = Mock(return_value={'t2': rows})
+        service._verify_ticker_predictions = Mock(return_value=1)
+
+        assert service.verify_pending_predictions()['total_verified'] == 1
+        service._verify_ticker_predictions.assert_called_once_with('t2', 'ES=F', rows)
+
+    def test_verification_status_counts_server_side(self, service, prediction_repo):
+        """Test verification status uses exact counts instead of downloading rows."""
+        query = prediction_repo.client.table.return_value.select.return_value.eq.return_value
+        query.limit.return_value.execute.return_value = Mock(count=10, data=[{'id': 'p1'}])
+        query.not_.is_.return_value.limit.return_value.execute.return_value = Mock(
+            count=4, data=[{'id': 'p1'}]
+        )
+
+        status = service.get_verification_status('t1')
+
+        assert status == {
+            'total_predictions': 10,
+            'verified': 4,
+            'pending': 6,
+            'verification_rate': 40.0
+        }
+        prediction_repo.client.table.return_value.select.assert_called_with('id', count='exact')
+
+    @pytest.mark.parametrize('prediction_type, pct, expected', [
+        ('BULLISH', 0.5, 'CORRECT'),
+        ('BULLISH', -0.5, 'WRONG'),
+        ('BEARISH', -0.5, 'CORRECT'),
+        ('NEUTRAL', 0.05, 'CORRECT'),
+        ('NEUTRAL', 0.5, 'WRONG'),
+        ('BULLISH', 0.05, 'NEUTRAL_RANGE'),
+    ])
+    def test_evaluate_prediction(self, service, prediction_type, pct, expected):
+        """Test prediction evaluation against the neutral threshold."""
+        assert service._evaluate_prediction(prediction_type, pct) == expected
+
+    def test_verify_single_prediction_uses_given_prediction(self, service, prediction_repo):
+        """Test verification does not refetch the prediction it was given."""
+        prediction = Prediction.from_dict(_prediction_row('p1', 't1'))
+        service.market_data_repo.get_historical_data.return_value = [
+            Mock(timestamp=datetime(2025, 1, 2, 14, 15, tzinfo=timezone.utc), close=101.0)
+        ]
+
+        assert service.verify_single_prediction(prediction, 't1', 'NQ=F') is True
+
+        prediction_repo.client.table.return_value.select.assert_not_called()
+        update = prediction_repo.client.table.return_value.update.call_args[0][0]
+        assert update['actual_result'] == 'CORRECT'
+
+    def test_ticker_verification_writes_one_bulk_upsert(self, service, prediction_repo):
+        """Test verification results for a ticker are written in a single upsert."""
+        predictions = [_prediction_row(f'p{i}', 't1') for i in range(3)]
+        service.market_data_repo.get_historical_data.return_value = [
+            Mock(timestamp=datetime(2025, 1, 2, 14, 15, tzinfo=timezone.utc), close=99.0)
+        ]
+
+        assert service._verify_ticker_predictions('t1', 'NQ=F', predictions) == 3
+
+        table = prediction_repo.client.table.return_value
+        table.upsert.assert_called_once()
+        rows = table.upsert.call_args[0][0]
+        assert [row['id'] for row in rows] == ['p0', 'p1', 'p2']
+        assert all(row['actual_result'] == 'WRONG' for row in rows)
+        assert all(
+            set(row) == {'id', 'actual_result', 'actual_price_change', 'verification_timestamp', 'metadata'}
+            for row in rows
+        )
+        table.update.assert_not_called()
+
+    def test_bulk_upsert_failure_falls_back_to_row_updates(self, service, prediction_repo):
+        """Test a failed bulk write is retried row by row."""
+        predictions = [_prediction_row(f'p{i}', 't1') for i in range(2)]
+        service.market_data_repo.get_historical_data.return_value = [
+            Mock(timestamp=datetime(2025, 1, 2, 14, 15, tzinfo=timezone.utc), close=101.0)
+        ]
+        table = prediction_repo.client.table.return_value
+        table.upsert.return_value.execute.side_effect = Exception('boom')
+
+        assert service._verify_ticker_predictions('t1', 'NQ=F', predictions) == 2
+        assert table.update.call_count == 2
+        assert set(table.update.call_args[0][0]) == {
+            'actual_result', 'actual_price_change', 'verification_timestamp', 'metadata'
+        }
+
+    @pytest.mark.parametrize('minute, expected', [(0, 0), (12, 0), (14, 1), (15, 1), (17, 2), (30, 2)])
+    def test_closest_data_point(self, minute, expected):
+        """Test the closest point is found on either side of the target."""
+        data = [
+            Mock(timestamp=datetime(2025, 1, 2, 14, m, tzinfo=timezone.utc))
+            for m in (10, 15, 18)
+        ]
+        target = datetime(2025, 1, 2, 14, 0, tzinfo=timezone.utc).replace(minute=minute)
+
+        assert PredictionVerificationService._closest_data_point(data, target) is data[expected]
+
+    def test_bulk_evaluation_matches_scalar(self, service):
+        """Test the vectorized evaluation agrees with _evaluate_prediction."""
+        types = ['BULLISH', 'BEARISH', 'NEUTRAL']
+        pcts = [-0.5, -0.1, -0.05, 0.0, 0.05, 0.1, 0.5]
+        pairs = [(t, p) for t in types for p in pcts]
+
+        results = service._evaluate_predictions_bulk(
+            np.array([t for t, _ in pairs]),
+            np.array([p for _, p in pairs])
+        )
+
+        assert results.tolist() == [service._evaluate_prediction(t, p) for t, p in pairs]
+
+    def test_market_data_lookups_run_concurrently(self, service, prediction_repo):
+        """Test verification windows are fetched in parallel, preserving row order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_historical_data(**kwargs):
+            barrier.wait()  # Only passes once three lookups are in flight together
+            return [Mock(timestamp=kwargs['start'] + timedelta(minutes=5), close=101.0)]
+
+        service.market_data_repo.get_historical_data.side_effect = get_historical_data
+        predictions = [_prediction_row(f'p{i}', 't1') for i in range(3)]
+
+        assert service._verify_ticker_predictions('t1', 'NQ=F', predictions) == 3
+        rows = prediction_repo.client.table.return_value.upsert.call_args[0][0]
+        assert [row['id'] for row in rows] == ['p0', 'p1', 'p2']
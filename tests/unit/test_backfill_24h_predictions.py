@@ -0,0 +1,53 @@
+"""
+Unit tests for the 24-hour backfill script's prediction schedule
+"""
+import os
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from backfill_24h_predictions import _prediction_schedule
+
+ET = ZoneInfo('America/New_York')
+
+
+def test_schedule_regular_day():
+    """Test each market hour is predicted at :59 of the previous hour"""
+    prediction_times, target_hours = _prediction_schedule(
+        datetime(2025, 11, 4, 0, 30, tzinfo=ET),
+        datetime(2025, 11, 4, 23, 0, tzinfo=ET)
+    )
+
+    assert target_hours == list(range(1, 17))
+    assert [(t.hour, t.minute) for t in prediction_times] == [(h - 1, 59) for h in range(1, 17)]
+    assert all(t.date() == datetime(2025, 11, 4).date() for t in prediction_times)
+
+
+def test_schedule_fall_back_day_uses_repeated_hour_once():
+    """Test the repeated 1 AM on a fall-back day is predicted once, before it starts"""
+    prediction_times, target_hours = _prediction_schedule(
+        datetime(2025, 11, 2, 0, 30, tzinfo=ET),
+        datetime(2025, 11, 2, 23, 0, tzinfo=ET)
+    )
+
+    assert target_hours == list(range(1, 17))
+    first = prediction_times[0]
+    assert (first.hour, first.minute) == (0, 59)
+    assert first.utcoffset() == datetime(2025, 11, 1, 12, tzinfo=ET).utcoffset()  # Still EDT
+    assert len(set(prediction_times)) == len(prediction_times)
+
+
+def test_schedule_spring_forward_day_skips_missing_hour():
+    """Test the 2 AM skipped on a spring-forward day gets no prediction"""
+    prediction_times, target_hours = _prediction_schedule(
+        datetime(2025, 3, 9, 0, 30, tzinfo=ET),
+        datetime(2025, 3, 9, 23, 0, tzinfo=ET)
+    )
+
+    assert target_hours == [1] + list(range(3, 17))
+    # The 3 AM prediction is made at 01:59 EST, one minute before 03:00 EDT
+    assert [(t.hour, t.minute) for t in prediction_times] == [(0, 59), (1, 59)] + [
+        (h - 1, 59) for h in range(4, 17)
+    ]
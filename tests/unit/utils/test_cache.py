@@ -0,0 +1,124 @@
+"""
+Unit tests for ThreadSafeCache.
+
+Tests the market data entry and the per-date/hour prediction store.
+"""
+
+import pytz
+from datetime import datetime, timedelta
+
+from nasdaq_predictor.utils.cache import ThreadSafeCache
+
+
+class TestMarketDataEntry:
+    """Test the cached market data entry."""
+
+    def test_empty_cache(self):
+        """Test a new cache has no data and is not valid."""
+        cache = ThreadSafeCache()
+        assert cache.get() == (None, None)
+        assert not cache.is_valid(60)
+
+    def test_set_and_get(self):
+        """Test data and timestamp are returned together."""
+        cache = ThreadSafeCache()
+        now = datetime.now(pytz.UTC)
+        cache.set({'price': 1.0}, now)
+
+        assert cache.get() == ({'price': 1.0}, now)
+        assert cache.is_valid(60)
+
+    def test_expired_naive_timestamp(self):
+        """Test naive timestamps are treated as UTC when checking expiry."""
+        cache = ThreadSafeCache()
+        cache.set({'price': 1.0}, datetime.utcnow() - timedelta(minutes=5))
+
+        assert not cache.is_valid(60)
+
+    def test_naive_timestamp_returned_unchanged(self):
+        """Test a fresh naive timestamp is valid and returned as given."""
+        cache = ThreadSafeCache()
+        now = datetime.utcnow()
+        cache.set({'price': 1.0}, now)
+
+        assert cache.get() == ({'price': 1.0}, now)
+        assert cache.is_valid(60)
+
+    def test_clear(self):
+        """Test clear resets the entry."""
+        cache = ThreadSafeCache()
+        cache.set({'price': 1.0}, datetime.now(pytz.UTC))
+        cache.clear()
+
+        assert cache.get() == (None, None)
+
+
+class TestPredictionStore:
+    """Test stored predictions."""
+
+    def test_store_and_get_prediction(self):
+        """Test a prediction is returned for its date and hour only."""
+        cache = ThreadSafeCache()
+        cache.store_prediction('2025-01-02', 9, {'prediction': 'BULLISH'})
+
+        assert cache.get_prediction('2025-01-02', 9) == {'prediction': 'BULLISH'}
+        assert cache.get_prediction('2025-01-02', 10) is None
+        assert cache.get_prediction('2025-01-03', 9) is None
+
+    def test_get_day_predictions_is_a_snapshot(self):
+        """Test the day's predictions are returned as a copy."""
+        cache = ThreadSafeCache()
+        cache.store_prediction('2025-01-02', 9, {'prediction': 'BULLISH'})
+
+        day = cache.get_day_predictions('2025-01-02')
+        cache.store_prediction('2025-01-02', 10, {'prediction': 'BEARISH'})
+
+        assert list(day) == [9]
+        assert set(cache.get_day_predictions('2025-01-02')) == {9, 10}
+        assert cache.get_day_predictions('2025-01-03') == {}
+
+    def test_clear_old_predictions(self):
+        """Test predictions older than the retention window are removed."""
+        cache = ThreadSafeCache()
+        today = datetime.now(pytz.UTC).date()
+        old = (today - timedelta(days=10)).isoformat()
+        recent = (today - timedelta(days=2)).isoformat()
+        cache.store_prediction(old, 9, {'prediction': 'BULLISH'})
+        cache.store_prediction(recent, 9, {'prediction': 'BEARISH'})
+
+        cache.clear_old_predictions(days_to_keep=7)
+
+        assert cache.get_prediction(old, 9) is None
+        assert cache.get_prediction(recent, 9) == {'prediction': 'BEARISH'}
+
+    def test_clear_old_predictions_removes_invalid_dates(self):
+        """Test predictions stored under an unparseable date are removed."""
+        cache = ThreadSafeCache()
+        cache.store_prediction('not-a-date', 9, {'prediction': 'BULLISH'})
+
+        cache.clear_old_predictions(days_to_keep=7)
+
+        assert cache.get_prediction('not-a-date', 9) is None
+
+    def test_store_is_bounded_by_date_count(self):
+        """Test the oldest date is evicted once the bound is exceeded."""
+        cache = ThreadSafeCache(max_prediction_dates=2)
+        cache.store_prediction('2025-01-01', 9, {'prediction': 'BULLISH'})
+        cache.store_prediction('2025-01-01', 10, {'prediction': 'BULLISH'})
+        cache.store_prediction('2025-01-02', 9, {'prediction': 'BEARISH'})
+        cache.store_prediction('2025-01-03', 9, {'prediction': 'NEUTRAL'})
+
+        assert cache.get_day_predictions('2025-01-01') == {}
+        assert cache.get_prediction('2025-01-02', 9) == {'prediction': 'BEARISH'}
+        assert cache.get_prediction('2025-01-03', 9) == {'prediction': 'NEUTRAL'}
+
+    def test_backfilled_date_does_not_evict_newer_dates(self):
+        """Test storing an older date evicts by calendar order, not insert order."""
+        cache = ThreadSafeCache(max_prediction_dates=2)
+        cache.store_prediction('2025-01-02', 9, {'prediction': 'BULLISH'})
+        cache.store_prediction('2025-01-03', 9, {'prediction': 'BEARISH'})
+        cache.store_prediction('2025-01-01', 9, {'prediction': 'NEUTRAL'})
+
+        assert cache.get_prediction('2025-01-01', 9) is None
+        assert cache.get_prediction('2025-01-02', 9) == {'prediction': 'BULLISH'}
+        assert cache.get_prediction('2025-01-03', 9) == {'prediction': 'BEARISH'}
@@ -0,0 +1,108 @@
+"""
+Unit tests for market status utilities.
+
+Tests open/closed status for futures, crypto and FTSE tickers, and the
+vectorized trading session filter.
+"""
+
+import dataclasses
+
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from nasdaq_predictor.utils import market_status
+from nasdaq_predictor.utils.market_status import (
+    get_market_status,
+    is_within_trading_session,
+    is_within_trading_session_batch,
+)
+
+
+class TestGetMarketStatus:
+    """Test get_market_status per ticker type."""
+
+    @pytest.mark.parametrize('current_time, status', [
+        (datetime(2025, 1, 15, 15, 0, tzinfo=timezone.utc), 'OPEN'),     # Wednesday
+        (datetime(2025, 1, 17, 21, 59, tzinfo=timezone.utc), 'OPEN'),    # Friday 4:59 PM ET
+        (datetime(2025, 1, 17, 22, 0, tzinfo=timezone.utc), 'CLOSED'),   # Friday 5:00 PM ET
+        (datetime(2025, 1, 18, 15, 0, tzinfo=timezone.utc), 'CLOSED'),   # Saturday
+        (datetime(2025, 1, 19, 22, 59, tzinfo=timezone.utc), 'CLOSED'),  # Sunday 5:59 PM ET
+        (datetime(2025, 1, 19, 23, 0, tzinfo=timezone.utc), 'OPEN'),     # Sunday 6:00 PM ET
+    ])
+    def test_futures(self, current_time, status):
+        """Test futures close from Friday 5 PM to Sunday 6 PM ET."""
+        result = get_market_status('NQ=F', current_time)
+
+        assert result.status == status
+        assert result.next_open == (None if status == 'OPEN' else 'Sunday 6:00 PM ET')
+
+    def test_crypto_always_open(self):
+        """Test crypto is open on weekends."""
+        result = get_market_status('BTC-USD', datetime(2025, 1, 18, 3, 0, tzinfo=timezone.utc))
+
+        assert result.status == 'OPEN (24/7)'
+
+    @pytest.mark.parametrize('current_time, status, next_open', [
+        (datetime(2025, 7, 15, 6, 59, tzinfo=timezone.utc), 'CLOSED', 'Today 8:00 AM GMT'),  # BST
+        (datetime(2025, 7, 15, 7, 0, tzinfo=timezone.utc), 'OPEN', None),
+        (datetime(2025, 1, 17, 16, 30, tzinfo=timezone.utc), 'CLOSED', 'Monday 8:00 AM GMT'),
+        (datetime(2025, 1, 16, 16, 30, tzinfo=timezone.utc), 'CLOSED', 'Tomorrow 8:00 AM GMT'),
+        (datetime(2025, 1, 18, 12, 0, tzinfo=timezone.utc), 'CLOSED', 'Monday 8:00 AM GMT'),
+    ])
+    def test_ftse(self, current_time, status, next_open):
+        """Test FTSE hours in London time."""
+        result = get_market_status('^FTSE', current_time)
+
+        assert (result.status, result.next_open) == (status, next_open)
+
+    @pytest.mark.parametrize('ticker, rule', [
+        ('NQ=F', market_status._futures_rule),
+        ('^FTSE', market_status._ftse_rule),
+    ])
+    def test_lookup_table_matches_rule(self, ticker, rule):
+        """Test every minute of a week agrees with the rule the table was built from."""
+        tz = ZoneInfo('Europe/London' if ticker == '^FTSE' else 'America/New_York')
+        start = datetime(2025, 1, 13, tzinfo=tz)  # Monday
+
+        for minute in range(7 * 24 * 60):
+            current = (start + timedelta(minutes=minute)).astimezone(timezone.utc)
+            local = current.astimezone(tz)
+            expected = rule(local.weekday(), local.hour * 60 + local.minute)
+            assert get_market_status(ticker, current) is expected
+
+    def test_shared_status_is_immutable(self):
+        """Test returned statuses cannot be mutated by callers."""
+        result = get_market_status('BTC-USD', datetime.now(timezone.utc))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.status = 'CLOSED'
+
+    def test_unknown_ticker(self):
+        """Test unknown tickers report UNKNOWN."""
+        assert get_market_status('AAPL', datetime.now(timezone.utc)).status == 'UNKNOWN'
+
+
+class TestTradingSessionBatch:
+    """Test the vectorized trading session filter against the scalar one."""
+
+    SESSIONS = {
+        'NQ=F': {'type': 'futures', 'main_session_start': 13.5, 'main_session_end': 20.0,
+                 'uses_main_only': False},
+        '^FTSE': {'type': 'index', 'main_session_start': 8.0, 'main_session_end': 16.5,
+                  'uses_main_only': True},
+        'BTC-USD': {'type': 'crypto', 'main_session_start': 0.0, 'main_session_end': 24.0,
+                    'uses_main_only': False},
+    }
+
+    @pytest.mark.parametrize('ticker', ['NQ=F', '^FTSE', 'BTC-USD', 'AAPL'])
+    @pytest.mark.parametrize('tz', [None, 'UTC', 'America/New_York'])
+    def test_batch_matches_scalar(self, ticker, tz):
+        """Test every 15 minutes of a week agrees with is_within_trading_session."""
+        index = pd.date_range('2025-01-13', periods=7 * 96, freq='15min', tz=tz)
+
+        expected = [is_within_trading_session(ts, ticker, self.SESSIONS) for ts in index]
+        result = is_within_trading_session_batch(index, ticker, self.SESSIONS)
+
+        assert result.tolist() == expected
@@ -0,0 +1,211 @@
+"""
+Unit tests for timezone utilities.
+
+Tests ET/London hour conversions on both sides of daylight saving time
+candle open time flooring, the vectorized period-start helpers and
+prediction window lookup.
+"""
+
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from nasdaq_predictor.utils.timezone import (
+    candle_open_batch,
+    get_candle_open_time,
+    get_current_prediction_window,
+    ensure_utc,
+    get_et_midnight,
+    get_month_start,
+    get_ny_hour_timestamp,
+    get_ticker_hour_timestamp,
+    get_ticker_hour_timestamps_batch,
+    get_ticker_time,
+    get_london_hour_timestamp,
+    get_week_start,
+    month_start_batch,
+    week_start_batch,
+)
+
+
+class TestEnsureUtc:
+    """Test UTC normalization."""
+
+    def test_utc_returned_as_is(self):
+        """Test an already-UTC timestamp is returned without conversion."""
+        ts = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        assert ensure_utc(ts) is ts
+
+    def test_naive_and_other_zones(self):
+        """Test naive timestamps are tagged UTC and other zones are converted."""
+        naive = datetime(2025, 1, 15, 12, 0)
+        london = get_london_hour_timestamp(naive, 12).astimezone(ZoneInfo('Europe/London'))
+
+        assert ensure_utc(naive) == naive.replace(tzinfo=timezone.utc)
+        assert ensure_utc(london).tzinfo is timezone.utc
+
+
+class TestTickerTime:
+    """Test conversion to the ticker's local zone."""
+
+    @pytest.mark.parametrize('ticker, expected_hour', [('NQ=F', 7), ('^FTSE', 12)])
+    def test_naive_is_treated_as_utc(self, ticker, expected_hour):
+        """Test naive input is read as UTC rather than system local time."""
+        assert get_ticker_time(datetime(2025, 1, 15, 12, 0), ticker).hour == expected_hour
+
+    def test_aware_non_utc_input(self):
+        """Test aware input in another zone converts directly."""
+        london = datetime(2025, 1, 15, 12, 0, tzinfo=ZoneInfo('Europe/London'))
+
+        assert get_ticker_time(london, 'NQ=F').hour == 7
+
+
+class TestHourTimestamps:
+    """Test local hour to UTC conversion."""
+
+    @pytest.mark.parametrize('date, expected_hour', [
+        (datetime(2025, 1, 15, 18, 0, tzinfo=timezone.utc), 12),  # EST, UTC-5
+        (datetime(2025, 7, 15, 18, 0, tzinfo=timezone.utc), 11),  # EDT, UTC-4
+    ])
+    def test_ny_hour(self, date, expected_hour):
+        """Test 7:00 NY maps to the right UTC hour in winter and summer."""
+        result = get_ny_hour_timestamp(date, 7)
+
+        assert result.tzinfo is not None
+        assert result.astimezone(timezone.utc).hour == expected_hour
+
+    @pytest.mark.parametrize('date, expected_hour', [
+        (datetime(2025, 1, 15, 12, 0), 8),   # GMT
+        (datetime(2025, 7, 15, 12, 0), 7),   # BST
+    ])
+    def test_london_hour_naive_date(self, date, expected_hour):
+        """Test naive dates are treated as London local time."""
+        result = get_london_hour_timestamp(date, 8)
+
+        assert result.astimezone(timezone.utc).hour == expected_hour
+
+
+class TestEtMidnight:
+    """Test ET midnight calculation."""
+
+    @pytest.mark.parametrize('now, expected', [
+        (datetime(2025, 1, 15, 18, 0, tzinfo=timezone.utc), datetime(2025, 1, 15, 5, 0)),
+        (datetime(2025, 7, 15, 18, 0, tzinfo=timezone.utc), datetime(2025, 7, 15, 4, 0)),
+    ])
+    def test_midnight_utc(self, now, expected):
+        """Test midnight ET is converted with the offset in effect that day."""
+        result = get_et_midnight(now)
+
+        assert result.astimezone(timezone.utc).replace(tzinfo=None) == expected
+
+
+class TestCandleOpenTime:
+    """Test candle open time flooring."""
+
+    @pytest.mark.parametrize('interval, expected', [
+        (3, datetime(2025, 1, 15, 14, 36, tzinfo=timezone.utc)),
+        (5, datetime(2025, 1, 15, 14, 35, tzinfo=timezone.utc)),
+        (30, datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc)),
+        (60, datetime(2025, 1, 15, 14, 0, tzinfo=timezone.utc)),
+        (240, datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)),
+    ])
+    def test_floors_to_interval(self, interval, expected):
+        """Test the candle containing 14:37:12.5 opens at the interval boundary."""
+        current = datetime(2025, 1, 15, 14, 37, 12, 500000, tzinfo=timezone.utc)
+
+        assert get_candle_open_time(current, interval) == expected
+
+    def test_exact_boundary_unchanged(self):
+        """Test a timestamp on a boundary is its own candle open."""
+        current = datetime(2025, 1, 15, 16, 0)
+
+        assert get_candle_open_time(current, 240) == current
+
+    def test_repeated_fall_back_hour_keeps_offset(self):
+        """Test a candle in the second 1 AM on the fall-back date opens in that same hour."""
+        current = datetime(2025, 11, 2, 1, 37, tzinfo=ZoneInfo('America/New_York'), fold=1)
+
+        result = get_candle_open_time(current, 30)
+
+        assert result.utcoffset() == timedelta(hours=-5)  # EST, not the earlier EDT 1 AM
+        assert result.astimezone(timezone.utc) == datetime(2025, 11, 2, 6, 30, tzinfo=timezone.utc)
+
+
+class TestBatchHelpers:
+    """Test vectorized helpers agree with the scalar ones."""
+
+    INDEX = pd.date_range('2025-01-27', '2025-02-04', freq='37min', tz='UTC')
+
+    @pytest.mark.parametrize('interval', [3, 5, 30, 60, 240])
+    def test_candle_open_batch(self, interval):
+        """Test candle_open_batch matches get_candle_open_time."""
+        expected = [get_candle_open_time(ts.to_pydatetime(), interval) for ts in self.INDEX]
+
+        assert list(candle_open_batch(self.INDEX, interval)) == expected
+
+    def test_week_start_batch(self):
+        """Test week_start_batch matches get_week_start."""
+        expected = [get_week_start(ts.to_pydatetime()) for ts in self.INDEX]
+
+        assert list(week_start_batch(self.INDEX)) == expected
+
+    def test_month_start_batch(self):
+        """Test month_start_batch matches get_month_start across a month boundary."""
+        expected = [get_month_start(ts.to_pydatetime()) for ts in self.INDEX]
+
+        assert list(month_start_batch(self.INDEX)) == expected
+
+
+class TestTickerHourTimestampsBatch:
+    """Test vectorized local hour to UTC conversion."""
+
+    DATES = pd.DatetimeIndex(['2025-01-15', '2025-03-09', '2025-03-30', '2025-07-15', '2025-11-02'])
+
+    @pytest.mark.parametrize('ticker', ['NQ=F', '^FTSE'])
+    @pytest.mark.parametrize('hour, minute', [(1, 30), (2, 30), (7, 0), (8, 30)])
+    def test_matches_scalar_across_dst(self, ticker, hour, minute):
+        """Test batch results match the scalar helper, including DST change days."""
+        expected = [
+            get_ticker_hour_timestamp(d.to_pydatetime(), hour, minute, ticker)
+            for d in self.DATES
+        ]
+
+        result = get_ticker_hour_timestamps_batch(self.DATES, hour, minute, ticker)
+
+        assert list(result) == expected
+
+    def test_aware_dates_use_local_calendar_day(self):
+        """Test aware dates are converted to the ticker's local date first."""
+        dates = pd.DatetimeIndex(['2025-01-15 03:00'], tz='UTC')  # Jan 14 in NY
+
+        result = get_ticker_hour_timestamps_batch(dates, 7, 0, 'NQ=F')
+
+        assert result[0] == pd.Timestamp('2025-01-14 12:00', tz='UTC')
+
+
+class TestPredictionWindow:
+    """Test local hour to prediction window mapping."""
+
+    @pytest.mark.parametrize('utc_hour, window', [
+        (13, 'pre_9am'),    # 8am EST
+        (14, '9am_hour'),
+        (15, '10am_hour'),
+        (16, 'post_10am'),
+        (23, 'post_10am'),  # 6pm EST
+        (0, 'evening'),     # 7pm EST
+        (4, 'evening'),     # 11pm EST
+        (5, 'pre_9am'),     # midnight EST
+    ])
+    def test_ny_windows(self, utc_hour, window):
+        """Test each window boundary in NY winter time."""
+        current = datetime(2025, 1, 15, utc_hour, 30, tzinfo=timezone.utc)
+
+        assert get_current_prediction_window(current, 'NQ=F') == window
+
+    def test_ftse_uses_london_time(self):
+        """Test FTSE windows follow London time."""
+        current = datetime(2025, 1, 15, 9, 30, tzinfo=timezone.utc)
+
+        assert get_current_prediction_window(current, '^FTSE') == '9am_hour'